@@ -0,0 +1,52 @@
+"""
+Measure the memory used to hold many sets of answers.
+
+Run with `python -m benchmarks.answers_memory [COUNT]`.
+"""
+
+import sys
+import tracemalloc
+from typing import Callable, List
+
+from columbo import BasicQuestion, Confirm, Interaction, MutableAnswers, answer_layout
+
+DEFAULT_COUNT = 100_000
+QUESTION_COUNT = 20
+
+NAMES = [f"question-{i}" for i in range(QUESTION_COUNT)]
+INTERACTIONS: List[Interaction] = [
+    BasicQuestion(name, "msg", "x") if i % 2 else Confirm(name, "msg")
+    for i, name in enumerate(NAMES)
+]
+
+
+def _bytes_per_answers(factory: Callable[[], MutableAnswers], count: int) -> float:
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    # keep a reference to every instance until the measurement is taken
+    instances = [factory() for _ in range(count)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del instances
+    return (after - before) / count
+
+
+def _fill(answers: MutableAnswers) -> MutableAnswers:
+    for i, name in enumerate(NAMES):
+        answers[name] = "x" if i % 2 else True
+    return answers
+
+
+def main(count: int) -> None:
+    layout = answer_layout(INTERACTIONS)
+    factories: dict[str, Callable[[], MutableAnswers]] = {
+        "dict": lambda: _fill({}),
+        "SlotAnswers": lambda: _fill(layout.new_answers()),
+    }
+    print(f"Memory per set of {QUESTION_COUNT} answers ({count:,} sets)")
+    for label, factory in factories.items():
+        print(f"{label:>12}: {_bytes_per_answers(factory, count):8.1f} bytes")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_COUNT)
@@ -0,0 +1,55 @@
+"""
+Measure the time taken by `parse_args()` to parse typical arguments, with & without the fast parser.
+
+Run with `python -m benchmarks.cli_parse [COUNT]`.
+"""
+
+import sys
+import time
+from typing import Callable, List
+
+from columbo import BasicQuestion, Choice, Confirm, Interaction, parse_args
+
+DEFAULT_COUNT = 2_000
+QUESTION_COUNT = 21
+OPTIONS = ["small", "medium", "large"]
+
+
+def _question(index: int) -> Interaction:
+    name = f"question-{index}"
+    if index % 3 == 0:
+        return Confirm(name, "msg")
+    if index % 3 == 1:
+        return Choice(name, "msg", OPTIONS, OPTIONS[0])
+    return BasicQuestion(name, "msg", "x")
+
+
+INTERACTIONS: List[Interaction] = [_question(i) for i in range(QUESTION_COUNT)]
+ARGS = [
+    "--question-0",
+    "--question-1",
+    "large",
+    "--question-2=value",
+    "--no-question-3",
+]
+
+
+def _microseconds_per_parse(parse: Callable[[], object], count: int) -> float:
+    start = time.perf_counter()
+    for _ in range(count):
+        parse()
+    return (time.perf_counter() - start) / count * 1_000_000
+
+
+def main(count: int) -> None:
+    runs = {
+        "argparse": lambda: parse_args(INTERACTIONS, ARGS),
+        "fast": lambda: parse_args(INTERACTIONS, ARGS, fast_parser=True),
+    }
+    print(f"Time per parse of {QUESTION_COUNT} questions ({count:,} parses)")
+    for label, run in runs.items():
+        print(f"{label:>8}: {_microseconds_per_parse(run, count):8.1f} us")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_COUNT)
@@ -0,0 +1,50 @@
+"""
+Measure the time taken to index completions and to find the completions for the text of a prompt.
+
+Run with `python -m benchmarks.completion_index [COUNT]`.
+"""
+
+import itertools
+import sys
+import time
+from typing import List
+
+from columbo._completer import CompletionIndex
+
+DEFAULT_COUNT = 100_000
+# Typed one character at a time, as a user would. Later texts only match as fuzzy matches.
+TEXTS = ["r", "re", "rel", "rele", "relea", "rlse", "zqxj"]
+ROUNDS = 20
+
+
+def _candidates(count: int) -> List[str]:
+    # similar to branch names: a prefix followed by words, which are spread using prime strides
+    words = ["".join(w) for w in itertools.product("abcdefghijkl", repeat=4)]
+    prefixes = ["feature", "fix", "release", "chore"]
+    return [
+        f"{prefixes[index % 4]}/{words[index * 7919 % len(words)]}-"
+        f"{words[index * 104729 % len(words)]}-{index}"
+        for index in range(count)
+    ]
+
+
+def main(count: int) -> None:
+    candidates = _candidates(count)
+
+    start = time.perf_counter()
+    index = CompletionIndex(candidates)
+    print(
+        f"Index {count:,} candidates: {(time.perf_counter() - start) * 1_000:7.2f} ms"
+    )
+
+    print(f"Time per lookup ({ROUNDS} lookups of each text)")
+    for text in TEXTS:
+        start = time.perf_counter()
+        for _ in range(ROUNDS):
+            matches = index.matches(text)
+        elapsed = (time.perf_counter() - start) / ROUNDS * 1_000
+        print(f"{text!r:>8}: {elapsed:7.2f} ms ({len(matches)} matches)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_COUNT)
@@ -0,0 +1,61 @@
+"""
+Measure the time taken to load interactions from a TOML definition, with & without storing the definition as JSON.
+
+Run with `python -m benchmarks.definition_load [COUNT]`.
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, List
+
+from columbo import load_interactions
+
+DEFAULT_COUNT = 100
+QUESTION_COUNT = 500
+
+
+def _definition() -> str:
+    tables: List[str] = []
+    for index in range(QUESTION_COUNT):
+        name = f"question-{index}"
+        if index % 3 == 0:
+            fields = 'type = "confirm"'
+        elif index % 3 == 1:
+            fields = 'type = "choice"\noptions = ["small", "medium", "large"]\ndefault = "small"'
+        else:
+            fields = 'type = "basic"\ndefault = "x"'
+        tables.append(
+            f'[[interactions]]\n{fields}\nname = "{name}"\nmessage = "Question {index}?"\n'
+            f'should_ask = {{ op = "answered", name = "question-0" }}\n'
+        )
+    return "\n".join(tables)
+
+
+def _milliseconds_per_load(load: Callable[[], object], count: int) -> float:
+    start = time.perf_counter()
+    for _ in range(count):
+        load()
+    return (time.perf_counter() - start) / count * 1_000
+
+
+def main(count: int) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "interactions.toml"
+        path.write_text(_definition())
+        cache_dir = Path(directory) / "cache"
+        # populate the cache, so that only loads of the stored definition are measured
+        load_interactions(path, cache_dir)
+
+        runs = {
+            "parsed": lambda: load_interactions(path),
+            "cached": lambda: load_interactions(path, cache_dir),
+        }
+        print(f"Time per load of {QUESTION_COUNT} interactions ({count:,} loads)")
+        for label, run in runs.items():
+            print(f"{label:>6}: {_milliseconds_per_load(run, count):7.2f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_COUNT)
@@ -0,0 +1,59 @@
+"""
+Measure the memory used by each interaction instance.
+
+Run with `python -m benchmarks.interaction_memory [COUNT]`.
+
+The result is compared against a class that stores the same attributes in a per-instance `__dict__`, which is how the
+interaction classes were laid out before they defined `__slots__`.
+"""
+
+import sys
+import tracemalloc
+from typing import Callable, Optional
+
+from columbo import BasicQuestion, Choice, Confirm, Echo
+
+DEFAULT_COUNT = 100_000
+
+
+class _DictBasicQuestion:
+    """Stand-in for `BasicQuestion` that keeps its attributes in `__dict__`."""
+
+    def __init__(self, name: str, message: str, default: str) -> None:
+        self._name = name
+        self._message = message
+        self._cli_help: Optional[str] = None
+        self._should_ask = None
+        self._value_if_not_asked: Optional[str] = None
+        self._default = default
+        self._validator = None
+
+
+def _bytes_per_instance(factory: Callable[[int], object], count: int) -> float:
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    # keep a reference to every instance until the measurement is taken
+    instances = [factory(i) for i in range(count)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del instances
+    return (after - before) / count
+
+
+def main(count: int) -> None:
+    names = [f"question-{i}" for i in range(count)]
+    options = ["x", "y"]
+    factories: dict[str, Callable[[int], object]] = {
+        "dict based question": lambda i: _DictBasicQuestion(names[i], "msg", "x"),
+        "BasicQuestion": lambda i: BasicQuestion(names[i], "msg", "x"),
+        "Choice": lambda i: Choice(names[i], "msg", options, "x"),
+        "Confirm": lambda i: Confirm(names[i], "msg"),
+        "Echo": lambda _: Echo("msg"),
+    }
+    print(f"Memory per instance ({count:,} instances)")
+    for label, factory in factories.items():
+        print(f"{label:>20}: {_bytes_per_instance(factory, count):8.1f} bytes")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_COUNT)
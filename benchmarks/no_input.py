@@ -0,0 +1,70 @@
+"""
+Measure the time taken to answer questions using their default values, when the user isn't asked.
+
+Run with `python -m benchmarks.no_input [COUNT]`.
+"""
+
+import sys
+import time
+from typing import Callable, Dict, List
+
+from columbo import Answer, BasicQuestion, Choice, Confirm, Interaction
+from columbo._interaction import answer_without_input, is_question
+
+DEFAULT_COUNT = 10_000
+QUESTION_COUNT = 21
+OPTIONS = ["small", "medium", "large"]
+
+
+def _question(index: int) -> Interaction:
+    name = f"question-{index}"
+    if index % 3 == 0:
+        return Confirm(name, "msg")
+    if index % 3 == 1:
+        return Choice(name, "msg", OPTIONS, OPTIONS[0])
+    return BasicQuestion(name, "msg", "x")
+
+
+INTERACTIONS: List[Interaction] = [_question(i) for i in range(QUESTION_COUNT)]
+
+
+def _ask_each() -> Dict[str, Answer]:
+    # the path used by get_answers() before it resolved defaults directly
+    answers: Dict[str, Answer] = {}
+    for interaction in INTERACTIONS:
+        if is_question(interaction):
+            answers[interaction.name] = interaction.ask(answers, no_user_input=True)
+    return answers
+
+
+def _answer_each() -> Dict[str, Answer]:
+    answers: Dict[str, Answer] = {}
+    for interaction in INTERACTIONS:
+        if is_question(interaction):
+            answers[interaction.name] = answer_without_input(interaction, answers)
+    return answers
+
+
+def _microseconds_per_run(run: Callable[[], Dict[str, Answer]], count: int) -> float:
+    start = time.perf_counter()
+    for _ in range(count):
+        run()
+    return (time.perf_counter() - start) / count * 1_000_000
+
+
+def main(count: int) -> None:
+    if _ask_each() != _answer_each():
+        raise RuntimeError("Both paths must produce the same answers")
+    runs: dict[str, Callable[[], Dict[str, Answer]]] = {
+        "prompt path": _ask_each,
+        "direct": _answer_each,
+    }
+    print(
+        f"Time per run of {QUESTION_COUNT} questions without user input ({count:,} runs)"
+    )
+    for label, run in runs.items():
+        print(f"{label:>11}: {_microseconds_per_run(run, count):8.1f} µs")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_COUNT)
@@ -0,0 +1,53 @@
+"""
+Measure the time taken by `parse_args()` when validators are slow, with & without a validation executor.
+
+Run with `python -m benchmarks.parallel_validation [COUNT]`.
+"""
+
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List
+
+from columbo import (
+    Answers,
+    BasicQuestion,
+    Interaction,
+    ValidationResponse,
+    ValidationSuccess,
+    parse_args,
+)
+
+DEFAULT_COUNT = 20
+# Similar to checking a path on a slow network filesystem
+VALIDATOR_SECONDS = 0.05
+
+
+def _slow_validator(value: str, answers: Answers) -> ValidationResponse:
+    time.sleep(VALIDATOR_SECONDS)
+    return ValidationSuccess()
+
+
+def _seconds(run: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    run()
+    return time.perf_counter() - start
+
+
+def main(count: int) -> None:
+    interactions: List[Interaction] = [
+        BasicQuestion(f"path-{i}", "Path?", f"/mnt/{i}", validator=_slow_validator)
+        for i in range(count)
+    ]
+
+    print(f"Time to parse {count} arguments ({VALIDATOR_SECONDS * 1_000:.0f} ms each)")
+    print(f"sequential: {_seconds(lambda: parse_args(interactions, [])):6.2f} s")
+    with ThreadPoolExecutor(max_workers=count) as executor:
+        elapsed = _seconds(
+            lambda: parse_args(interactions, [], validation_executor=executor)
+        )
+    print(f"concurrent: {elapsed:6.2f} s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_COUNT)
@@ -0,0 +1,66 @@
+"""
+Measure the memory used to hold the results of many runs of the same interactions.
+
+Run with `python -m benchmarks.table_memory [COUNT]`.
+"""
+
+import sys
+import tracemalloc
+from typing import Callable, Dict, List
+
+from columbo import Answer, AnswerTable, BasicQuestion, Choice, Confirm, Interaction
+
+DEFAULT_COUNT = 100_000
+QUESTION_COUNT = 21
+OPTIONS = ["small", "medium", "large"]
+
+NAMES = [f"question-{i}" for i in range(QUESTION_COUNT)]
+
+
+def _question(index: int, name: str) -> Interaction:
+    if index % 3 == 0:
+        return Confirm(name, "msg")
+    if index % 3 == 1:
+        return Choice(name, "msg", OPTIONS, OPTIONS[0])
+    return BasicQuestion(name, "msg", "x")
+
+
+def _answer(index: int, row: int) -> Answer:
+    # values are created for each row, like they would be when produced by get_answers()
+    if index % 3 == 0:
+        return row % 2 == 0
+    if index % 3 == 1:
+        return OPTIONS[row % 3]
+    return f"text {row}"
+
+
+INTERACTIONS: List[Interaction] = [_question(i, name) for i, name in enumerate(NAMES)]
+
+
+def _row(row: int) -> Dict[str, Answer]:
+    return {name: _answer(i, row) for i, name in enumerate(NAMES)}
+
+
+def _bytes_per_row(factory: Callable[[int], object], count: int) -> float:
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    # keep a reference to the result until the measurement is taken
+    result = factory(count)
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return (after - before) / count
+
+
+def main(count: int) -> None:
+    factories: dict[str, Callable[[int], object]] = {
+        "list of dict": lambda n: [_row(i) for i in range(n)],
+        "AnswerTable": lambda n: AnswerTable(INTERACTIONS, (_row(i) for i in range(n))),
+    }
+    print(f"Memory per run of {QUESTION_COUNT} questions ({count:,} runs)")
+    for label, factory in factories.items():
+        print(f"{label:>14}: {_bytes_per_row(factory, count):8.1f} bytes")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_COUNT)
@@ -0,0 +1,94 @@
+"""
+Measure how long it takes to serve many concurrent telnet clients from a single event loop.
+
+Run with `python -m benchmarks.telnet_load [COUNT]`.
+
+Each simulated client connects to a local server started by `serve_telnet()`, sends its answers & waits for the server
+to close the connection. prompt-toolkit only allows a few connections to wait to be accepted, so clients connect a few
+at a time (as clients that retry would), but all the connected clients are served at the same time.
+"""
+
+import asyncio
+import re
+import socket
+import sys
+import time
+from typing import Dict, List
+
+from columbo import (
+    Acknowledge,
+    Answer,
+    BasicQuestion,
+    Choice,
+    Confirm,
+    Echo,
+    Interaction,
+    serve_telnet,
+)
+
+DEFAULT_COUNT = 300
+OPTIONS = ["small", "medium", "large"]
+INTERACTIONS: List[Interaction] = [
+    Echo("Welcome"),
+    Confirm("confirm", "Continue?"),
+    Choice("choice", "Pick a size", OPTIONS, OPTIONS[0]),
+    BasicQuestion("basic", "What is your name?", "anonymous"),
+    Acknowledge("Done"),
+]
+# Telnet sub-negotiation reporting the terminal type, which the server waits for before prompting
+TTYPE_RESPONSE = b"\xff\xfa\x18\x00xterm\xff\xf0"
+CURSOR_POSITION_REQUEST = re.compile(rb"\x1b\[6n")
+# The most clients waiting for the server to accept their connection at once, the backlog used by prompt-toolkit
+PENDING_CONNECTIONS = 4
+
+
+async def _client(port: int, index: int, connecting: asyncio.Semaphore) -> None:
+    async with connecting:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        # the server starts negotiating once it accepts the connection
+        data = await reader.read(4096)
+    keys = f"{'yn'[index % 2]}{index % 3 + 1}\ruser-{index}\r\r"
+    writer.write(TTYPE_RESPONSE + keys.encode())
+    try:
+        while data:
+            # respond to each cursor position request like a terminal would
+            for _ in CURSOR_POSITION_REQUEST.findall(data):
+                writer.write(b"\x1b[1;1R")
+            data = await reader.read(4096)
+    except ConnectionResetError:
+        # the server closed the connection before reading the last response
+        pass
+    writer.close()
+
+
+async def _run(count: int) -> None:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = int(sock.getsockname()[1])
+
+    results: List[Dict[str, Answer]] = []
+    ready = asyncio.Event()
+    server = asyncio.create_task(
+        serve_telnet(
+            INTERACTIONS, port=port, on_answers=results.append, ready=ready.set
+        )
+    )
+    await ready.wait()
+
+    start = time.perf_counter()
+    connecting = asyncio.Semaphore(PENDING_CONNECTIONS)
+    await asyncio.gather(*(_client(port, i, connecting) for i in range(count)))
+    elapsed = time.perf_counter() - start
+    server.cancel()
+
+    print(f"Clients completed: {len(results):,} of {count:,}")
+    print(f"       Total time: {elapsed:8.2f} s")
+    print(f"       Per client: {elapsed / count * 1000:8.2f} ms")
+
+
+def main(count: int) -> None:
+    asyncio.run(_run(count))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_COUNT)
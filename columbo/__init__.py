@@ -1,12 +1,33 @@
 """columbo - Specify a dynamic set of questions to ask a user and get their answers."""
 
+from columbo._actions import BackgroundActions as BackgroundActions  # noqa: F401
+from columbo._answers import AnswerLayout as AnswerLayout  # noqa: F401
+from columbo._answers import FrozenAnswers as FrozenAnswers  # noqa: F401
+from columbo._answers import SlotAnswers as SlotAnswers  # noqa: F401
+from columbo._cli import add_arguments as add_arguments  # noqa: F401
 from columbo._cli import format_cli_help as format_cli_help  # noqa: F401
 from columbo._cli import parse_args as parse_args  # noqa: F401
+from columbo._cli import to_answers as to_answers  # noqa: F401
+from columbo._completion import (  # noqa: F401
+    format_completion_script as format_completion_script,
+)
+from columbo._condition import And as And  # noqa: F401
+from columbo._condition import Answered as Answered  # noqa: F401
+from columbo._condition import Condition as Condition  # noqa: F401
+from columbo._condition import Equals as Equals  # noqa: F401
+from columbo._condition import Not as Not  # noqa: F401
+from columbo._condition import OneOf as OneOf  # noqa: F401
+from columbo._condition import Or as Or  # noqa: F401
+from columbo._definition import (  # noqa: F401
+    interactions_from_dict as interactions_from_dict,
+)
+from columbo._definition import load_interactions as load_interactions  # noqa: F401
 from columbo._exception import CliException as CliException  # noqa: F401
 from columbo._exception import ColumboException as ColumboException  # noqa: F401
 from columbo._exception import (  # noqa: F401
     DuplicateQuestionNameException as DuplicateQuestionNameException,
 )
+from columbo._form import get_answers_form as get_answers_form  # noqa: F401
 from columbo._interaction import Acknowledge as Acknowledge  # noqa: F401
 from columbo._interaction import BasicQuestion as BasicQuestion  # noqa: F401
 from columbo._interaction import Choice as Choice  # noqa: F401
@@ -15,9 +36,19 @@ from columbo._interaction import Displayable as Displayable  # noqa: F401
 from columbo._interaction import Echo as Echo  # noqa: F401
 from columbo._interaction import Interaction as Interaction  # noqa: F401
 from columbo._interaction import Question as Question  # noqa: F401
+from columbo._interaction import answer_layout as answer_layout  # noqa: F401
 from columbo._interaction import get_answers as get_answers  # noqa: F401
+from columbo._interaction import iter_answers as iter_answers  # noqa: F401
+from columbo._server import get_answers_async as get_answers_async  # noqa: F401
+from columbo._server import serve_telnet as serve_telnet  # noqa: F401
+from columbo._session import Session as Session  # noqa: F401
+from columbo._table import AnswerRow as AnswerRow  # noqa: F401
+from columbo._table import AnswerTable as AnswerTable  # noqa: F401
 from columbo._types import Answer as Answer  # noqa: F401
+from columbo._types import AnswerAction as AnswerAction  # noqa: F401
 from columbo._types import Answers as Answers  # noqa: F401
+from columbo._types import Completions as Completions  # noqa: F401
+from columbo._types import ConditionData as ConditionData  # noqa: F401
 from columbo._types import MutableAnswers as MutableAnswers  # noqa: F401
 from columbo._types import OptionList as OptionList  # noqa: F401
 from columbo._types import Options as Options  # noqa: F401
@@ -27,6 +58,12 @@ from columbo._types import ValidationFailure as ValidationFailure  # noqa: F401
 from columbo._types import ValidationResponse as ValidationResponse  # noqa: F401
 from columbo._types import ValidationSuccess as ValidationSuccess  # noqa: F401
 from columbo._types import Validator as Validator  # noqa: F401
+from columbo._user_io import IOContext as IOContext  # noqa: F401
+from columbo._validation import AnswerError as AnswerError  # noqa: F401
+from columbo._validation import validate_answers as validate_answers  # noqa: F401
+from columbo._validation import (  # noqa: F401
+    validate_answers_jsonl as validate_answers_jsonl,
+)
 
 __version__ = "0.14.0"
 __author__ = "Patrick Lannigan <p.lannigan@gmail.com>"
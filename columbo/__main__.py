@@ -0,0 +1,3 @@
+from columbo._runner import main
+
+raise SystemExit(main())
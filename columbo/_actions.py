@@ -0,0 +1,110 @@
+"""
+Run slow work in the background as soon as the answer it depends on is known.
+"""
+
+from concurrent.futures import Executor, Future, ThreadPoolExecutor, wait
+from types import TracebackType
+from typing import List, Mapping, Optional, Type
+
+from columbo._answers import FrozenAnswers
+from columbo._types import AnswerAction, Answers
+
+
+class BackgroundActions:
+    """
+    Actions that are started on an executor as soon as the answer to a specific question is recorded.
+
+    Given to `get_answers()`, this allows slow work (such as downloading files) to overlap with the time the user spends
+    answering the remaining questions. Once the answers are collected, use `join()` to wait for the actions to finish or
+    `cancel()` to abandon the actions that have not started. When used as a context manager, the actions are joined on
+    exit, or cancelled if an exception was raised.
+    """
+
+    __slots__ = ("_actions", "_executor", "_owns_executor", "_futures")
+
+    def __init__(
+        self,
+        actions: Mapping[str, AnswerAction],
+        executor: Optional[Executor] = None,
+    ) -> None:
+        """
+        Initialize an instance.
+
+        :param actions: The action to start for each question, keyed by the name of the question. Each action is passed
+            the answer to the question and a copy of the answers that have been provided this far. The value returned by
+            an action is ignored.
+        :param executor: The executor that runs the actions. If `None`, a thread pool is created and shut down once
+            the actions are joined or cancelled. A given executor is not shut down.
+        """
+        self._actions = dict(actions)
+        self._owns_executor = executor is None
+        self._executor = (
+            ThreadPoolExecutor(thread_name_prefix="columbo-action")
+            if executor is None
+            else executor
+        )
+        self._futures: List[Future[object]] = []
+
+    def answer_recorded(self, name: str, answers: Answers) -> None:
+        """
+        Start the action for a question, if there is one.
+
+        :param name: The name of the question that was answered.
+        :param answers: The answers that have been provided this far, including the answer to the question.
+        :raises RuntimeError: The executor was shut down. This happens once the actions have been joined or cancelled
+            when no executor was given; a given executor continues to accept actions until it is shut down by its owner.
+        """
+        action = self._actions.get(name)
+        if action is None:
+            return
+        # the action runs while the answers continue to change, so it is given a copy
+        snapshot = answers if isinstance(answers, FrozenAnswers) else dict(answers)
+        self._futures.append(self._executor.submit(action, answers[name], snapshot))
+
+    @property
+    def pending(self) -> int:
+        """The number of started actions that have not finished."""
+        return sum(1 for future in self._futures if not future.done())
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        """
+        Wait for all the started actions to finish.
+
+        :param timeout: The maximum number of seconds to wait. If `None`, there is no limit.
+        :raises TimeoutError: Some of the actions did not finish within the timeout.
+        :raises Exception: The first exception raised by one of the actions, in the order the actions were started.
+        """
+        _, not_done = wait(self._futures, timeout)
+        if not_done:
+            raise TimeoutError(f"{len(not_done)} actions did not finish in time")
+        self._shutdown()
+        for future in self._futures:
+            future.result()
+
+    def cancel(self) -> int:
+        """
+        Abandon the actions that have not started running. Actions that are already running are allowed to finish.
+
+        :return: The number of actions that were cancelled.
+        """
+        cancelled = sum(1 for future in self._futures if future.cancel())
+        self._shutdown()
+        return cancelled
+
+    def _shutdown(self) -> None:
+        if self._owns_executor:
+            self._executor.shutdown(wait=False)
+
+    def __enter__(self) -> "BackgroundActions":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        if exc_type is None:
+            self.join()
+        else:
+            self.cancel()
@@ -0,0 +1,426 @@
+"""
+Alternate containers for storing answers.
+"""
+
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
+
+from columbo._types import Answer, Answers, MutableAnswers
+
+
+class AnswerLayout:
+    """
+    A fixed assignment of answer names to slots.
+
+    A layout is meant to be computed once for a collection of interactions and then shared by every `SlotAnswers`
+    instance that stores answers for those interactions.
+    """
+
+    __slots__ = ("_names", "_slots")
+
+    def __init__(self, names: Iterable[str]) -> None:
+        """
+        Initialize an instance.
+
+        :param names: The names that can be stored. Each name is assigned the next available slot.
+        :raises ValueError: The same name was given multiple times.
+        """
+        self._names: Tuple[str, ...] = tuple(names)
+        self._slots: Dict[str, int] = {name: i for i, name in enumerate(self._names)}
+        if len(self._slots) != len(self._names):
+            raise ValueError("Each name in a layout must be unique")
+
+    @property
+    def names(self) -> Tuple[str, ...]:
+        return self._names
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._slots
+
+    def slot(self, name: str) -> int:
+        """
+        Get the slot assigned to a name.
+
+        :param name: The name to look up.
+        :return: Index of the slot used to store the answer for the name.
+        :raises KeyError: The name is not part of the layout.
+        """
+        return self._slots[name]
+
+    def new_answers(
+        self, answers: Optional[Mapping[str, Answer]] = None
+    ) -> "SlotAnswers":
+        """
+        Create an empty container that uses this layout.
+
+        :param answers: Optional initial answers to store in the container.
+        :return: A new container.
+        :raises KeyError: One of the initial answers is not part of the layout.
+        """
+        result = SlotAnswers(self)
+        if answers is not None:
+            result.update(answers)
+        return result
+
+
+class SlotAnswers(MutableAnswers):
+    """
+    Answers stored in a compact array, using the slots assigned by an `AnswerLayout`.
+
+    Only names that are part of the layout can be stored.
+    """
+
+    __slots__ = ("_layout", "_values", "_count")
+
+    def __init__(self, layout: AnswerLayout) -> None:
+        """
+        Initialize an empty instance.
+
+        :param layout: Determines the slot used to store the answer for each name.
+        """
+        self._layout = layout
+        # None is never a valid answer, so it is used to mark empty slots
+        self._values: List[Optional[Answer]] = [None] * len(layout)
+        self._count = 0
+
+    @property
+    def layout(self) -> AnswerLayout:
+        return self._layout
+
+    def __getitem__(self, key: str) -> Answer:
+        value = self._values[self._slot(key)]
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: str, value: Answer) -> None:
+        slot = self._slot(key)
+        if self._values[slot] is None:
+            self._count += 1
+        self._values[slot] = value
+
+    def __delitem__(self, key: str) -> None:
+        slot = self._slot(key)
+        if self._values[slot] is None:
+            raise KeyError(key)
+        self._values[slot] = None
+        self._count -= 1
+
+    def __iter__(self) -> Iterator[str]:
+        return (
+            name
+            for name, value in zip(self._layout.names, self._values)
+            if value is not None
+        )
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, key: object) -> bool:
+        return (
+            isinstance(key, str)
+            and key in self._layout
+            and self._values[self._layout.slot(key)] is not None
+        )
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+    def copy(self) -> "SlotAnswers":
+        """
+        Create a new instance with the same layout and answers.
+
+        :return: A newly constructed instance.
+        """
+        result = SlotAnswers(self._layout)
+        result._values = self._values.copy()
+        result._count = self._count
+        return result
+
+    def to_dict(self) -> Dict[str, Answer]:
+        """
+        Convert the answers to a dictionary.
+
+        :return: A dictionary that contains each answer that has been stored.
+        """
+        return {
+            name: value
+            for name, value in zip(self._layout.names, self._values)
+            if value is not None
+        }
+
+    def _slot(self, key: str) -> int:
+        try:
+            return self._layout.slot(key)
+        except KeyError:
+            raise KeyError(f"{key} is not part of the answer layout") from None
+
+
+# The persistent mapping used by FrozenAnswers is a hash array mapped trie. Each level of the trie consumes _BITS bits
+# of the hash of a key. Nodes that are not modified by an update are shared between the old and new versions.
+_BITS = 5
+_MASK = (1 << _BITS) - 1
+_HASH_MASK = (1 << 64) - 1
+
+
+class _Leaf:
+    __slots__ = ("key", "value", "key_hash", "order")
+
+    def __init__(self, key: str, value: Answer, key_hash: int, order: int) -> None:
+        self.key = key
+        self.value = value
+        self.key_hash = key_hash
+        # Used to iterate over the keys in the order they were first added
+        self.order = order
+
+
+class _Collision:
+    """Leaves for different keys that have the same hash."""
+
+    __slots__ = ("key_hash", "leaves")
+
+    def __init__(self, key_hash: int, leaves: Tuple[_Leaf, ...]) -> None:
+        self.key_hash = key_hash
+        self.leaves = leaves
+
+
+class _Node:
+    __slots__ = ("bitmap", "children")
+
+    def __init__(
+        self, bitmap: int, children: Tuple[Union[_Leaf, _Collision, "_Node"], ...]
+    ) -> None:
+        self.bitmap = bitmap
+        self.children = children
+
+
+_Child = Union[_Leaf, _Collision, _Node]
+_EMPTY_NODE = _Node(0, ())
+
+
+def _position(bitmap: int, key_hash: int, shift: int) -> Tuple[int, int]:
+    bit = 1 << ((key_hash >> shift) & _MASK)
+    return bit, (bitmap & (bit - 1)).bit_count()
+
+
+def _find(node: _Node, key: str, key_hash: int) -> Optional[_Leaf]:
+    shift = 0
+    while True:
+        bit, index = _position(node.bitmap, key_hash, shift)
+        if not node.bitmap & bit:
+            return None
+        child = node.children[index]
+        if isinstance(child, _Node):
+            node = child
+            shift += _BITS
+        elif isinstance(child, _Leaf):
+            return child if child.key == key else None
+        else:
+            return next((leaf for leaf in child.leaves if leaf.key == key), None)
+
+
+def _merge(existing: Union[_Leaf, _Collision], leaf: _Leaf, shift: int) -> _Child:
+    if existing.key_hash == leaf.key_hash:
+        leaves = existing.leaves if isinstance(existing, _Collision) else (existing,)
+        return _Collision(leaf.key_hash, (*leaves, leaf))
+    existing_index = (existing.key_hash >> shift) & _MASK
+    leaf_index = (leaf.key_hash >> shift) & _MASK
+    if existing_index == leaf_index:
+        return _Node(1 << leaf_index, (_merge(existing, leaf, shift + _BITS),))
+    children: Tuple[_Child, ...] = (
+        (existing, leaf) if existing_index < leaf_index else (leaf, existing)
+    )
+    return _Node((1 << existing_index) | (1 << leaf_index), children)
+
+
+def _replace_child(node: _Node, index: int, child: _Child) -> _Node:
+    children = list(node.children)
+    children[index] = child
+    return _Node(node.bitmap, tuple(children))
+
+
+def _assoc(node: _Node, leaf: _Leaf, shift: int) -> _Node:
+    bit, index = _position(node.bitmap, leaf.key_hash, shift)
+    if not node.bitmap & bit:
+        children = (*node.children[:index], leaf, *node.children[index:])
+        return _Node(node.bitmap | bit, children)
+    child = node.children[index]
+    if isinstance(child, _Node):
+        return _replace_child(node, index, _assoc(child, leaf, shift + _BITS))
+    if isinstance(child, _Leaf) and child.key == leaf.key:
+        return _replace_child(node, index, leaf)
+    if isinstance(child, _Collision) and child.key_hash == leaf.key_hash:
+        leaves = tuple(
+            existing for existing in child.leaves if existing.key != leaf.key
+        )
+        return _replace_child(node, index, _Collision(leaf.key_hash, (*leaves, leaf)))
+    return _replace_child(node, index, _merge(child, leaf, shift + _BITS))
+
+
+def _dissoc(node: _Node, leaf: _Leaf, shift: int) -> Optional[_Child]:
+    """Remove a leaf that is known to be in the trie. None is returned if the node is now empty."""
+    bit, index = _position(node.bitmap, leaf.key_hash, shift)
+    child = node.children[index]
+    replacement: Optional[_Child] = None
+    if isinstance(child, _Node):
+        replacement = _dissoc(child, leaf, shift + _BITS)
+    elif isinstance(child, _Collision):
+        leaves = tuple(existing for existing in child.leaves if existing is not leaf)
+        replacement = (
+            leaves[0] if len(leaves) == 1 else _Collision(child.key_hash, leaves)
+        )
+
+    if replacement is not None:
+        return _replace_child(node, index, replacement)
+    children = tuple(existing for existing in node.children if existing is not child)
+    if not children:
+        return None
+    if shift and len(children) == 1 and not isinstance(children[0], _Node):
+        # Collapse the path so the remaining entry can be found higher in the trie
+        return children[0]
+    return _Node(node.bitmap & ~bit, children)
+
+
+def _leaves(node: _Node) -> Iterator[_Leaf]:
+    for child in node.children:
+        if isinstance(child, _Node):
+            yield from _leaves(child)
+        elif isinstance(child, _Leaf):
+            yield child
+        else:
+            yield from child.leaves
+
+
+def _entry_hash(key: str, value: Answer) -> int:
+    return hash((key, value))
+
+
+class FrozenAnswers(Answers):
+    """
+    Immutable answers that share structure with the instances they were derived from.
+
+    Adding or removing an answer creates a new instance without copying all the answers. Each instance is hashable, so
+    it can be used as a key for caching values derived from the answers. Holding on to previous instances allows going
+    back to an earlier set of answers.
+    """
+
+    __slots__ = ("_root", "_count", "_hash", "_next_order")
+
+    def __init__(self, answers: Optional[Answers] = None) -> None:
+        """
+        Initialize an instance.
+
+        :param answers: Optional initial answers to store in the instance.
+        """
+        self._root = _EMPTY_NODE
+        self._count = 0
+        self._hash = 0
+        self._next_order = 0
+        if answers is not None:
+            for key, value in answers.items():
+                self._add(key, value)
+
+    def set(self, key: str, value: Answer) -> "FrozenAnswers":
+        """
+        Create a new instance that has the given answer.
+
+        :param key: Name of the answer.
+        :param value: The answer to store.
+        :return: A new instance that includes the answer. If the answer was already present, this instance is returned.
+        """
+        existing = _find(self._root, key, hash(key) & _HASH_MASK)
+        if (
+            existing is not None
+            and type(existing.value) is type(value)
+            and existing.value == value
+        ):
+            return self
+        result = self._derive()
+        result._add(key, value, existing)
+        return result
+
+    def delete(self, key: str) -> "FrozenAnswers":
+        """
+        Create a new instance that does not have the given answer.
+
+        :param key: Name of the answer.
+        :return: A new instance that excludes the answer.
+        :raises KeyError: There is no answer for the key.
+        """
+        existing = _find(self._root, key, hash(key) & _HASH_MASK)
+        if existing is None:
+            raise KeyError(key)
+        result = self._derive()
+        root = _dissoc(self._root, existing, 0)
+        result._root = root if isinstance(root, _Node) else _EMPTY_NODE
+        result._count -= 1
+        result._hash ^= _entry_hash(existing.key, existing.value)
+        return result
+
+    def __getitem__(self, key: str) -> Answer:
+        leaf = _find(self._root, key, hash(key) & _HASH_MASK)
+        if leaf is None:
+            raise KeyError(key)
+        return leaf.value
+
+    def __iter__(self) -> Iterator[str]:
+        return (leaf.key for leaf in sorted(_leaves(self._root), key=_leaf_order))
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, key: object) -> bool:
+        return (
+            isinstance(key, str)
+            and _find(self._root, key, hash(key) & _HASH_MASK) is not None
+        )
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, FrozenAnswers) and (
+            self._count != other._count or self._hash != other._hash
+        ):
+            return False
+        return super().__eq__(other)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+    def to_dict(self) -> Dict[str, Answer]:
+        """
+        Convert the answers to a dictionary.
+
+        :return: A dictionary that contains each answer.
+        """
+        return {key: self[key] for key in self}
+
+    def _derive(self) -> "FrozenAnswers":
+        result = FrozenAnswers()
+        result._root = self._root
+        result._count = self._count
+        result._hash = self._hash
+        result._next_order = self._next_order
+        return result
+
+    def _add(self, key: str, value: Answer, existing: Optional[_Leaf] = None) -> None:
+        # Only used while constructing a new instance
+        key_hash = hash(key) & _HASH_MASK
+        if existing is None:
+            existing = _find(self._root, key, key_hash)
+        if existing is None:
+            order = self._next_order
+            self._next_order += 1
+            self._count += 1
+        else:
+            order = existing.order
+            self._hash ^= _entry_hash(existing.key, existing.value)
+        self._root = _assoc(self._root, _Leaf(key, value, key_hash, order), 0)
+        self._hash ^= _entry_hash(key, value)
+
+
+def _leaf_order(leaf: _Leaf) -> int:
+    return leaf.order
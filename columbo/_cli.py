@@ -2,14 +2,22 @@
 Produce a CLI based on a sequence of interactions.
 """
 
-from argparse import ArgumentParser, Namespace
+import sys
+from argparse import Action, ArgumentParser, Namespace
+from concurrent.futures import Executor, Future
 from functools import singledispatch
 from typing import (
+    Callable,
     Collection,
     Dict,
     Iterable,
+    Iterator,
+    List,
+    Mapping,
+    MutableMapping,
     NoReturn,
     Optional,
+    Protocol,
     Sequence,
     TypedDict,
     Union,
@@ -17,6 +25,7 @@ from typing import (
 )
 
 from columbo._exception import CliException
+from columbo._fast_parser import FastParser
 from columbo._interaction import (
     Acknowledge,
     BasicQuestion,
@@ -25,13 +34,35 @@ from columbo._interaction import (
     Echo,
     Interaction,
     canonical_arg_name,
+    copy_answers,
     to_value,
     validate_duplicate_question_names,
 )
-from columbo._types import Answers, MutableAnswers
+from columbo._sources import AnswerFile, resolve_values
+from columbo._types import Answer, Answers, MutableAnswers
 
 CliResult = Union[str, bool]
 CliResults = Dict[str, CliResult]
+# Checks the value for a question using the answers given before it, raising a CliException if it isn't valid
+_Check = Callable[[Union[BasicQuestion, Choice], str, Answers], None]
+# Prefix of the names that add_arguments() stores values using, so that they don't conflict with the other arguments of
+# the parser. The name argparse produces from an option string only uses the prefix when the option starts with it.
+_ADDED_DEST_PREFIX = "columbo:"
+
+
+class ArgumentContainer(Protocol):
+    """Where arguments are added, such as an `ArgumentParser` or one of its argument groups."""
+
+    def add_argument(
+        self,
+        *name_or_flags: str,
+        action: str = ...,
+        const: Optional[bool] = ...,
+        choices: Optional[Iterable[str]] = ...,
+        help: Optional[str] = ...,
+        dest: Optional[str] = ...,
+    ) -> Action:  # pragma: no cover
+        pass
 
 
 def parse_args(
@@ -40,39 +71,93 @@ def parse_args(
     exit_on_error: bool = True,
     answers: Optional[Answers] = None,
     parser_name: Optional[str] = None,
+    env_prefix: Optional[str] = None,
+    answer_file: Optional[AnswerFile] = None,
+    validation_executor: Optional[Executor] = None,
+    fast_parser: bool = False,
 ) -> MutableAnswers:
     """
     Parse command line argument for the given interactions.
 
+    Questions that are not given a value using a command line argument can also be answered using environment
+    variables & an answer file. When a question is given a value by more than one source, the value from the first of
+    the following is used: command line arguments, environment variables, the answer file, the default value.
+
     :param interactions: Interactions that should be turned into CLI arguments.
     :param args: Arguments to parse. If `None`, `sys.argv` will be used.
     :param exit_on_error: If `True`, print the CLI usage and exit the application. Otherwise, raise an exception with
         the error information.
-    :param answers: An initial dictionary of answers to start from.
+    :param answers: An initial dictionary of answers to start from. If the value is a `SlotAnswers`, the result will
+        be a `SlotAnswers` that uses the same layout.
     :param parser_name: Optional name to be used in error text. If omitted, the name of the process will be used.
+    :param env_prefix: If not `None`, questions are also answered using environment variables. The name of each
+        variable is the prefix followed by the canonical argument name of the question in upper case with
+        underscores (for example, `MY_APP_` & `--my-name` uses `MY_APP_MY_NAME`). A `Confirm` accepts values such as
+        `true`, `false`, `yes`, `no`, `1` & `0`.
+    :param answer_file: If not `None`, the path to a JSON or TOML (`.toml`) file that contains a single object, which is
+        used to answer questions. Each key is matched to a question using the canonical argument name (for example,
+        `my_name`, `my-name` & `my name` all answer `--my-name`).
+    :param validation_executor: If not `None`, the validators of the questions run concurrently on this executor,
+        instead of one at a time. The executor must start tasks in the order they are submitted, as
+        `ThreadPoolExecutor` does, and is not shut down. Each validator is given the answers that were given before its
+        question. Reading one of those answers (in a validator, `should_ask` or a dynamic value) waits for the value of
+        that answer to be checked. Every value that is not valid is reported, instead of only the first one. A question
+        that reads the answer to a value that was not valid is skipped, since its answer isn't known.
+    :param fast_parser: If `True`, the arguments are parsed without building an `ArgumentParser` when every argument
+        is given exactly as shown in the CLI help (as `--name value`, `--name=value` or `--flag`). This reduces the
+        time taken by programs that run many times, such as in scripts. Other arguments, including abbreviated and
+        invalid arguments, are still parsed by `ArgumentParser`, so the answers & errors are the same either way.
     :return: Answers based on the given arguments.
     :raises SystemExit: A value passed to CLI argument was not valid and `exit_on_error` was `True`.
-    :raises CliException: A value passed to CLI argument was not valid and `exit_on_error` was `False`.
+    :raises CliException: A value passed to CLI argument was not valid and `exit_on_error` was `False`. The same
+        applies when a value from an environment variable or the answer file was not valid, or the answer file could not
+        be read. With `validation_executor`, the exception describes every value that was not valid.
     :raises DuplicateQuestionNameException: One of the given questions attempted to reuse a name. When a value is
         provided for `answers`, those are considered as well.
-    :raises ValueError: One of the given `Interaction`s was not a valid type or was misconfigured in some way.
+    :raises ValueError: One of the given `Interaction`s was not a valid type or was misconfigured in some way. Or the
+        layout used by `answers` does not have a slot for one of the questions.
     """
     validate_duplicate_question_names(interactions, answers)
-    parser = create_parser(interactions, parser_name)
-
-    if not exit_on_error:
-        _patch_parser_error(parser)
-
-    result = parser.parse_args(args)
+    result = _fast_parse(interactions, args) if fast_parser else None
+    parser: Optional[ArgumentParser] = None
+    if result is None:
+        parser = _create_error_parser(interactions, parser_name, exit_on_error)
+        result = parser.parse_args(args)
     try:
-        return to_answers(interactions, result, answers)
+        return _to_answers(
+            interactions,
+            result,
+            answers,
+            env_prefix,
+            answer_file,
+            validation_executor,
+        )
     except CliException as ex:
         if exit_on_error:
+            # the parser is only created when needed to report the error
+            parser = parser or create_parser(interactions, parser_name)
             parser.error(str(ex))
         else:
             raise
 
 
+def _fast_parse(
+    interactions: Collection[Interaction], args: Optional[Sequence[str]]
+) -> Optional[Namespace]:
+    return FastParser(interactions).parse_args(sys.argv[1:] if args is None else args)
+
+
+def _create_error_parser(
+    interactions: Collection[Interaction],
+    parser_name: Optional[str],
+    exit_on_error: bool,
+) -> ArgumentParser:
+    parser = create_parser(interactions, parser_name)
+    if not exit_on_error:
+        _patch_parser_error(parser)
+    return parser
+
+
 def format_cli_help(
     interactions: Collection[Interaction], parser_name: Optional[str] = None
 ) -> str:
@@ -88,16 +173,45 @@ def format_cli_help(
     return create_parser(interactions, parser_name).format_help()
 
 
+def add_arguments(
+    interactions: Collection[Interaction], parser: ArgumentContainer
+) -> None:
+    """
+    Add the command line arguments for the given interactions to an existing parser.
+
+    This allows the arguments of a program & the arguments for the interactions to be parsed at the same time. Give the
+    result of parsing to `to_answers()` to produce the answers. The arguments are the same as those used by
+    `parse_args()`. The value of each argument is stored using a name reserved for columbo, so the other arguments of
+    the parser can use any destination, including the name of a question.
+
+    :param interactions: Interactions that should be turned into CLI arguments.
+    :param parser: The parser to add the arguments to. An argument group (from `add_argument_group()`) can be given to
+        show the arguments separately in the help of the parser.
+    :raises DuplicateQuestionNameException: One of the given questions attempted to reuse a name.
+    :raises ValueError: One of the given `Interaction`s was not a valid type.
+    :raises argparse.ArgumentError: One of the arguments conflicts with an argument of the parser.
+    """
+    validate_duplicate_question_names(interactions)
+    _add_arguments(interactions, parser, _ADDED_DEST_PREFIX)
+
+
 def create_parser(
     interactions: Collection[Interaction], parser_name: Optional[str] = None
 ) -> ArgumentParser:
     parser = ArgumentParser(prog=parser_name, add_help=False)
-    for interaction in interactions:
-        _add_argument_for(interaction, parser)
-
+    _add_arguments(interactions, parser)
     return parser
 
 
+def _add_arguments(
+    interactions: Collection[Interaction],
+    parser: ArgumentContainer,
+    dest_prefix: str = "",
+) -> None:
+    for interaction in interactions:
+        _add_argument_for(interaction, parser, dest_prefix)
+
+
 def _patch_parser_error(parser: ArgumentParser) -> None:
     """
     Patch the error method to raise a CliException instead of printing the usage & exiting the application.
@@ -115,7 +229,7 @@ def _patch_parser_error(parser: ArgumentParser) -> None:
 
 
 @singledispatch
-def _add_argument_for(question: object, _: ArgumentParser) -> None:
+def _add_argument_for(question: object, _: ArgumentContainer, __: str) -> None:
     raise ValueError(f"Unsupported interaction type {type(question)}")
 
 
@@ -123,29 +237,37 @@ def _add_argument_for(question: object, _: ArgumentParser) -> None:
 @_add_argument_for.register(Acknowledge)
 @_add_argument_for.register(Echo)
 def _add_argument_for_noop(
-    question: Union[Acknowledge, Echo], parser: ArgumentParser
+    question: Union[Acknowledge, Echo], parser: ArgumentContainer, dest_prefix: str
 ) -> None:
     pass
 
 
 @_add_argument_for.register
-def _add_argument_for_basic(question: BasicQuestion, parser: ArgumentParser) -> None:
-    _add_argument(parser, question.name, question.cli_help)
+def _add_argument_for_basic(
+    question: BasicQuestion, parser: ArgumentContainer, dest_prefix: str
+) -> None:
+    _add_argument(parser, question.name, question.cli_help, dest_prefix + question.name)
 
 
 @_add_argument_for.register
-def _add_argument_for_confirm(question: Confirm, parser: ArgumentParser) -> None:
-    _add_flag(parser, question.name, question.cli_help, active=True)
-    _add_flag(parser, question.name, question.cli_help, active=False)
+def _add_argument_for_confirm(
+    question: Confirm, parser: ArgumentContainer, dest_prefix: str
+) -> None:
+    dest = dest_prefix + question.name
+    _add_flag(parser, question.name, question.cli_help, dest, active=True)
+    _add_flag(parser, question.name, question.cli_help, dest, active=False)
 
 
 @_add_argument_for.register
-def _add_argument_for_choice(question: Choice, parser: ArgumentParser) -> None:
+def _add_argument_for_choice(
+    question: Choice, parser: ArgumentContainer, dest_prefix: str
+) -> None:
     options = question.options
     _add_argument(
         parser,
         question.name,
         question.cli_help,
+        dest_prefix + question.name,
         # For dynamic options we don't restrict the values in the CLI.
         # Conflicts will be rejected when processing the results.
         choices=None if callable(options) else options,
@@ -156,19 +278,219 @@ def to_answers(
     interactions: Collection[Interaction],
     result: Namespace,
     answers: Optional[Answers] = None,
+    env_prefix: Optional[str] = None,
+    answer_file: Optional[AnswerFile] = None,
+    validation_executor: Optional[Executor] = None,
 ) -> MutableAnswers:
-    cli_values: CliResults = vars(result)
-    resultant_answers = {} if answers is None else dict(answers)
+    """
+    Produce answers from the result of parsing the arguments added by `add_arguments()`.
+
+    The answers are produced in the same way as `parse_args()`, including the values from environment variables & the
+    answer file when `env_prefix` or `answer_file` are given. Other values in the result, such as the values of the
+    other arguments of the parser, are ignored.
+
+    :param interactions: The same interactions that were given to `add_arguments()`.
+    :param result: The result of `ArgumentParser.parse_args()`. When it doesn't include any values stored by
+        `add_arguments()`, the value for each question is stored using the name of the question.
+    :param answers: An initial dictionary of answers to start from. If the value is a `SlotAnswers`, the result will
+        be a `SlotAnswers` that uses the same layout.
+    :param env_prefix: If not `None`, questions are also answered using environment variables. See `parse_args()`.
+    :param answer_file: If not `None`, the path to a JSON or TOML file used to answer questions. See `parse_args()`.
+    :param validation_executor: If not `None`, the validators of the questions run concurrently on this executor. See
+        `parse_args()`.
+    :return: Answers based on the given result.
+    :raises CliException: A value was not valid. Report the error with `ArgumentParser.error()` to show the usage of
+        the parser, in the same way as `parse_args()`.
+    :raises DuplicateQuestionNameException: One of the given questions attempted to reuse a name. When a value is
+        provided for `answers`, those are considered as well.
+    :raises ValueError: One of the given `Interaction`s was not a valid type or was misconfigured in some way. Or the
+        layout used by `answers` does not have a slot for one of the questions.
+    """
+    validate_duplicate_question_names(interactions, answers)
+    return _to_answers(
+        interactions,
+        _question_values(result),
+        answers,
+        env_prefix,
+        answer_file,
+        validation_executor,
+    )
 
-    for interaction in interactions:
-        _update_answers(interaction, cli_values, resultant_answers)
 
+def _question_values(result: Namespace) -> Namespace:
+    added = {
+        dest.removeprefix(_ADDED_DEST_PREFIX): value
+        for dest, value in vars(result).items()
+        if dest.startswith(_ADDED_DEST_PREFIX)
+    }
+    # a result that wasn't produced by a parser given to add_arguments(), such as the result of parse_args() for
+    # create_parser(), stores each value using the name of its question
+    return Namespace(**added) if added else result
+
+
+def _to_answers(
+    interactions: Collection[Interaction],
+    result: Namespace,
+    answers: Optional[Answers],
+    env_prefix: Optional[str],
+    answer_file: Optional[AnswerFile],
+    validation_executor: Optional[Executor],
+) -> MutableAnswers:
+    cli_values: CliResults = resolve_values(
+        interactions, vars(result), env_prefix, answer_file
+    )
+    resultant_answers = copy_answers(interactions, answers)
+
+    if validation_executor is None:
+        for interaction in interactions:
+            _update_answers(interaction, cli_values, resultant_answers, _check_now)
+        return resultant_answers
+
+    checks = _ConcurrentChecks(validation_executor, resultant_answers)
+    try:
+        for interaction in interactions:
+            checks.update(interaction, cli_values)
+    except BaseException:
+        checks.cancel()
+        raise
+    checks.raise_errors()
     return resultant_answers
 
 
+def _check_now(
+    question: Union[BasicQuestion, Choice], value: str, answers: Answers
+) -> None:
+    result = question.validate(value, answers)
+    if not result.valid:
+        raise CliException.invalid_value(
+            value, canonical_arg_name(question.name), result.error
+        )
+
+
+class _Unresolved(Exception):
+    """The answer to a question is not known, because it depends on a value that was not valid."""
+
+
+class _CheckedAnswers(MutableMapping[str, Answer]):
+    """
+    Answers where reading the answer to a question waits for the check of its value to finish.
+
+    Reading an answer that is not known raises `_Unresolved`, so that nothing is derived from a value that is not valid.
+    """
+
+    __slots__ = ("_answers", "_checks")
+
+    def __init__(
+        self, answers: MutableAnswers, checks: Mapping[str, "Future[None]"]
+    ) -> None:
+        self._answers = answers
+        self._checks = checks
+
+    def __getitem__(self, key: str) -> Answer:
+        check = self._checks.get(key)
+        if check is not None:
+            try:
+                check.result()
+            except (CliException, _Unresolved) as ex:
+                raise _Unresolved(key) from ex
+        return self._answers[key]
+
+    def __setitem__(self, key: str, value: Answer) -> None:
+        self._answers[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self._answers[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._answers)
+
+    def __len__(self) -> int:
+        return len(self._answers)
+
+
+class _ConcurrentChecks:
+    """
+    Checks the values for questions on an executor, so that slow validators run at the same time.
+
+    Each check is given the answers before its question, as soon as the values are recorded. Anything that reads one of
+    those answers (a validator, `should_ask` or a dynamic value) waits for the check of that answer to finish. When the
+    value was not valid, the question that read it is skipped & not reported, since its answer isn't known either.
+    """
+
+    __slots__ = ("_executor", "_answers", "_checks")
+
+    def __init__(self, executor: Executor, answers: MutableAnswers) -> None:
+        self._executor = executor
+        self._answers = answers
+        # the check of the value for each question, in the order the questions were given
+        self._checks: Dict[str, Future[None]] = {}
+
+    def update(self, interaction: Interaction, cli_values: CliResults) -> None:
+        """
+        Record the answer for an interaction & start the check of its value.
+
+        :param interaction: The next interaction.
+        :param cli_values: Values given for the questions.
+        """
+        try:
+            _update_answers(
+                interaction,
+                cli_values,
+                _CheckedAnswers(self._answers, self._checks),
+                self._submit,
+            )
+        except _Unresolved as ex:
+            # only questions read the answers
+            question = cast(Union[BasicQuestion, Choice, Confirm], interaction)
+            unresolved: Future[None] = Future()
+            unresolved.set_exception(ex)
+            self._checks[question.name] = unresolved
+
+    def _submit(
+        self, question: Union[BasicQuestion, Choice], value: str, _: Answers
+    ) -> None:
+        # the answers continue to change while the check runs, so it is given a copy
+        answers = _CheckedAnswers(dict(self._answers), dict(self._checks))
+        self._checks[question.name] = self._executor.submit(
+            _check_now, question, value, answers
+        )
+
+    def cancel(self) -> None:
+        """Abandon the checks that have not started & wait for the others to finish."""
+        started = [check for check in self._checks.values() if not check.cancel()]
+        for check in started:
+            check.exception()
+
+    def raise_errors(self) -> None:
+        """
+        Wait for all the submitted checks to finish.
+
+        When a check raises an exception other than `CliException`, the checks that have not started are abandoned &
+        that exception is raised once the others finish. The values that were not valid are then not reported.
+
+        :raises CliException: One or more values were not valid. The exception describes every value that was not valid.
+        :raises Exception: The first exception that was raised by a validator, in the order the questions were given.
+        """
+        errors: List[CliException] = []
+        try:
+            for check in self._checks.values():
+                try:
+                    check.result()
+                except CliException as ex:
+                    errors.append(ex)
+                except _Unresolved:
+                    # the value that was not valid is already reported
+                    pass
+        except BaseException:
+            self.cancel()
+            raise
+        if errors:
+            raise CliException.combine(errors)
+
+
 @singledispatch
 def _update_answers(
-    question: object, cli_values: CliResults, answers: MutableAnswers
+    question: object, cli_values: CliResults, answers: MutableAnswers, check: _Check
 ) -> None:
     raise ValueError(f"Unsupported interaction type {type(question)}")
 
@@ -176,7 +498,10 @@ def _update_answers(
 @_update_answers.register(Acknowledge)
 @_update_answers.register(Echo)
 def _update_answers_noop(
-    question: Union[Acknowledge, Echo], cli_values: CliResults, answers: MutableAnswers
+    question: Union[Acknowledge, Echo],
+    cli_values: CliResults,
+    answers: MutableAnswers,
+    check: _Check,
 ) -> None:
     pass
 
@@ -187,23 +512,20 @@ def _update_answers_validate(
     question: Union[BasicQuestion, Choice],
     cli_values: CliResults,
     answers: MutableAnswers,
+    check: _Check,
 ) -> None:
     if not question.should_ask(answers):
         return
     value = cast(Optional[str], cli_values.get(question.name))
     if value is None:
         value = to_value(question.default, answers, str)
-    result = question.validate(value, answers)
-    if not result.valid:
-        raise CliException.invalid_value(
-            value, canonical_arg_name(question.name), result.error
-        )
+    check(question, value, answers)
     answers[question.name] = value
 
 
 @_update_answers.register
 def _update_answers_confirm(
-    question: Confirm, cli_values: CliResults, answers: MutableAnswers
+    question: Confirm, cli_values: CliResults, answers: MutableAnswers, check: _Check
 ) -> None:
     if not question.should_ask(answers):
         return
@@ -219,10 +541,10 @@ class _AddArgumentArgs(TypedDict, total=False):
 
 
 def _add_argument(
-    parser: ArgumentParser,
+    parser: ArgumentContainer,
     name: str,
     cli_help: Optional[str],
-    dest: Optional[str] = None,
+    dest: str,
     action: str = "store",
     choices: Optional[Iterable[str]] = None,
     const: Optional[bool] = None,
@@ -235,16 +557,17 @@ def _add_argument(
     parser.add_argument(
         canonical_arg_name(name),
         action=action,
-        dest=dest or name,
+        dest=dest,
         help=cli_help,
         **kwargs,
     )
 
 
 def _add_flag(
-    parser: ArgumentParser,
+    parser: ArgumentContainer,
     name: str,
     cli_help: Optional[str],
+    dest: str,
     active: bool = True,
 ) -> None:
     # store_const is used for boolean values because store_true/store_false automatically set a default for the
@@ -253,7 +576,7 @@ def _add_flag(
         parser,
         name if active else f"no-{name}",
         cli_help,
-        dest=name,
+        dest,
         action="store_const",
         const=active,
     )
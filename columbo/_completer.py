@@ -0,0 +1,117 @@
+"""
+Complete the text of a prompt using a large set of known values.
+"""
+
+import re
+from bisect import bisect_left, bisect_right
+from heapq import nsmallest
+from typing import Iterable, Iterator, List, Tuple
+
+from prompt_toolkit.completion import CompleteEvent, Completer, Completion
+from prompt_toolkit.document import Document
+
+# The most completions offered for the text of a prompt, more than this can't be usefully shown to the user
+DEFAULT_COMPLETION_LIMIT = 50
+# The most fuzzy matches that are ranked for the text of a prompt, which keeps the time taken to rank the matches
+# constant for any number of candidates
+_FUZZY_SCAN_LIMIT = 2_000
+
+
+class CompletionIndex(Completer):
+    """
+    Completes the text of a prompt using a fixed set of candidates.
+
+    The candidates are indexed once, when the index is created. The candidates that start with the text are found using
+    a binary search of the sorted candidates. When there are not enough of those, candidates that contain the
+    characters of the text in the same order (a fuzzy match) are found using a single regular expression search over
+    all the candidates. Fuzzy matches are ranked by how close together the characters are, then by how close they are
+    to the start. Only the first 2,000 fuzzy matches, in sorted order, are ranked, so that the time taken doesn't grow
+    with the number of candidates. When there are more fuzzy matches than that, the better matches after those are not
+    offered. Matching ignores case.
+    """
+
+    __slots__ = ("_keys", "_values", "_text", "_starts", "_limit")
+
+    def __init__(
+        self, candidates: Iterable[str], limit: int = DEFAULT_COMPLETION_LIMIT
+    ) -> None:
+        """
+        Initialize an instance.
+
+        :param candidates: The values that can be completed. The candidates are read once, so any iterable (such as a
+            generator) can be given. Duplicates are ignored.
+        :param limit: The most completions offered for the text of a prompt.
+        :raises ValueError: The value for `limit` was not positive.
+        """
+        if limit <= 0:
+            raise ValueError(f"limit must be positive: {limit}")
+        # line breaks are replaced, so that each key is a single line of the text that is searched for fuzzy matches
+        pairs = sorted({(_key(value), value) for value in candidates})
+        self._keys = [key for key, _ in pairs]
+        self._values = [value for _, value in pairs]
+        self._text = "\n".join(self._keys)
+        self._starts: List[int] = []
+        position = 0
+        for key in self._keys:
+            self._starts.append(position)
+            position += len(key) + 1
+        self._limit = limit
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def matches(self, text: str) -> List[str]:
+        """
+        Find the candidates that match the text.
+
+        :param text: The text to complete.
+        :return: The candidates that start with the text, followed by the best of the other candidates that contain the
+            characters of the text in the same order. At most `limit` candidates are returned.
+        """
+        key = _key(text)
+        first = bisect_left(self._keys, key)
+        last = first
+        while (
+            last < len(self._keys)
+            and last - first < self._limit
+            and self._keys[last].startswith(key)
+        ):
+            last += 1
+        result = self._values[first:last]
+        if key and len(result) < self._limit:
+            result.extend(self._fuzzy_matches(key, self._limit - len(result)))
+        return result
+
+    def get_completions(
+        self, document: Document, complete_event: CompleteEvent
+    ) -> Iterator[Completion]:
+        text = document.text_before_cursor
+        for value in self.matches(text):
+            yield Completion(value, start_position=-len(text))
+
+    def _fuzzy_matches(self, key: str, count: int) -> List[str]:
+        # each character after the first is matched by its first occurrence after the previous character, so the
+        # search never backtracks. The characters are groups, so that the span of the match can be used to rank it.
+        pattern = re.compile(
+            f"({re.escape(key[0])})"
+            + "".join(f"[^\\n{re.escape(c)}]*({re.escape(c)})" for c in key[1:])
+        )
+        ranked: List[Tuple[int, int, int]] = []
+        previous = -1
+        for match in pattern.finditer(self._text):
+            index = bisect_right(self._starts, match.start()) - 1
+            # a candidate can match more than once and prefix matches are already included
+            if index == previous or self._keys[index].startswith(key):
+                continue
+            previous = index
+            start = match.start(1)
+            # the matches with the characters closest together, then closest to the start, are the best
+            span = match.end(len(key)) - start
+            ranked.append((span, start - self._starts[index], index))
+            if len(ranked) == _FUZZY_SCAN_LIMIT:
+                break
+        return [self._values[index] for *_, index in nsmallest(count, ranked)]
+
+
+def _key(value: str) -> str:
+    return value.casefold().replace("\n", " ")
@@ -0,0 +1,212 @@
+"""
+Produce shell completion scripts for the command line arguments created by `parse_args()`.
+"""
+
+import re
+import shlex
+from dataclasses import dataclass
+from functools import singledispatch
+from typing import Callable, Collection, Dict, List, Optional, Union
+
+from columbo._interaction import (
+    Acknowledge,
+    BasicQuestion,
+    Choice,
+    Confirm,
+    Echo,
+    Interaction,
+    canonical_arg_name,
+    validate_duplicate_question_names,
+)
+
+
+@dataclass(frozen=True)
+class _Option:
+    """
+    A command line argument.
+
+    `values` is `None` when the argument is a flag. Otherwise, it is the values that can be given, which is empty when
+    any value can be given.
+    """
+
+    name: str
+    cli_help: Optional[str]
+    values: Optional[List[str]] = None
+    excludes: Optional[str] = None
+
+
+def format_completion_script(
+    interactions: Collection[Interaction], program: str, shell: str
+) -> str:
+    """
+    Produce a script that completes the command line arguments for the given interactions.
+
+    The script is static, so completing an argument doesn't need to run Python. It includes the arguments produced by
+    `parse_args()` (including the `--no-` form of each `Confirm`) and the values of each `Choice` that has static
+    options. The script should be produced again when the interactions change.
+
+    Install the script in the location expected by the shell. For example:
+
+    * bash: `/etc/bash_completion.d/{program}` or `source` it from `~/.bashrc`
+    * zsh: A file named `_{program}` in a directory that is part of `$fpath`
+    * fish: `~/.config/fish/completions/{program}.fish`
+
+    :param interactions: Interactions that are turned into CLI arguments.
+    :param program: The name of the command that the user types to run the program.
+    :param shell: The shell that the script is for: `bash`, `zsh` or `fish`.
+    :return: The content of the script.
+    :raises DuplicateQuestionNameException: One of the given questions attempted to reuse a name.
+    :raises ValueError: The shell is not supported. Or one of the given `Interaction`s was not a valid type.
+    """
+    formatter = _FORMATTERS.get(shell)
+    if formatter is None:
+        raise ValueError(
+            f"Unsupported shell: {shell}. Expected one of {', '.join(_FORMATTERS)}"
+        )
+    validate_duplicate_question_names(interactions)
+    options = [option for i in interactions for option in _options_for(i)]
+    return formatter(program, options)
+
+
+@singledispatch
+def _options_for(question: object) -> List[_Option]:
+    raise ValueError(f"Unsupported interaction type {type(question)}")
+
+
+# singledispatch for >=3.7 can use type annotations, but support for Union requires =>3.11
+@_options_for.register(Acknowledge)
+@_options_for.register(Echo)
+def _options_for_noop(question: Union[Acknowledge, Echo]) -> List[_Option]:
+    return []
+
+
+@_options_for.register
+def _options_for_basic(question: BasicQuestion) -> List[_Option]:
+    return [_Option(canonical_arg_name(question.name), question.cli_help, [])]
+
+
+@_options_for.register
+def _options_for_confirm(question: Confirm) -> List[_Option]:
+    # the same names as the flags produced by _add_flag()
+    active = canonical_arg_name(question.name)
+    inactive = canonical_arg_name(f"no-{question.name}")
+    return [
+        _Option(active, question.cli_help, excludes=inactive),
+        _Option(inactive, question.cli_help, excludes=active),
+    ]
+
+
+@_options_for.register
+def _options_for_choice(question: Choice) -> List[_Option]:
+    options = question.options
+    # dynamic options depend on other answers, so any value can be given
+    values = [] if callable(options) else list(options)
+    return [_Option(canonical_arg_name(question.name), question.cli_help, values)]
+
+
+def _function_name(program: str) -> str:
+    return "_columbo_" + re.sub(r"\W", "_", program)
+
+
+def _format_bash(program: str, options: List[_Option]) -> str:
+    function = _function_name(program)
+    cases: List[str] = []
+    for option in options:
+        if option.values is None:
+            continue
+        cases.append(f"        {shlex.quote(option.name)})")
+        cases.append(f"            words=({_bash_words(option.values)})")
+        cases.append("            ;;")
+    names = _bash_words([option.name for option in options])
+    # the words are chosen by the case & filtered afterwards, instead of using a nested function, because a function
+    # defined within a function is still defined globally in the user's shell
+    lines = [
+        f"# bash completion for {program}, produced by columbo",
+        f"{function}() {{",
+        '    local cur="${COMP_WORDS[COMP_CWORD]}"',
+        '    local prev="${COMP_WORDS[COMP_CWORD-1]}"',
+        "    local value",
+        "    local -a words",
+        "    COMPREPLY=()",
+        '    case "$prev" in',
+        *cases,
+        "        *)",
+        f"            words=({names})",
+        "            ;;",
+        "    esac",
+        '    for value in "${words[@]}"; do',
+        '        [[ "$value" == "$cur"* ]] && COMPREPLY+=("$value")',
+        "    done",
+        "}",
+        # when there are no matches (such as the value of a BasicQuestion), the shell's default completion is used
+        f"complete -o default -F {function} {shlex.quote(program)}",
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def _bash_words(words: List[str]) -> str:
+    return " ".join(shlex.quote(word) for word in words)
+
+
+def _format_zsh(program: str, options: List[_Option]) -> str:
+    specs: List[str] = []
+    for option in options:
+        spec = option.name
+        if option.excludes is not None:
+            spec = f"({option.excludes}){spec}"
+        if option.cli_help:
+            spec += f"[{_zsh_escape(option.cli_help)}]"
+        if option.values is not None:
+            spec += f":{_zsh_escape(option.name[2:])}:{_zsh_action(option.values)}"
+        # always quoted, so that the specs are easy to read
+        specs.append("    '" + spec.replace("'", "'\\''") + "'")
+    lines = [
+        f"#compdef {program}",
+        f"# zsh completion for {program}, produced by columbo",
+        "_arguments \\",
+        " \\\n".join(specs),
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def _zsh_action(values: List[str]) -> str:
+    if not values:
+        return "_default"
+    # the values are separated by spaces
+    return "(" + " ".join(_zsh_escape(value, r"\s()") for value in values) + ")"
+
+
+def _zsh_escape(text: str, specials: str = "") -> str:
+    # characters that have a special meaning within the specs given to _arguments
+    return re.sub(rf"([\\\[\]:{specials}])", r"\\\1", text)
+
+
+def _format_fish(program: str, options: List[_Option]) -> str:
+    lines = [f"# fish completion for {program}, produced by columbo"]
+    for option in options:
+        parts = ["complete", "-c", _fish_quote(program), "-l", option.name[2:]]
+        if option.values:
+            words = " ".join(_fish_escape(value) for value in option.values)
+            parts.extend(["-x", "-a", _fish_quote(words)])
+        elif option.values is not None:
+            parts.append("-r")
+        if option.cli_help:
+            parts.extend(["-d", _fish_quote(option.cli_help)])
+        lines.append(" ".join(parts))
+    return "\n".join(lines) + "\n"
+
+
+def _fish_escape(text: str) -> str:
+    # the values given to -a are split into words & expanded by fish
+    return re.sub(r"([\\\s'\"$(){}\[\]*?~#;&|<>])", r"\\\1", text)
+
+
+def _fish_quote(text: str) -> str:
+    return "'" + text.replace("\\", "\\\\").replace("'", "\\'") + "'"
+
+
+_FORMATTERS: Dict[str, Callable[[str, List[_Option]], str]] = {
+    "bash": _format_bash,
+    "zsh": _format_zsh,
+    "fish": _format_fish,
+}
@@ -0,0 +1,410 @@
+"""
+Declarative conditions that can be used in place of a `ShouldAsk` callable.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Callable, FrozenSet, Iterable, List, Tuple, Union
+
+from columbo._types import Answer, Answers, ConditionData
+
+_Evaluate = Callable[[Answers], bool]
+_ConditionKey = Tuple[Union[str, Answer, FrozenSet[Answer], "Condition"], ...]
+
+
+class Condition(ABC):
+    """
+    Base class for a declarative condition about the answers that have been provided.
+
+    Unlike an arbitrary callable, a condition can be inspected for the answers it depends on and can be converted to
+    and from plain data. Instances are callable, so they can be given anywhere a `ShouldAsk` is accepted. Conditions
+    can be combined using `&` (and), `|` (or), & `~` (not).
+    """
+
+    __slots__ = ("_evaluate",)
+
+    def __init__(self) -> None:
+        # The condition is compiled once into a closure, so evaluating it doesn't need to walk the condition tree.
+        self._evaluate: _Evaluate = self._compile()
+
+    def __call__(self, answers: Answers) -> bool:
+        """
+        Evaluate the condition.
+
+        :param answers: The answers that have been provided this far.
+        :return: `True` if the condition is satisfied.
+        """
+        return self._evaluate(answers)
+
+    @property
+    @abstractmethod
+    def dependencies(self) -> FrozenSet[str]:  # pragma: no cover
+        """The names of the answers used to evaluate the condition."""
+        pass
+
+    @abstractmethod
+    def to_dict(self) -> ConditionData:  # pragma: no cover
+        """
+        Convert the condition to plain data that can be serialized (as JSON, for example).
+
+        :return: Data that can be given to `Condition.from_dict()` to recreate the condition.
+        """
+        pass
+
+    @staticmethod
+    def from_dict(data: ConditionData) -> "Condition":
+        """
+        Create a condition from data produced by `Condition.to_dict()`.
+
+        :param data: The plain data form of a condition.
+        :return: The condition described by the data.
+        :raises ValueError: The data does not describe a valid condition.
+        """
+        try:
+            return _from_dict(data)
+        except (KeyError, TypeError) as ex:
+            raise ValueError(f"Invalid condition data: {data}") from ex
+
+    @abstractmethod
+    def _compile(self) -> _Evaluate:  # pragma: no cover
+        pass
+
+    @abstractmethod
+    def _key(self) -> _ConditionKey:  # pragma: no cover
+        pass
+
+    def __and__(self, other: "Condition") -> "Condition":
+        return And(self, other)
+
+    def __or__(self, other: "Condition") -> "Condition":
+        return Or(self, other)
+
+    def __invert__(self) -> "Condition":
+        return Not(self)
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, Condition)
+            and type(self) is type(other)
+            and self._key() == other._key()
+        )
+
+    def __hash__(self) -> int:
+        return hash((type(self), self._key()))
+
+    def __repr__(self) -> str:
+        arguments = ", ".join(repr(value) for value in self._key())
+        return f"{type(self).__name__}({arguments})"
+
+
+class Answered(Condition):
+    """The question with the given name has an answer."""
+
+    __slots__ = ("_name",)
+
+    def __init__(self, name: str) -> None:
+        """
+        Initialize an instance.
+
+        :param name: The name of the question.
+        """
+        self._name = name
+        super().__init__()
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def dependencies(self) -> FrozenSet[str]:
+        return frozenset((self._name,))
+
+    def to_dict(self) -> ConditionData:
+        return {"op": "answered", "name": self._name}
+
+    def _compile(self) -> _Evaluate:
+        name = self._name
+
+        def answered(answers: Answers) -> bool:
+            return name in answers
+
+        return answered
+
+    def _key(self) -> _ConditionKey:
+        return (self._name,)
+
+
+class Equals(Condition):
+    """The answer to the question with the given name is equal to a value."""
+
+    __slots__ = ("_name", "_value")
+
+    def __init__(self, name: str, value: Answer) -> None:
+        """
+        Initialize an instance.
+
+        :param name: The name of the question.
+        :param value: The value the answer must be equal to. A missing answer is never equal to the value.
+        """
+        self._name = name
+        self._value = value
+        super().__init__()
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def value(self) -> Answer:
+        return self._value
+
+    @property
+    def dependencies(self) -> FrozenSet[str]:
+        return frozenset((self._name,))
+
+    def to_dict(self) -> ConditionData:
+        return {"op": "equals", "name": self._name, "value": self._value}
+
+    def _compile(self) -> _Evaluate:
+        name = self._name
+        value = self._value
+        value_type = type(value)
+
+        def equals(answers: Answers) -> bool:
+            answer = answers.get(name)
+            # bool is compared by type so that a string answer never matches a bool
+            return type(answer) is value_type and answer == value
+
+        return equals
+
+    def _key(self) -> _ConditionKey:
+        return self._name, self._value
+
+
+class OneOf(Condition):
+    """The answer to the question with the given name is one of the given values."""
+
+    __slots__ = ("_name", "_values")
+
+    def __init__(self, name: str, values: Iterable[Answer]) -> None:
+        """
+        Initialize an instance.
+
+        :param name: The name of the question.
+        :param values: The values the answer must be one of. A missing answer is never one of the values.
+        """
+        self._name = name
+        self._values = frozenset(values)
+        super().__init__()
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def values(self) -> FrozenSet[Answer]:
+        return self._values
+
+    @property
+    def dependencies(self) -> FrozenSet[str]:
+        return frozenset((self._name,))
+
+    def to_dict(self) -> ConditionData:
+        return {"op": "one_of", "name": self._name, "values": _sorted(self._values)}
+
+    def _compile(self) -> _Evaluate:
+        name = self._name
+        # bool is stored by type so that a string answer never matches a bool
+        values = frozenset((type(value), value) for value in self._values)
+
+        def one_of(answers: Answers) -> bool:
+            answer = answers.get(name)
+            return (type(answer), answer) in values
+
+        return one_of
+
+    def _key(self) -> _ConditionKey:
+        return self._name, self._values
+
+
+class And(Condition):
+    """All the given conditions are satisfied."""
+
+    __slots__ = ("_conditions",)
+
+    def __init__(self, *conditions: Condition) -> None:
+        """
+        Initialize an instance.
+
+        :param conditions: The conditions that must all be satisfied.
+        :raises ValueError: No conditions were given.
+        """
+        if not conditions:
+            raise ValueError("At least one condition must be given")
+        self._conditions = conditions
+        super().__init__()
+
+    @property
+    def conditions(self) -> Tuple[Condition, ...]:
+        return self._conditions
+
+    @property
+    def dependencies(self) -> FrozenSet[str]:
+        return _combined_dependencies(self._conditions)
+
+    def to_dict(self) -> ConditionData:
+        return {"op": "and", "conditions": [c.to_dict() for c in self._conditions]}
+
+    def _compile(self) -> _Evaluate:
+        evaluators = tuple(condition._evaluate for condition in self._conditions)
+        if len(evaluators) == 1:
+            return evaluators[0]
+        if len(evaluators) == 2:
+            first, second = evaluators
+
+            def both(answers: Answers) -> bool:
+                return first(answers) and second(answers)
+
+            return both
+
+        def every(answers: Answers) -> bool:
+            return all(evaluate(answers) for evaluate in evaluators)
+
+        return every
+
+    def _key(self) -> _ConditionKey:
+        return self._conditions
+
+
+class Or(Condition):
+    """At least one of the given conditions is satisfied."""
+
+    __slots__ = ("_conditions",)
+
+    def __init__(self, *conditions: Condition) -> None:
+        """
+        Initialize an instance.
+
+        :param conditions: The conditions where at least one must be satisfied.
+        :raises ValueError: No conditions were given.
+        """
+        if not conditions:
+            raise ValueError("At least one condition must be given")
+        self._conditions = conditions
+        super().__init__()
+
+    @property
+    def conditions(self) -> Tuple[Condition, ...]:
+        return self._conditions
+
+    @property
+    def dependencies(self) -> FrozenSet[str]:
+        return _combined_dependencies(self._conditions)
+
+    def to_dict(self) -> ConditionData:
+        return {"op": "or", "conditions": [c.to_dict() for c in self._conditions]}
+
+    def _compile(self) -> _Evaluate:
+        evaluators = tuple(condition._evaluate for condition in self._conditions)
+        if len(evaluators) == 1:
+            return evaluators[0]
+        if len(evaluators) == 2:
+            first, second = evaluators
+
+            def either(answers: Answers) -> bool:
+                return first(answers) or second(answers)
+
+            return either
+
+        def any_of(answers: Answers) -> bool:
+            return any(evaluate(answers) for evaluate in evaluators)
+
+        return any_of
+
+    def _key(self) -> _ConditionKey:
+        return self._conditions
+
+
+class Not(Condition):
+    """The given condition is not satisfied."""
+
+    __slots__ = ("_condition",)
+
+    def __init__(self, condition: Condition) -> None:
+        """
+        Initialize an instance.
+
+        :param condition: The condition that must not be satisfied.
+        """
+        self._condition = condition
+        super().__init__()
+
+    @property
+    def condition(self) -> Condition:
+        return self._condition
+
+    @property
+    def dependencies(self) -> FrozenSet[str]:
+        return self._condition.dependencies
+
+    def to_dict(self) -> ConditionData:
+        return {"op": "not", "condition": self._condition.to_dict()}
+
+    def _compile(self) -> _Evaluate:
+        evaluate = self._condition._evaluate
+
+        def negate(answers: Answers) -> bool:
+            return not evaluate(answers)
+
+        return negate
+
+    def _key(self) -> _ConditionKey:
+        return (self._condition,)
+
+
+def _combined_dependencies(conditions: Iterable[Condition]) -> FrozenSet[str]:
+    return frozenset().union(*(condition.dependencies for condition in conditions))
+
+
+def _sorted(values: FrozenSet[Answer]) -> List[Answer]:
+    # produce a stable order so that serialized data can be compared
+    return sorted(values, key=lambda value: (type(value).__name__, str(value)))
+
+
+def _from_dict(data: ConditionData) -> Condition:
+    op = data["op"]
+    if op == "answered":
+        return Answered(_str(data["name"]))
+    if op == "equals":
+        return Equals(_str(data["name"]), _answer(data["value"]))
+    if op == "one_of":
+        return OneOf(_str(data["name"]), [_answer(v) for v in _list(data["values"])])
+    if op in ("and", "or"):
+        conditions = [_from_dict(_data(c)) for c in _list(data["conditions"])]
+        return And(*conditions) if op == "and" else Or(*conditions)
+    if op == "not":
+        return Not(_from_dict(_data(data["condition"])))
+    raise ValueError(f"Unknown condition operation: {op}")
+
+
+def _str(value: object) -> str:
+    if isinstance(value, str):
+        return value
+    raise TypeError(f"Expected a string: {value}")
+
+
+def _answer(value: object) -> Answer:
+    if isinstance(value, (str, bool)):
+        return value
+    raise TypeError(f"Expected a string or bool: {value}")
+
+
+def _list(value: object) -> List[object]:
+    if isinstance(value, list):
+        return value
+    raise TypeError(f"Expected a list: {value}")
+
+
+def _data(value: object) -> ConditionData:
+    if isinstance(value, dict):
+        return value
+    raise TypeError(f"Expected a mapping: {value}")
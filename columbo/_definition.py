@@ -0,0 +1,274 @@
+"""
+Create interactions from a declarative definition, instead of Python code.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from contextlib import suppress
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional, Union
+
+from columbo._condition import Condition
+from columbo._interaction import (
+    Acknowledge,
+    BasicQuestion,
+    Choice,
+    Confirm,
+    Echo,
+    Interaction,
+    validate_duplicate_question_names,
+)
+from columbo._sources import load_toml
+from columbo._types import ConditionData, Options
+
+DefinitionPath = Union[str, "os.PathLike[str]"]
+# Plain data form of a single interaction, as found in a definition
+InteractionData = Dict[str, object]
+
+# Incremented when the format of the cached definitions changes in a way that older versions can't read
+_CACHE_VERSION = 1
+_CACHE_HEADER = b"columbo-definition\x00" + _CACHE_VERSION.to_bytes(2, "big")
+_CACHE_SUFFIX = ".columbo"
+
+_MESSAGE_KEYS = frozenset(["type", "message", "should_ask"])
+_QUESTION_KEYS = _MESSAGE_KEYS | {"name", "cli_help", "value_if_not_asked", "timeout"}
+_KEYS = {
+    "echo": _MESSAGE_KEYS,
+    "acknowledge": _MESSAGE_KEYS,
+    "confirm": _QUESTION_KEYS | {"default"},
+    "choice": _QUESTION_KEYS | {"options", "default"},
+    "basic": _QUESTION_KEYS | {"default", "completions"},
+}
+
+
+def interactions_from_dict(data: Mapping[str, object]) -> List[Interaction]:
+    """
+    Create interactions from their plain data form.
+
+    The data contains an `interactions` key with a list of interactions. Each interaction has a `type` (`echo`,
+    `acknowledge`, `confirm`, `choice` or `basic`) and the values given to the constructor of that type, using the
+    same names. `should_ask` is the plain data form of a `Condition`. Values that must be callable, such as validators,
+    can't be given.
+
+    :param data: The definition of the interactions.
+    :return: The interactions, in the order they are defined.
+    :raises DuplicateQuestionNameException: One of the questions attempted to reuse a name.
+    :raises ValueError: The data does not describe valid interactions.
+    """
+    return _create_all(_entries(data))
+
+
+def load_interactions(
+    path: DefinitionPath, cache_dir: Optional[DefinitionPath] = None
+) -> List[Interaction]:
+    """
+    Create interactions from a JSON or TOML file, using the format described by `interactions_from_dict()`.
+
+    Files that end with `.toml` are read as TOML, otherwise the file is read as JSON. In TOML, each interaction is
+    an entry in the `[[interactions]]` array of tables.
+
+    Parsing TOML is slow, so when `cache_dir` is given, a TOML file is stored as JSON in that directory the first time
+    it is loaded. Later loads of a file with the same content read the stored JSON instead of parsing the TOML again.
+    The interactions are still created & checked on every load. The stored JSON is found using a hash of the content of
+    the file, so changes to the file are always used. Problems reading or writing the cache are ignored, in which case
+    the file is parsed. JSON files are already quick to parse, so they are always read directly.
+
+    :param path: The file to read.
+    :param cache_dir: The directory to store TOML files as JSON in. If `None`, nothing is stored.
+    :return: The interactions, in the order they are defined.
+    :raises OSError: The file could not be read.
+    :raises DuplicateQuestionNameException: One of the questions attempted to reuse a name.
+    :raises ValueError: The file does not describe valid interactions.
+    """
+    content = Path(path).read_bytes()
+    is_toml = Path(path).suffix.lower() == ".toml"
+    if cache_dir is None or not is_toml:
+        return interactions_from_dict(_parse(content, is_toml))
+
+    cache_path = Path(cache_dir) / (_cache_key(content) + _CACHE_SUFFIX)
+    entries = _read_cache(cache_path)
+    if entries is not None:
+        return _create_all(entries)
+
+    entries = _entries(_parse(content, is_toml))
+    # only definitions that are valid are stored
+    interactions = _create_all(entries)
+    _write_cache(cache_path, entries)
+    return interactions
+
+
+def _parse(content: bytes, is_toml: bool) -> Mapping[str, object]:
+    data = load_toml(content) if is_toml else json.loads(content)
+    if not isinstance(data, dict):
+        raise ValueError("Interaction definition must be an object")
+    return data
+
+
+def _entries(data: Mapping[str, object]) -> List[InteractionData]:
+    entries = data.get("interactions")
+    if isinstance(entries, list):
+        result = [entry for entry in entries if isinstance(entry, dict)]
+        if len(result) == len(entries):
+            return result
+    raise ValueError("Interaction definition must contain a list of interactions")
+
+
+def _create_all(entries: List[InteractionData]) -> List[Interaction]:
+    interactions = [_create(entry) for entry in entries]
+    validate_duplicate_question_names(interactions)
+    return interactions
+
+
+def _create(data: InteractionData) -> Interaction:
+    try:
+        return _from_dict(data)
+    except (KeyError, TypeError) as ex:
+        raise ValueError(f"Invalid interaction data: {data}") from ex
+
+
+def _from_dict(data: InteractionData) -> Interaction:
+    kind = _str(data["type"])
+    keys = _KEYS.get(kind)
+    if keys is None:
+        raise ValueError(f"Unknown interaction type: {kind}")
+    unknown = set(data) - keys
+    if unknown:
+        raise ValueError(f"Unknown keys for {kind}: {', '.join(sorted(unknown))}")
+
+    message = _str(data["message"])
+    should_ask = _condition(data.get("should_ask"))
+    if kind == "echo":
+        return Echo(message, should_ask)
+    if kind == "acknowledge":
+        return Acknowledge(message, should_ask)
+    return _question_from_dict(kind, data, message, should_ask)
+
+
+def _question_from_dict(
+    kind: str, data: InteractionData, message: str, should_ask: Optional[Condition]
+) -> Interaction:
+    name = _str(data["name"])
+    cli_help = _optional_str(data.get("cli_help"))
+    timeout = _optional_number(data.get("timeout"))
+    if kind == "confirm":
+        return Confirm(
+            name,
+            message,
+            default=_bool(data.get("default", False)),
+            cli_help=cli_help,
+            should_ask=should_ask,
+            value_if_not_asked=_optional_bool(data.get("value_if_not_asked")),
+            timeout=timeout,
+        )
+    if kind == "choice":
+        return Choice(
+            name,
+            message,
+            _options(data["options"]),
+            _str(data["default"]),
+            cli_help=cli_help,
+            should_ask=should_ask,
+            value_if_not_asked=_optional_str(data.get("value_if_not_asked")),
+            timeout=timeout,
+        )
+    return BasicQuestion(
+        name,
+        message,
+        _str(data["default"]),
+        cli_help=cli_help,
+        should_ask=should_ask,
+        value_if_not_asked=_optional_str(data.get("value_if_not_asked")),
+        timeout=timeout,
+        completions=_optional_str_list(data.get("completions")),
+    )
+
+
+def _cache_key(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+def _read_cache(path: Path) -> Optional[List[InteractionData]]:
+    try:
+        content = path.read_bytes()
+    except OSError:
+        return None
+    # a cache written by a different version is replaced
+    if not content.startswith(_CACHE_HEADER):
+        return None
+    try:
+        return _entries(_parse(content.removeprefix(_CACHE_HEADER), is_toml=False))
+    except ValueError:
+        return None
+
+
+def _write_cache(path: Path, entries: List[InteractionData]) -> None:
+    payload = json.dumps({"interactions": entries}, separators=(",", ":")).encode()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # written to a temporary file first, so that other processes never read a partial cache
+        file = tempfile.NamedTemporaryFile(dir=path.parent, delete=False)
+    except OSError:
+        # the cache is only an optimization, so the definition is still used
+        return
+    try:
+        with file:
+            file.write(_CACHE_HEADER + payload)
+        os.replace(file.name, path)
+    except OSError:
+        with suppress(OSError):
+            Path(file.name).unlink(missing_ok=True)
+
+
+def _condition(value: object) -> Optional[Condition]:
+    if value is None:
+        return None
+    if isinstance(value, dict):
+        data: ConditionData = value
+        return Condition.from_dict(data)
+    raise TypeError(f"Expected a mapping: {value}")
+
+
+def _options(value: object) -> Options:
+    if isinstance(value, list) and all(isinstance(v, str) for v in value):
+        return value
+    if isinstance(value, dict) and all(isinstance(v, str) for v in value.values()):
+        return value
+    raise TypeError(f"Expected a list of strings or a mapping of strings: {value}")
+
+
+def _str(value: object) -> str:
+    if isinstance(value, str):
+        return value
+    raise TypeError(f"Expected a string: {value}")
+
+
+def _optional_str(value: object) -> Optional[str]:
+    return None if value is None else _str(value)
+
+
+def _optional_str_list(value: object) -> Optional[List[str]]:
+    if value is None:
+        return None
+    if isinstance(value, list) and all(isinstance(v, str) for v in value):
+        return value
+    raise TypeError(f"Expected a list of strings: {value}")
+
+
+def _bool(value: object) -> bool:
+    if isinstance(value, bool):
+        return value
+    raise TypeError(f"Expected a bool: {value}")
+
+
+def _optional_bool(value: object) -> Optional[bool]:
+    return None if value is None else _bool(value)
+
+
+def _optional_number(value: object) -> Optional[float]:
+    if value is None:
+        return None
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return value
+    raise TypeError(f"Expected a number: {value}")
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Optional, Sequence
 
 
 class ColumboException(Exception):
@@ -20,3 +20,15 @@ class CliException(ColumboException):
         return cls(
             f"'{value}' is not a valid value for '{argument_name}'{formatted_error_message}"
         )
+
+    @classmethod
+    def combine(cls, errors: Sequence["CliException"]) -> "CliException":
+        """
+        Report multiple errors at once.
+
+        :param errors: The errors to report, in the order they should be reported. Must not be empty.
+        :return: An exception with the message of each error on its own line. A single error is returned unchanged.
+        """
+        if len(errors) == 1:
+            return errors[0]
+        return cls("\n".join(str(error) for error in errors))
@@ -0,0 +1,156 @@
+"""
+Parse the command line arguments produced for interactions without building an `ArgumentParser`.
+"""
+
+from argparse import Namespace
+from dataclasses import dataclass
+from functools import singledispatch
+from typing import Collection, Dict, List, Optional, Sequence, Tuple, TypeGuard, Union
+
+from columbo._interaction import (
+    Acknowledge,
+    BasicQuestion,
+    Choice,
+    Confirm,
+    Echo,
+    Interaction,
+    canonical_arg_name,
+)
+
+
+@dataclass(frozen=True)
+class _Option:
+    """
+    How the value of an argument is stored.
+
+    `const` is the value stored for a flag, in which case the argument doesn't take a value. `choices` is the values
+    allowed for an argument that takes a value, or `None` if any value is allowed.
+    """
+
+    dest: str
+    const: Optional[bool] = None
+    choices: Optional[Collection[str]] = None
+
+
+# An argument & how its value is stored
+_Argument = Tuple[str, _Option]
+
+
+class FastParser:
+    """
+    Parses the arguments produced by `create_parser()` for the same interactions, for the common cases.
+
+    Creating the parser only builds a mapping from each argument to its destination. Arguments are only parsed when
+    every argument is given exactly as produced for the interactions (as `--name value`, `--name=value` or `--flag`).
+    Anything else, such as an unknown argument, an abbreviated argument or an invalid value, is left to
+    `ArgumentParser`, so that the errors are exactly the same.
+    """
+
+    __slots__ = ("_options", "_dests")
+
+    def __init__(self, interactions: Collection[Interaction]) -> None:
+        """
+        Initialize an instance.
+
+        :param interactions: Interactions that are turned into CLI arguments.
+        :raises ValueError: One of the given `Interaction`s was not a valid type.
+        """
+        pairs: List[_Argument] = []
+        for interaction in interactions:
+            pairs.extend(_options_for(interaction))
+        self._dests: List[str] = list(dict.fromkeys(option.dest for _, option in pairs))
+        options = dict(pairs)
+        # arguments that conflict are reported by ArgumentParser
+        self._options = options if len(options) == len(pairs) else None
+
+    def parse_args(self, args: Sequence[str]) -> Optional[Namespace]:
+        """
+        Parse the arguments.
+
+        :param args: Arguments to parse.
+        :return: The same result as `ArgumentParser.parse_args()`. `None` if the arguments must be parsed by
+            `ArgumentParser` instead.
+        """
+        if self._options is None:
+            return None
+        values: Dict[str, Union[str, bool, None]] = dict.fromkeys(self._dests)
+        index = 0
+        while index < len(args):
+            option, explicit = _find(self._options, args[index])
+            if option is None:
+                return None
+            index += 1
+            if option.const is not None:
+                if explicit is not None:
+                    return None
+                values[option.dest] = option.const
+                continue
+            if explicit is None and index < len(args):
+                explicit = args[index]
+                index += 1
+            if not _allowed(explicit, option):
+                return None
+            values[option.dest] = explicit
+        return Namespace(**values)
+
+
+def _find(
+    options: Dict[str, _Option], arg: str
+) -> Tuple[Optional[_Option], Optional[str]]:
+    """
+    :return: The argument & the value given using `--name=value`, if there is one.
+    """
+    # an exact match is used before splitting on "=", in the same way as ArgumentParser
+    option = options.get(arg)
+    if option is None and "=" in arg:
+        name, _, explicit = arg.partition("=")
+        return options.get(name), explicit
+    return option, None
+
+
+def _allowed(value: Optional[str], option: _Option) -> TypeGuard[str]:
+    if value is None:
+        return False
+    # values that look like an argument have special handling in ArgumentParser
+    if value.startswith("-"):
+        return False
+    return option.choices is None or value in option.choices
+
+
+@singledispatch
+def _options_for(question: object) -> List[_Argument]:
+    raise ValueError(f"Unsupported interaction type {type(question)}")
+
+
+# singledispatch for >=3.7 can use type annotations, but support for Union requires =>3.11
+@_options_for.register(Acknowledge)
+@_options_for.register(Echo)
+def _options_for_noop(question: Union[Acknowledge, Echo]) -> List[_Argument]:
+    return []
+
+
+@_options_for.register
+def _options_for_basic(question: BasicQuestion) -> List[_Argument]:
+    return [(canonical_arg_name(question.name), _Option(question.name))]
+
+
+@_options_for.register
+def _options_for_confirm(question: Confirm) -> List[_Argument]:
+    # the same arguments as the flags added by _add_flag()
+    return [
+        (canonical_arg_name(question.name), _Option(question.name, const=True)),
+        (
+            canonical_arg_name(f"no-{question.name}"),
+            _Option(question.name, const=False),
+        ),
+    ]
+
+
+@_options_for.register
+def _options_for_choice(question: Choice) -> List[_Argument]:
+    options = question.options
+    # dynamic options are checked when processing the results, in the same way as _add_argument_for_choice()
+    choices = None if callable(options) else options
+    return [
+        (canonical_arg_name(question.name), _Option(question.name, choices=choices))
+    ]
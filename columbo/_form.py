@@ -0,0 +1,331 @@
+"""
+Present all the interactions on a single screen, instead of one prompt at a time.
+"""
+
+from functools import singledispatch
+from typing import Collection, Dict, List, Optional, Tuple, Union
+
+from prompt_toolkit.application import Application
+from prompt_toolkit.filters import Always, Condition
+from prompt_toolkit.key_binding import KeyBindings
+from prompt_toolkit.key_binding.key_processor import KeyPressEvent
+from prompt_toolkit.layout import (
+    AnyContainer,
+    BufferControl,
+    DynamicContainer,
+    HSplit,
+    Layout,
+    Window,
+)
+from prompt_toolkit.widgets import (
+    Box,
+    Button,
+    Checkbox,
+    Frame,
+    Label,
+    RadioList,
+    TextArea,
+)
+
+from columbo import _user_io as user_io
+from columbo._interaction import (
+    Acknowledge,
+    BasicQuestion,
+    Choice,
+    Confirm,
+    Echo,
+    Interaction,
+    copy_answers,
+    is_question,
+    to_labeled_options,
+    to_value,
+    validate_duplicate_question_names,
+    validate_value_if_not_asked,
+)
+from columbo._types import Answer, Answers, MutableAnswers
+
+_FORM_TITLE = "Press TAB to move between fields"
+
+
+class _ConfirmField:
+    __slots__ = ("_checkbox",)
+
+    def __init__(self, question: Confirm, answers: Answers) -> None:
+        self._checkbox = Checkbox(
+            "Yes", checked=to_value(question.default, answers, bool)
+        )
+
+    @property
+    def widget(self) -> AnyContainer:
+        return self._checkbox
+
+    def value(self, answers: Answers) -> Answer:
+        return self._checkbox.checked
+
+    def is_current(self, answers: Answers) -> bool:
+        return True
+
+
+class _ChoiceField:
+    __slots__ = ("_question", "_options", "_radio")
+
+    def __init__(self, question: Choice, answers: Answers) -> None:
+        self._question = question
+        self._options = to_labeled_options(question.options, answers)
+        default = to_value(question.default, answers, str)
+        if default not in self._options:
+            raise ValueError(
+                f"""Default "{default}" was not an option {self._options}"""
+            )
+        self._radio = RadioList(list(self._options.items()), default=default)
+
+    @property
+    def widget(self) -> AnyContainer:
+        return self._radio
+
+    def value(self, answers: Answers) -> Answer:
+        return self._radio.current_value
+
+    def is_current(self, answers: Answers) -> bool:
+        # the options may depend on the answers to other questions in the form
+        return to_labeled_options(self._question.options, answers) == self._options
+
+
+class _TextField:
+    __slots__ = ("_question", "_answers", "_text_area")
+
+    def __init__(self, question: BasicQuestion, answers: Answers) -> None:
+        self._question = question
+        self._answers: Answers = answers
+        self._text_area = TextArea(multiline=False)
+        # the buffer is given to the validator, since it isn't always the one with the focus
+        self._text_area.validator = user_io.LiveValidator(
+            self._check, buffer=self._text_area.buffer
+        )
+        self._text_area.buffer.validate_while_typing = Always()
+
+    @property
+    def widget(self) -> AnyContainer:
+        return self._text_area
+
+    @property
+    def error(self) -> Optional[str]:
+        error = self._text_area.buffer.validation_error
+        return None if error is None else error.message
+
+    def value(self, answers: Answers) -> Answer:
+        # the answers are kept so that the text is validated using the answers that were given before the question
+        self._answers = answers
+        text = self._text_area.text
+        return to_value(self._question.default, answers, str) if text == "" else text
+
+    def is_current(self, answers: Answers) -> bool:
+        return True
+
+    def validate(self) -> bool:
+        """
+        Validate the answer now, instead of waiting for the user to stop typing.
+
+        :return: `True` if the answer is valid.
+        :raises ValueError: No answer was given and the default value did not satisfy the validator.
+        """
+        if self._text_area.text == "":
+            default_value = to_value(self._question.default, self._answers, str)
+            if not self._question.validate(default_value, self._answers).valid:
+                raise ValueError(
+                    f"Default value '{default_value}' must satisfy the validator."
+                )
+        return self._text_area.buffer.validate(set_cursor=True)
+
+    def _check(self, text: str) -> Optional[str]:
+        # no input means the default is used, which is validated when the form is submitted
+        if text == "":
+            return None
+        result = self._question.validate(text, self._answers)
+        return None if result.valid else result.error
+
+
+_Field = Union[_ConfirmField, _ChoiceField, _TextField]
+
+
+@singledispatch
+def _create_field(question: object, answers: Answers) -> _Field:
+    raise ValueError(f"Unsupported interaction type {type(question)}")
+
+
+@_create_field.register
+def _create_confirm_field(question: Confirm, answers: Answers) -> _Field:
+    return _ConfirmField(question, answers)
+
+
+@_create_field.register
+def _create_choice_field(question: Choice, answers: Answers) -> _Field:
+    return _ChoiceField(question, answers)
+
+
+@_create_field.register
+def _create_text_field(question: BasicQuestion, answers: Answers) -> _Field:
+    return _TextField(question, answers)
+
+
+# The interaction, the answers given before it and, for questions, the field used to answer it
+_Row = Tuple[Interaction, Answers, Optional[_Field]]
+
+
+class _Form:
+    """A full-screen application that shows every interaction that should currently be asked."""
+
+    __slots__ = ("_interactions", "_initial", "_fields", "_visible", "_submit", "_app")
+
+    def __init__(
+        self, interactions: Collection[Interaction], initial: MutableAnswers
+    ) -> None:
+        self._interactions = interactions
+        self._initial = initial
+        self._fields: Dict[str, _Field] = {}
+        self._submit = Button("Submit", handler=self._on_submit)
+        # misconfigured interactions are reported before the screen is taken over
+        _, self._visible = self._walk()
+
+        bindings = KeyBindings()
+        bindings.add("tab")(lambda _: self._move_focus(1))
+        bindings.add("s-tab")(lambda _: self._move_focus(-1))
+        # ENTER in a text field moves to the next field, instead of submitting the form
+        editing_text = Condition(
+            lambda: isinstance(self._app.layout.current_control, BufferControl)
+        )
+        bindings.add("enter", filter=editing_text)(lambda _: self._move_focus(1))
+
+        @bindings.add("c-c")
+        def _abort(event: KeyPressEvent) -> None:
+            event.app.exit(exception=KeyboardInterrupt())
+
+        body = Box(DynamicContainer(self._body), padding_left=1, padding_right=1)
+        self._app: Application[MutableAnswers] = Application(
+            layout=Layout(Frame(body, title=_FORM_TITLE)),
+            key_bindings=bindings,
+            full_screen=True,
+        )
+        self._app.before_render += self._ensure_focus
+
+    def run(self) -> MutableAnswers:
+        return self._app.run()
+
+    def _walk(self) -> Tuple[MutableAnswers, List[_Row]]:
+        """
+        Determine the answers & which interactions should be shown, in the same way as `get_answers()`.
+
+        :return: The answers given this far, and the interactions that should be shown.
+        """
+        answers = copy_answers(self._interactions, self._initial)
+        visible: List[_Row] = []
+        for interaction in self._interactions:
+            if isinstance(interaction, (Echo, Acknowledge)):
+                if interaction.should_ask(answers):
+                    visible.append((interaction, dict(answers), None))
+            elif is_question(interaction):
+                if interaction.should_ask(answers):
+                    snapshot = dict(answers)
+                    field = self._field(interaction.name, interaction, snapshot)
+                    visible.append((interaction, snapshot, field))
+                    answers[interaction.name] = field.value(snapshot)
+                elif interaction.value_if_not_asked is not None:
+                    answers[interaction.name] = validate_value_if_not_asked(
+                        interaction.value_if_not_asked, interaction, answers
+                    )
+            else:
+                raise ValueError(f"Unsupported interaction type: {type(interaction)}")
+        return answers, visible
+
+    def _field(self, name: str, question: Interaction, answers: Answers) -> _Field:
+        field = self._fields.get(name)
+        if field is None or not field.is_current(answers):
+            # fields are kept while they are hidden, so that the user doesn't lose what was entered
+            field = self._fields[name] = _create_field(question, answers)
+        return field
+
+    def _body(self) -> AnyContainer:
+        _, self._visible = self._walk()
+        rows: List[AnyContainer] = []
+        for interaction, answers, field in self._visible:
+            message = to_value(interaction.message, answers, str)
+            if isinstance(interaction, BasicQuestion):
+                message = f"{message} [{to_value(interaction.default, answers, str)}]"
+            rows.append(Label(message))
+            if field is not None:
+                rows.append(field.widget)
+                if isinstance(field, _TextField) and field.error is not None:
+                    rows.append(Label(field.error, style="class:validation-toolbar"))
+            rows.append(Window(height=1))
+        rows.append(self._submit)
+        return HSplit(rows)
+
+    def _focusable(self) -> List[AnyContainer]:
+        widgets = [field.widget for _, _, field in self._visible if field is not None]
+        return [*widgets, self._submit]
+
+    def _ensure_focus(self, _: object) -> None:
+        # a field that is hidden because of another answer can't keep the focus
+        layout = self._app.layout
+        widgets = self._focusable()
+        if not any(layout.has_focus(widget) for widget in widgets):
+            layout.focus(widgets[0])
+
+    def _move_focus(self, offset: int) -> None:
+        # Based on the latest answers, instead of the fields that were last drawn. Otherwise, keys that are pressed
+        # before the screen is redrawn would skip fields that were just shown.
+        _, self._visible = self._walk()
+        layout = self._app.layout
+        widgets = self._focusable()
+        for index, widget in enumerate(widgets):
+            if layout.has_focus(widget):
+                layout.focus(widgets[(index + offset) % len(widgets)])
+                return
+        layout.focus(widgets[0])
+
+    def _on_submit(self) -> None:
+        answers, self._visible = self._walk()
+        try:
+            invalid = [
+                field
+                for _, _, field in self._visible
+                if isinstance(field, _TextField) and not field.validate()
+            ]
+        except ValueError as ex:
+            self._app.exit(exception=ex)
+            return
+        if invalid:
+            self._app.layout.focus(invalid[0].widget)
+        else:
+            self._app.exit(result=answers)
+
+
+def get_answers_form(
+    interactions: Collection[Interaction],
+    answers: Optional[Answers] = None,
+    io: Optional[user_io.IOContext] = None,
+) -> MutableAnswers:
+    """
+    Present every interaction that should be asked on a single screen, instead of prompting for one answer at a time.
+
+    The interactions are shown in order. As the user changes an answer, the interactions are re-evaluated so that those
+    that should no longer be asked are hidden and those that should now be asked are shown. The user moves between the
+    questions using TAB & SHIFT+TAB, and presses the submit button once all the answers are correct. The answers are
+    the same as `get_answers()` would produce for the same responses.
+
+    :param interactions: Collection of interactions to present the user with.
+    :param answers: An initial dictionary of answers to start from. If the value is a `SlotAnswers`, the result will
+        be a `SlotAnswers` that uses the same layout.
+    :param io: The input & output used to interact with the user. If `None`, the active prompt-toolkit app session
+        (the terminal, by default) is used. Timeouts are not applied to the form.
+    :return: Dictionary of answers.
+    :raises DuplicateQuestionNameException: One of the given questions attempted to reuse a name. When a value is
+        provided for `answers`, those are considered as well.
+    :raises ValueError: One of the given `Interaction`s was not a valid type or was misconfigured in some way. Or the
+        layout used by `answers` does not have a slot for one of the questions.
+    :raises KeyboardInterrupt: The user pressed CTRL+C.
+    """
+    validate_duplicate_question_names(interactions, answers)
+    initial = copy_answers(interactions, answers)
+    with user_io.using(io):
+        return _Form(interactions, initial).run()
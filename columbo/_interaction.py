@@ -1,23 +1,34 @@
 import re
+import threading
 from abc import ABC, abstractmethod
 from enum import Enum
+from functools import singledispatch
 from typing import (
     Collection,
     Generic,
+    Iterable,
+    Iterator,
     Mapping,
     Optional,
+    Tuple,
     Type,
     TypeGuard,
     TypeVar,
     Union,
     cast,
+    overload,
 )
 
 from columbo import _user_io as user_io
+from columbo._actions import BackgroundActions
+from columbo._answers import AnswerLayout, FrozenAnswers, SlotAnswers
+from columbo._completer import CompletionIndex
+from columbo._condition import Condition
 from columbo._exception import DuplicateQuestionNameException
 from columbo._types import (
     Answer,
     Answers,
+    Completions,
     MutableAnswers,
     Options,
     ShouldAsk,
@@ -32,6 +43,8 @@ from columbo._types import (
 QuestionValue = TypeVar("QuestionValue", str, bool)
 # Explicitly list each possible question value to prevent making the type alias generic
 Interaction = Union["Displayable", "Question[bool]", "Question[str]"]
+# Held while the static completions of a question are indexed
+_completion_index_lock = threading.Lock()
 
 
 # Used by copy() implementations. Since some arguments can be None, None can't be used as the value to indicate that the
@@ -59,11 +72,17 @@ def _should_ask_or_display(should_ask: Optional[ShouldAsk], answers: Answers) ->
     raise ValueError(f"Invalid value for should_ask: {should_ask}")
 
 
+def _as_condition(should_ask: Optional[ShouldAsk]) -> Optional[Condition]:
+    return should_ask if isinstance(should_ask, Condition) else None
+
+
 class Displayable(ABC):
     """
     Base class for a message to the user that is displayed.
     """
 
+    __slots__ = ("_message", "_should_ask")
+
     def __init__(
         self, message: StaticOrDynamicValue[str], should_ask: Optional[ShouldAsk] = None
     ) -> None:
@@ -78,6 +97,14 @@ class Displayable(ABC):
         self._message = message
         self._should_ask = should_ask
 
+    @property
+    def message(self) -> StaticOrDynamicValue[str]:
+        return self._message
+
+    @property
+    def should_ask_condition(self) -> Optional[Condition]:
+        return _as_condition(self._should_ask)
+
     @abstractmethod
     def display(
         self, answers: Answers, no_user_input: bool = False
@@ -91,6 +118,21 @@ class Displayable(ABC):
         """
         pass
 
+    async def display_async(
+        self, answers: Answers, no_user_input: bool = False
+    ) -> None:
+        """
+        Display a message to the user, without blocking the event loop while waiting for the user to interact.
+
+        Subclasses that override `display()` must also override this to be used by `get_answers_async()`.
+
+        :param answers: The answers that have been provided this far.
+        :param no_user_input: If `True` the message will be displayed without waiting for the user to interact.
+            Default: `False`
+        :raises ValueError: The message can't be displayed without blocking the event loop.
+        """
+        raise ValueError(_no_async_message(self, "display"))
+
     def should_ask(self, answers: Answers) -> bool:
         """
         Should the user be displayed this message.
@@ -105,6 +147,8 @@ class Displayable(ABC):
 class Echo(Displayable):
     """Display a message to the user."""
 
+    __slots__ = ()
+
     def __init__(
         self, message: StaticOrDynamicValue[str], should_ask: Optional[ShouldAsk] = None
     ) -> None:
@@ -128,6 +172,18 @@ class Echo(Displayable):
         """
         user_io.echo(to_value(self._message, answers, str))
 
+    async def display_async(
+        self, answers: Answers, no_user_input: bool = False
+    ) -> None:
+        """
+        Display a message to the user. The same as `display()`, because there is nothing to wait for.
+
+        :param answers: The answers that have been provided this far.
+        :param no_user_input: Has no effect because no user input is expected. Default: `False`
+        :raises ValueError: The value for `message` did not have the correct type.
+        """
+        user_io.echo(to_value(self._message, answers, str))
+
     def copy(
         self,
         *,
@@ -152,6 +208,8 @@ class Echo(Displayable):
 class Acknowledge(Displayable):
     """Display a message to the user and require the user to press ENTER to continue."""
 
+    __slots__ = ()
+
     def __init__(
         self, message: StaticOrDynamicValue[str], should_ask: Optional[ShouldAsk] = None
     ) -> None:
@@ -178,6 +236,21 @@ class Acknowledge(Displayable):
             to_value(self._message, answers, str), no_user_input=no_user_input
         )
 
+    async def display_async(
+        self, answers: Answers, no_user_input: bool = False
+    ) -> None:
+        """
+        Display a message to the user and wait for the user to press ENTER, without blocking the event loop.
+
+        :param answers: The answers that have been provided this far.
+        :param no_user_input: If `True` the message will be displayed without waiting for the user to interact.
+            Default: `False`
+        :raises ValueError: The value for `message` did not have the correct type.
+        """
+        await user_io.acknowledge_async(
+            to_value(self._message, answers, str), no_user_input=no_user_input
+        )
+
     def copy(
         self,
         *,
@@ -204,6 +277,15 @@ class Question(ABC, Generic[QuestionValue]):
     Base class for a prompt to the user that produces an answer.
     """
 
+    __slots__ = (
+        "_name",
+        "_message",
+        "_cli_help",
+        "_should_ask",
+        "_value_if_not_asked",
+        "_timeout",
+    )
+
     def __init__(
         self,
         name: str,
@@ -211,6 +293,7 @@ class Question(ABC, Generic[QuestionValue]):
         cli_help: Optional[str] = None,
         should_ask: Optional[ShouldAsk] = None,
         value_if_not_asked: Optional[QuestionValue] = None,
+        timeout: Optional[float] = None,
     ) -> None:
         """
         Initialize an instance.
@@ -223,7 +306,10 @@ class Question(ABC, Generic[QuestionValue]):
             have been provided this far and should return `True` if the question should be asked.
         :param value_if_not_asked: If provided and if should_ask is being used, this value will be recorded as an answer
             if should_ask evaluates to False.
-        :raises ValueError: A value for `value_if_not_asked` was given without giving a value for `should_ask`.
+        :param timeout: The number of seconds to wait for the user to answer before the default value is used. If
+            `None`, the timeout of the `IOContext` being used applies, if there is one.
+        :raises ValueError: A value for `value_if_not_asked` was given without giving a value for `should_ask`. Or the
+            value for `timeout` was not positive.
         """
         self._name = name
         self._message = message
@@ -238,10 +324,18 @@ class Question(ABC, Generic[QuestionValue]):
         self._should_ask = should_ask
         self._value_if_not_asked: Optional[QuestionValue] = value_if_not_asked
 
+        if timeout is not None and timeout <= 0:
+            raise ValueError(f"timeout must be positive: {timeout}")
+        self._timeout = timeout
+
     @property
     def name(self) -> str:
         return self._name
 
+    @property
+    def message(self) -> StaticOrDynamicValue[str]:
+        return self._message
+
     @property
     def cli_help(self) -> Optional[str]:
         return self._cli_help
@@ -250,6 +344,14 @@ class Question(ABC, Generic[QuestionValue]):
     def value_if_not_asked(self) -> Optional[QuestionValue]:
         return self._value_if_not_asked
 
+    @property
+    def timeout(self) -> Optional[float]:
+        return self._timeout
+
+    @property
+    def should_ask_condition(self) -> Optional[Condition]:
+        return _as_condition(self._should_ask)
+
     @abstractmethod
     def ask(
         self, answers: Answers, no_user_input: bool = False
@@ -264,6 +366,20 @@ class Question(ABC, Generic[QuestionValue]):
         """
         pass
 
+    async def ask_async(self, answers: Answers, no_user_input: bool = False) -> Answer:
+        """
+        Prompt the user with this question, without blocking the event loop while waiting for the answer.
+
+        Subclasses that override `ask()` must also override this to be used by `get_answers_async()`.
+
+        :param answers: The answers that have been provided this far.
+        :param no_user_input: If `True` the default value for the question will be used without waiting for the user
+            to provide an answer. Default: `False`
+        :return: The answer to the question.
+        :raises ValueError: The question can't be asked without blocking the event loop.
+        """
+        raise ValueError(_no_async_message(self, "ask"))
+
     def should_ask(self, answers: Answers) -> bool:
         """
         Should the user be asked this question.
@@ -280,6 +396,8 @@ class Confirm(Question[bool]):
     A question with a yes or no answer.
     """
 
+    __slots__ = ("_default",)
+
     def __init__(
         self,
         name: str,
@@ -288,6 +406,7 @@ class Confirm(Question[bool]):
         cli_help: Optional[str] = None,
         should_ask: Optional[ShouldAsk] = None,
         value_if_not_asked: Optional[bool] = None,
+        timeout: Optional[float] = None,
     ) -> None:
         """
         Initialize an instance.
@@ -302,8 +421,10 @@ class Confirm(Question[bool]):
             have been provided this far and should return `True` if the question should be asked.
         :param value_if_not_asked: If provided and if should_ask is being used, this value will be recorded as an answer
             if should_ask evaluates to False.
+        :param timeout: The number of seconds to wait for the user to answer before the default value is used. If
+            `None`, the timeout of the `IOContext` being used applies, if there is one.
         :raises ValueError: A value for `value_if_not_asked` was given without giving a value for `should_ask` or the
-            value for `value_if_not_asked` is not a `bool`.
+            value for `value_if_not_asked` is not a `bool`. Or the value for `timeout` was not positive.
         """
         if value_if_not_asked is not None and not isinstance(value_if_not_asked, bool):
             raise ValueError("value_if_not_asked must be a bool")
@@ -313,6 +434,7 @@ class Confirm(Question[bool]):
             cli_help=cli_help,
             should_ask=should_ask,
             value_if_not_asked=value_if_not_asked,
+            timeout=timeout,
         )
         self._default = default
 
@@ -334,6 +456,24 @@ class Confirm(Question[bool]):
             to_value(self._message, answers, str),
             default=to_value(self._default, answers, bool),
             no_user_input=no_user_input,
+            timeout=self._timeout,
+        )
+
+    async def ask_async(self, answers: Answers, no_user_input: bool = False) -> bool:
+        """
+        Prompt the user with this question, without blocking the event loop while waiting for the answer.
+
+        :param answers: The answers that have been provided this far.
+        :param no_user_input: If `True` the default value for the question will be used without waiting for the user
+            to provide an answer. Default: `False`
+        :return: The answer to the question.
+        :raises ValueError: The instance was misconfigured in some way.
+        """
+        return await user_io.confirm_async(
+            to_value(self._message, answers, str),
+            default=to_value(self._default, answers, bool),
+            no_user_input=no_user_input,
+            timeout=self._timeout,
         )
 
     def copy(
@@ -345,6 +485,7 @@ class Confirm(Question[bool]):
         cli_help: Possible[Optional[str]] = _NOT_GIVEN,
         should_ask: Possible[Optional[ShouldAsk]] = _NOT_GIVEN,
         value_if_not_asked: Possible[Optional[bool]] = _NOT_GIVEN,
+        timeout: Possible[Optional[float]] = _NOT_GIVEN,
     ) -> "Confirm":
         """
         Create a new instance like this one, potentially with different values.
@@ -359,6 +500,8 @@ class Confirm(Question[bool]):
             have been provided this far and should return `True` if the question should be asked.
         :param value_if_not_asked: If provided and if should_ask is being used, this value will be recorded as an answer
             if should_ask evaluates to False.
+        :param timeout: The number of seconds to wait for the user to answer before the default value is used. If
+            `None`, the timeout of the `IOContext` being used applies, if there is one.
         :return: A newly constructed instance with the given values in place of the values of this instance.
         """
         return Confirm(
@@ -370,6 +513,7 @@ class Confirm(Question[bool]):
             value_if_not_asked=_or_default(
                 value_if_not_asked, self._value_if_not_asked
             ),
+            timeout=_or_default(timeout, self._timeout),
         )
 
 
@@ -378,6 +522,8 @@ class Choice(Question[str]):
     A question with a set of possible answers.
     """
 
+    __slots__ = ("_options", "_default")
+
     def __init__(
         self,
         name: str,
@@ -387,6 +533,7 @@ class Choice(Question[str]):
         cli_help: Optional[str] = None,
         should_ask: Optional[ShouldAsk] = None,
         value_if_not_asked: Optional[str] = None,
+        timeout: Optional[float] = None,
     ) -> None:
         """
         Initialize an instance.
@@ -404,8 +551,11 @@ class Choice(Question[str]):
             have been provided this far and should return `True` if the question should be asked.
         :param value_if_not_asked: If provided and if should_ask is being used, this value will be recorded as an answer
             if should_ask evaluates to False.
+        :param timeout: The number of seconds to wait for the user to answer before the default value is used. If
+            `None`, the timeout of the `IOContext` being used applies, if there is one.
         :raises ValueError: A value for `value_if_not_asked` was given without giving a value for `should_ask`. Or the
-            given value for `value_if_not_asked` was not one of the options.
+            given value for `value_if_not_asked` was not one of the options. Or the value for `timeout` was not
+            positive.
         """
         super().__init__(
             name,
@@ -413,6 +563,7 @@ class Choice(Question[str]):
             cli_help=cli_help,
             should_ask=should_ask,
             value_if_not_asked=value_if_not_asked,
+            timeout=timeout,
         )
 
         self._options = options
@@ -455,6 +606,25 @@ class Choice(Question[str]):
             to_labeled_options(self._options, answers),
             default=to_value(self._default, answers, str),
             no_user_input=no_user_input,
+            timeout=self._timeout,
+        )
+
+    async def ask_async(self, answers: Answers, no_user_input: bool = False) -> str:
+        """
+        Prompt the user with this question, without blocking the event loop while waiting for the answer.
+
+        :param answers: The answers that have been provided this far.
+        :param no_user_input: If `True` the default value for the question will be used without waiting for the user
+            to provide an answer. Default: `False`
+        :return: The answer to the question.
+        :raises ValueError: The instance was misconfigured in some way.
+        """
+        return await user_io.multiple_choice_async(
+            to_value(self._message, answers, str),
+            to_labeled_options(self._options, answers),
+            default=to_value(self._default, answers, str),
+            no_user_input=no_user_input,
+            timeout=self._timeout,
         )
 
     def copy(
@@ -467,6 +637,7 @@ class Choice(Question[str]):
         cli_help: Possible[Optional[str]] = _NOT_GIVEN,
         should_ask: Possible[Optional[ShouldAsk]] = _NOT_GIVEN,
         value_if_not_asked: Possible[Optional[str]] = _NOT_GIVEN,
+        timeout: Possible[Optional[float]] = _NOT_GIVEN,
     ) -> "Choice":
         """
         Create a new instance like this one, potentially with different values.
@@ -483,6 +654,8 @@ class Choice(Question[str]):
             have been provided this far and should return `True` if the question should be asked.
         :param value_if_not_asked: If provided and if should_ask is being used, this value will be recorded as an answer
             if should_ask evaluates to False.
+        :param timeout: The number of seconds to wait for the user to answer before the default value is used. If
+            `None`, the timeout of the `IOContext` being used applies, if there is one.
         :return: A newly constructed instance with the given values in place of the values of this instance.
         """
         return Choice(
@@ -495,6 +668,7 @@ class Choice(Question[str]):
             value_if_not_asked=_or_default(
                 value_if_not_asked, self._value_if_not_asked
             ),
+            timeout=_or_default(timeout, self._timeout),
         )
 
 
@@ -503,6 +677,8 @@ class BasicQuestion(Question[str]):
     A question with an arbitrary text answer.
     """
 
+    __slots__ = ("_default", "_validator", "_completions", "_completion_index")
+
     def __init__(
         self,
         name: str,
@@ -512,6 +688,8 @@ class BasicQuestion(Question[str]):
         should_ask: Optional[ShouldAsk] = None,
         validator: Optional[Validator] = None,
         value_if_not_asked: Optional[str] = None,
+        timeout: Optional[float] = None,
+        completions: Optional[Completions] = None,
     ) -> None:
         """
         Initialize an instance.
@@ -528,7 +706,14 @@ class BasicQuestion(Question[str]):
             A ValidationSuccess object indicates success and a ValidationFailure object indicates failure.
         :param value_if_not_asked: If provided and if should_ask is being used, this value will be recorded as an answer
             if should_ask evaluates to False.
-        :raises ValueError: A value for `value_if_not_asked` was given without giving a value for `should_ask`.
+        :param timeout: The number of seconds to wait for the user to answer before the default value is used. If
+            `None`, the timeout of the `IOContext` being used applies, if there is one.
+        :param completions: Values offered to the user while they type the answer. The answer is not required to be one
+            of these values. If the value is callable, the argument passed in will be the answers that have been
+            provided this far and the result is read each time the question is asked. Otherwise, the values are read
+            once, when the question is created, so an iterator (such as a generator) can be given.
+        :raises ValueError: A value for `value_if_not_asked` was given without giving a value for `should_ask`. Or the
+            value for `timeout` was not positive. Or the value for `completions` did not have the correct type.
         """
         super().__init__(
             name,
@@ -536,14 +721,31 @@ class BasicQuestion(Question[str]):
             cli_help=cli_help,
             should_ask=should_ask,
             value_if_not_asked=value_if_not_asked,
+            timeout=timeout,
         )
         self._default = default
         self._validator = validator
+        # static completions are read now, so that an iterator gives the same values to copies of the question
+        self._completions: Optional[Completions] = (
+            completions
+            if completions is None or callable(completions)
+            else tuple(_completion_values(completions))
+        )
+        # the index of static completions, once the question (or a copy of it) has been asked
+        self._completion_index: Optional[CompletionIndex] = None
 
     @property
     def default(self) -> StaticOrDynamicValue[str]:
         return self._default
 
+    @property
+    def validator(self) -> Optional[Validator]:
+        return self._validator
+
+    @property
+    def completions(self) -> Optional[Completions]:
+        return self._completions
+
     def validate(self, value: str, answers: Answers) -> ValidationResponse:
         """Validate the value (a new answer).
 
@@ -574,12 +776,16 @@ class BasicQuestion(Question[str]):
 
         message = to_value(self._message, answers, str)
         default_value = to_value(self._default, answers, str)
+        completer = None if no_user_input else prompt_completer(self, answers)
         # ask question until answer is valid
         while True:
             answer = user_io.ask(
                 message,
                 default=default_value,
                 no_user_input=no_user_input,
+                validator=prompt_validator(self, answers),
+                timeout=self._timeout,
+                completer=completer,
             )
 
             result = self.validate(answer, answers)
@@ -591,11 +797,46 @@ class BasicQuestion(Question[str]):
                     f"Default value '{default_value}' must satisfy the validator."
                 )
 
-            user_io.echo(
-                f"The answer you have provided is not valid:\n{result.error}\n\n"
-                "We will continue asking questions until you provide a valid answer"
+            user_io.echo(invalid_answer_message(result.error))
+
+        return answer
+
+    async def ask_async(self, answers: Answers, no_user_input: bool = False) -> str:
+        """
+        Prompt the user with this question, without blocking the event loop while waiting for the answer.
+
+        :param answers: The answers that have been provided this far.
+        :param no_user_input: If `True` the default value for the question will be used without waiting for the user
+            to provide an answer. Default: `False`
+        :return: The answer to the question.
+        :raises ValueError: Default value did not satisfy the validator. Or the instance was misconfigured in some way.
+        """
+
+        message = to_value(self._message, answers, str)
+        default_value = to_value(self._default, answers, str)
+        completer = None if no_user_input else prompt_completer(self, answers)
+        # ask question until answer is valid, in the same way as ask()
+        while True:
+            answer = await user_io.ask_async(
+                message,
+                default=default_value,
+                no_user_input=no_user_input,
+                validator=prompt_validator(self, answers),
+                timeout=self._timeout,
+                completer=completer,
             )
 
+            result = self.validate(answer, answers)
+            if result.valid:
+                break
+
+            if answer == default_value:
+                raise ValueError(
+                    f"Default value '{default_value}' must satisfy the validator."
+                )
+
+            user_io.echo(invalid_answer_message(result.error))
+
         return answer
 
     def copy(
@@ -608,6 +849,8 @@ class BasicQuestion(Question[str]):
         should_ask: Possible[Optional[ShouldAsk]] = _NOT_GIVEN,
         validator: Possible[Optional[Validator]] = _NOT_GIVEN,
         value_if_not_asked: Possible[Optional[str]] = _NOT_GIVEN,
+        timeout: Possible[Optional[float]] = _NOT_GIVEN,
+        completions: Possible[Optional[Completions]] = _NOT_GIVEN,
     ) -> "BasicQuestion":
         """
         Create a new instance like this one, potentially with different values.
@@ -625,9 +868,13 @@ class BasicQuestion(Question[str]):
             of the error that caused the validation failure.
         :param value_if_not_asked: If provided and if should_ask is being used, this value will be recorded as an answer
             if should_ask evaluates to False.
+        :param timeout: The number of seconds to wait for the user to answer before the default value is used. If
+            `None`, the timeout of the `IOContext` being used applies, if there is one.
+        :param completions: Values offered to the user while they type the answer. If the value is callable, the
+            argument passed in will be the answers that have been provided this far.
         :return: A newly constructed instance with the given values in place of the values of this instance.
         """
-        return BasicQuestion(
+        question = BasicQuestion(
             _or_default(name, self._name),
             _or_default(message, self._message),
             _or_default(default, self._default),
@@ -637,7 +884,13 @@ class BasicQuestion(Question[str]):
             value_if_not_asked=_or_default(
                 value_if_not_asked, self._value_if_not_asked
             ),
+            timeout=_or_default(timeout, self._timeout),
+            completions=_or_default(completions, self._completions),
         )
+        if completions is _NOT_GIVEN:
+            # the completions are the same, so the index is shared instead of being built again
+            question._completion_index = self._completion_index
+        return question
 
 
 def to_value(
@@ -664,54 +917,291 @@ def to_labeled_options(
     raise ValueError("Invalid options type")
 
 
+@overload
+def get_answers(  # type: ignore[overload-overlap]
+    interactions: Collection[Interaction],
+    answers: FrozenAnswers,
+    no_user_input: bool = False,
+    io: Optional[user_io.IOContext] = None,
+    actions: Optional[BackgroundActions] = None,
+) -> FrozenAnswers:  # pragma: no cover
+    pass
+
+
+@overload
 def get_answers(
     interactions: Collection[Interaction],
     answers: Optional[Answers] = None,
     no_user_input: bool = False,
-) -> MutableAnswers:
+    io: Optional[user_io.IOContext] = None,
+    actions: Optional[BackgroundActions] = None,
+) -> MutableAnswers:  # pragma: no cover
+    pass
+
+
+def get_answers(
+    interactions: Collection[Interaction],
+    answers: Optional[Answers] = None,
+    no_user_input: bool = False,
+    io: Optional[user_io.IOContext] = None,
+    actions: Optional[BackgroundActions] = None,
+) -> Union[MutableAnswers, FrozenAnswers]:
     """
     Iterates over collection of interactions, invoking interaction specific behavior.
 
     :param interactions: Collection of interactions to present the user with.
-    :param answers: An initial dictionary of answers to start from.
+    :param answers: An initial dictionary of answers to start from. If the value is a `SlotAnswers`, the result will
+        be a `SlotAnswers` that uses the same layout. If the value is a `FrozenAnswers`, each dynamic value is given
+        an immutable snapshot of the answers and the result will be a `FrozenAnswers`.
     :param no_user_input: If `True` the default value for the question will be used without waiting for the user
-        to provide an answer. Default: `False`
+        to provide an answer. The user can also press ALT+ENTER in any prompt to use the default values for that
+        interaction & all that follow. Default: `False`
+    :param io: The input & output used to interact with the user. If `None`, the active prompt-toolkit app session
+        (the terminal, by default) is used. Calls that run concurrently should each be given their own context.
+    :param actions: Actions to start in the background as soon as the answers they depend on are recorded. The
+        actions are not joined, so they may still be running when this returns.
     :return: Dictionary of answers.
     :raises DuplicateQuestionNameException: One of the given questions attempted to reuse a name. When a value is
         provided for `answers`, those are considered as well.
-    :raises ValueError: One of the given `Interaction`s was not a valid type or was misconfigured in some way.
+    :raises ValueError: One of the given `Interaction`s was not a valid type or was misconfigured in some way. Or the
+        layout used by `answers` does not have a slot for one of the questions.
     """
     validate_duplicate_question_names(interactions, answers)
-    result = {} if answers is None else dict(answers)
+    # a context is always used, so that the user can choose to accept the defaults for the remaining interactions
+    with user_io.using(io):
+        return _get_answers(interactions, answers, no_user_input, actions)
 
-    for interaction in interactions:
-        if isinstance(interaction, (Echo, Acknowledge)):
-            if interaction.should_ask(result):
-                interaction.display(result)
-        elif _is_question(interaction):
-            if interaction.should_ask(result):
-                result[interaction.name] = interaction.ask(result, no_user_input)
-            elif interaction.value_if_not_asked is not None:
-                result[interaction.name] = _validate_value_if_not_asked(
-                    interaction.value_if_not_asked, interaction, result
-                )
-        else:
-            raise ValueError(f"Unsupported interaction type: {type(interaction)}")
 
+def _get_answers(
+    interactions: Collection[Interaction],
+    answers: Optional[Answers],
+    no_user_input: bool,
+    actions: Optional[BackgroundActions],
+) -> Union[MutableAnswers, FrozenAnswers]:
+    result = _initial_answers(interactions, answers)
+    for name, _, result in _walk(interactions, result, no_user_input):
+        if actions is not None:
+            actions.answer_recorded(name, result)
     return result
 
 
-def _is_question(
+def _initial_answers(
+    interactions: Collection[Interaction], answers: Optional[Answers]
+) -> Union[MutableAnswers, FrozenAnswers]:
+    # a FrozenAnswers is never modified, so it doesn't need to be copied
+    if isinstance(answers, FrozenAnswers):
+        return answers
+    return copy_answers(interactions, answers)
+
+
+def _walk(
+    interactions: Collection[Interaction],
+    answers: Union[MutableAnswers, FrozenAnswers],
+    no_user_input: bool,
+) -> Iterator[Tuple[str, Answer, Union[MutableAnswers, FrozenAnswers]]]:
+    """
+    Present each interaction in turn, recording each answer.
+
+    :param answers: The answers to start from. A `MutableAnswers` is updated with each answer. A `FrozenAnswers` is
+        replaced by a new snapshot that includes each answer.
+    :return: Iterator of the name & value of each answer, along with the answers that include it.
+    """
+    for interaction in interactions:
+        answer = _interact(interaction, answers, no_user_input)
+        if answer is not None:
+            name, value = answer
+            if isinstance(answers, FrozenAnswers):
+                answers = answers.set(name, value)
+            else:
+                answers[name] = value
+            yield name, value, answers
+
+
+def iter_answers(
+    interactions: Collection[Interaction],
+    answers: Optional[Answers] = None,
+    no_user_input: bool = False,
+    io: Optional[user_io.IOContext] = None,
+) -> Iterator[Tuple[str, Answer]]:
+    """
+    Iterates over collection of interactions in the same way as `get_answers()`, producing each answer as soon as it
+    is recorded.
+
+    The next interaction is only presented to the user when the next answer is requested, so the caller can start
+    working with an answer before the remaining questions are asked.
+
+    :param interactions: Collection of interactions to present the user with.
+    :param answers: An initial dictionary of answers to start from. These are made available to the interactions, but
+        are not produced. If the value is a `FrozenAnswers`, each dynamic value is given an immutable snapshot of the
+        answers.
+    :param no_user_input: If `True` the default value for the question will be used without waiting for the user
+        to provide an answer. Default: `False`
+    :param io: The input & output used to interact with the user. If `None`, the active prompt-toolkit app session
+        (the terminal, by default) is used.
+    :return: Iterator of the name & value of each answer, in the order they are recorded. This includes the values
+        recorded using `value_if_not_asked`.
+    :raises DuplicateQuestionNameException: One of the given questions attempted to reuse a name. When a value is
+        provided for `answers`, those are considered as well.
+    :raises ValueError: The layout used by `answers` does not have a slot for one of the questions. Or, while
+        iterating, one of the given `Interaction`s was not a valid type or was misconfigured in some way.
+    """
+    # validated before the first answer is requested, so that misconfiguration is reported immediately
+    validate_duplicate_question_names(interactions, answers)
+    if io is None:
+        io = user_io.IOContext()
+    return _iter_answers(
+        _walk(interactions, _initial_answers(interactions, answers), no_user_input),
+        io,
+    )
+
+
+def _iter_answers(
+    steps: Iterator[Tuple[str, Answer, Answers]], io: user_io.IOContext
+) -> Iterator[Tuple[str, Answer]]:
+    while True:
+        # The context is only used while interacting, so that it doesn't apply to the caller's code between answers
+        with user_io.using(io):
+            step = next(steps, None)
+        if step is None:
+            return
+        name, value, _ = step
+        yield name, value
+
+
+def _interact(
+    interaction: Interaction, answers: Answers, no_user_input: bool
+) -> Optional[Tuple[str, Answer]]:
+    """
+    Invoke the behavior specific to the interaction.
+
+    :return: The name and value of the answer that should be recorded. `None` if no answer should be recorded.
+    """
+    if isinstance(interaction, (Echo, Acknowledge)):
+        if interaction.should_ask(answers):
+            interaction.display(answers)
+    elif is_question(interaction):
+        if interaction.should_ask(answers):
+            if no_user_input or user_io.defaults_accepted():
+                return interaction.name, answer_without_input(interaction, answers)
+            return interaction.name, interaction.ask(answers)
+        if interaction.value_if_not_asked is not None:
+            return interaction.name, validate_value_if_not_asked(
+                interaction.value_if_not_asked, interaction, answers
+            )
+    else:
+        raise ValueError(f"Unsupported interaction type: {type(interaction)}")
+    return None
+
+
+async def interact_async(
+    interaction: Interaction, answers: Answers, no_user_input: bool
+) -> Optional[Tuple[str, Answer]]:
+    """
+    Invoke the behavior specific to the interaction in the same way as `_interact()`, without blocking the event loop
+    while waiting for the user.
+
+    :return: The name and value of the answer that should be recorded. `None` if no answer should be recorded.
+    :raises ValueError: The interaction was not a valid type, was misconfigured in some way or overrides how it is
+        presented without overriding how it is presented without blocking the event loop.
+    """
+    if isinstance(interaction, (Echo, Acknowledge)):
+        if interaction.should_ask(answers):
+            _check_async_override(interaction, "display")
+            await interaction.display_async(answers, no_user_input)
+    elif is_question(interaction):
+        if interaction.should_ask(answers):
+            if no_user_input or user_io.defaults_accepted():
+                return interaction.name, answer_without_input(interaction, answers)
+            _check_async_override(interaction, "ask")
+            return interaction.name, await interaction.ask_async(answers)
+        if interaction.value_if_not_asked is not None:
+            return interaction.name, validate_value_if_not_asked(
+                interaction.value_if_not_asked, interaction, answers
+            )
+    else:
+        raise ValueError(f"Unsupported interaction type: {type(interaction)}")
+    return None
+
+
+def _check_async_override(interaction: object, method: str) -> None:
+    """
+    Check that the async variant of a method comes from the same class as the method, or a subclass of it.
+
+    Otherwise, the async variant of a base class would silently replace how a subclass is presented.
+
+    :raises ValueError: The interaction overrides the method without overriding the async variant.
+    """
+    mro = type(interaction).__mro__
+    defined_by = next(cls for cls in mro if method in vars(cls))
+    async_defined_by = next(cls for cls in mro if f"{method}_async" in vars(cls))
+    if not issubclass(async_defined_by, defined_by):
+        raise ValueError(_no_async_message(interaction, method))
+
+
+def _no_async_message(interaction: object, method: str) -> str:
+    return (
+        f"{type(interaction).__name__} overrides {method}() without overriding {method}_async(), so it can't be "
+        "presented without blocking the event loop"
+    )
+
+
+# The ask() of each question that _default_answer() produces the same answer as, when the user isn't asked
+_DEFAULT_ASKS = frozenset([Confirm.ask, Choice.ask, BasicQuestion.ask])
+
+
+def answer_without_input(question: Question[QuestionValue], answers: Answers) -> Answer:
+    """
+    Produce the answer a question would have when the user isn't asked, without constructing a prompt.
+
+    :return: The default value of the question.
+    :raises ValueError: The default value is not a valid answer. Or the instance was misconfigured in some way.
+    """
+    if type(question).ask not in _DEFAULT_ASKS:
+        # questions defined outside of columbo, including subclasses that change how they are asked, only know how to
+        # answer themselves
+        answer: Answer = question.ask(answers, no_user_input=True)
+        return answer
+    return _default_answer(question, answers)
+
+
+@singledispatch
+def _default_answer(question: object, answers: Answers) -> Answer:
+    raise ValueError(f"Unsupported interaction type {type(question)}")
+
+
+@_default_answer.register
+def _answer_confirm_without_input(question: Confirm, answers: Answers) -> Answer:
+    return to_value(question.default, answers, bool)
+
+
+@_default_answer.register
+def _answer_choice_without_input(question: Choice, answers: Answers) -> Answer:
+    default_value = to_value(question.default, answers, str)
+    options = to_labeled_options(question.options, answers)
+    if default_value not in options:
+        raise ValueError(f"""Default "{default_value}" was not an option {options}""")
+    return default_value
+
+
+@_default_answer.register
+def _answer_basic_without_input(question: BasicQuestion, answers: Answers) -> Answer:
+    default_value = to_value(question.default, answers, str)
+    if not question.validate(default_value, answers).valid:
+        raise ValueError(f"Default value '{default_value}' must satisfy the validator.")
+    return default_value
+
+
+def is_question(
     value: Union[Question[QuestionValue], object],
 ) -> TypeGuard[Question[QuestionValue]]:
     # preserve generic type information
     return isinstance(value, Question)
 
 
-def _validate_value_if_not_asked(
+def validate_value_if_not_asked(
     value_if_not_asked: QuestionValue,
     interaction: Question[QuestionValue],
-    current_answers: MutableAnswers,
+    current_answers: Answers,
 ) -> QuestionValue:
     if isinstance(interaction, (BasicQuestion, Choice)):
         validation_result = interaction.validate(value_if_not_asked, current_answers)
@@ -720,6 +1210,69 @@ def _validate_value_if_not_asked(
     return value_if_not_asked
 
 
+def prompt_validator(
+    question: "BasicQuestion", answers: Answers
+) -> Optional[user_io.LiveValidator]:
+    """
+    Produce the validator that checks the answer to the question while the user types it.
+
+    :return: The validator for the prompt. `None` if the question doesn't have a validator.
+    """
+    if question.validator is None:
+        return None
+
+    def check(text: str) -> Optional[str]:
+        # no input means the default is used, which is validated once the user is done with the prompt
+        if text == "":
+            return None
+        result = question.validate(text, answers)
+        return None if result.valid else result.error
+
+    return user_io.LiveValidator(check)
+
+
+def prompt_completer(
+    question: "BasicQuestion", answers: Answers
+) -> Optional[CompletionIndex]:
+    """
+    Produce the completer that offers values to the user while they type the answer to the question.
+
+    Static completions are indexed the first time the question is asked and the index is reused each time the
+    question, or a copy of it with the same completions, is asked. Dynamic completions are indexed each time the
+    question is asked, since they depend on the answers.
+
+    :return: The completer for the prompt. `None` if the question doesn't have completions.
+    :raises ValueError: The result of dynamic completions did not have the correct type.
+    """
+    completions = question.completions
+    if completions is None:
+        return None
+    if callable(completions):
+        return CompletionIndex(_completion_values(completions(answers)))
+
+    with _completion_index_lock:
+        # the lock makes sure that the values are only indexed once, when questions are asked by multiple threads
+        if question._completion_index is None:
+            question._completion_index = CompletionIndex(completions)
+        return question._completion_index
+
+
+def _completion_values(values: object) -> Iterator[str]:
+    if isinstance(values, str) or not isinstance(values, Iterable):
+        raise ValueError(f"Invalid completions: {values}")
+    for value in values:
+        if not isinstance(value, str):
+            raise ValueError(f"Invalid completion: {value}")
+        yield value
+
+
+def invalid_answer_message(error: str) -> str:
+    return (
+        f"The answer you have provided is not valid:\n{error}\n\n"
+        "We will continue asking questions until you provide a valid answer"
+    )
+
+
 def canonical_arg_name(name: str) -> str:
     sanitized_name = name.lower().replace(" ", "-").replace("_", "-").strip("-")
     # remove any duplicate dashes ("foo--bar" becomes "foo-bar")
@@ -746,3 +1299,60 @@ def validate_duplicate_question_names(
                     f"{interaction.name} has already been used"
                 )
             used_names.update(name_variants)
+
+
+def answer_layout(
+    interactions: Collection[Interaction], answers: Optional[Answers] = None
+) -> AnswerLayout:
+    """
+    Assign a slot to each question so that answers can be stored in a `SlotAnswers`.
+
+    :param interactions: Collection of interactions that will produce answers.
+    :param answers: Initial answers that will also be stored. These are assigned slots before the questions.
+    :return: A layout that can store the answer to every question.
+    :raises DuplicateQuestionNameException: One of the given questions attempted to reuse a name. When a value is
+        provided for `answers`, those are considered as well.
+    """
+    validate_duplicate_question_names(interactions, answers)
+    names = [] if answers is None else list(answers.keys())
+    names.extend(_question_names(interactions))
+    return AnswerLayout(names)
+
+
+def copy_answers(
+    interactions: Collection[Interaction], answers: Optional[Answers] = None
+) -> MutableAnswers:
+    """
+    Create the mutable answers that will be populated by processing the given interactions.
+
+    :param interactions: Collection of interactions that will produce answers.
+    :param answers: Initial answers to copy. If the value is a `SlotAnswers`, the copy uses the same layout.
+    :return: A mutable copy of the answers.
+    :raises ValueError: The layout used by `answers` does not have a slot for one of the questions.
+    """
+    if isinstance(answers, SlotAnswers):
+        missing = [
+            name for name in _question_names(interactions) if name not in answers.layout
+        ]
+        if missing:
+            raise ValueError(f"Answer layout does not have a slot for: {missing}")
+        return answers.copy()
+    return {} if answers is None else dict(answers)
+
+
+def _question_names(interactions: Collection[Interaction]) -> list[str]:
+    return [
+        interaction.name
+        for interaction in interactions
+        if isinstance(interaction, Question)
+    ]
+
+
+def is_always_asked(interaction: Interaction) -> bool:
+    """
+    Determine if an interaction is presented regardless of the answers.
+
+    :param interaction: The interaction to check.
+    :return: `True` if no value was given for `should_ask`.
+    """
+    return interaction._should_ask is None
@@ -0,0 +1,167 @@
+"""
+Resolve many sets of answers from the command line, using `python -m columbo`.
+"""
+
+import importlib
+import json
+import sys
+from argparse import ArgumentParser
+from contextlib import ExitStack
+from pathlib import Path
+from typing import Collection, Iterable, List, Optional, Sequence, TextIO
+
+from columbo._definition import load_interactions
+from columbo._exception import DuplicateQuestionNameException
+from columbo._interaction import (
+    Displayable,
+    Interaction,
+    Question,
+    validate_duplicate_question_names,
+)
+from columbo._validation import AnswerError, read_jsonl, replay_answers
+
+_DEFINITION_SUFFIXES = (".json", ".toml")
+_DESCRIPTION = """
+Resolve sets of answers using a list of interactions, without prompting the user. Each line of the input is a JSON
+object of answers. For each line, the interactions are replayed using those answers: questions without an answer use
+their default value, and questions that should not be asked use their value_if_not_asked. The resolved answers are
+written as one JSON object per line. Lines with invalid answers are reported on stderr instead.
+"""
+
+
+def main(
+    argv: Optional[Sequence[str]] = None,
+    stdin: Optional[TextIO] = None,
+    stdout: Optional[TextIO] = None,
+    stderr: Optional[TextIO] = None,
+) -> int:
+    """
+    Run the command line program.
+
+    :param argv: The command line arguments. If `None`, `sys.argv` will be used.
+    :param stdin: Where the answers are read from, when a file is not given. If `None`, `sys.stdin` will be used.
+    :param stdout: Where the answers are written to, when a file is not given. If `None`, `sys.stdout` will be used.
+    :param stderr: Where errors are written to. If `None`, `sys.stderr` will be used.
+    :return: The exit status. `0` if every set of answers was valid, otherwise `1`.
+    :raises SystemExit: The command line arguments were not valid.
+    """
+    parser = _create_parser()
+    args = parser.parse_args(argv)
+    try:
+        if Path(args.interactions).suffix.lower() in _DEFINITION_SUFFIXES:
+            interactions = load_interactions(args.interactions, args.cache_dir)
+        else:
+            interactions = import_interactions(args.interactions)
+    except (OSError, ValueError, DuplicateQuestionNameException) as ex:
+        parser.error(str(ex))
+
+    with ExitStack() as stack:
+        try:
+            source = (
+                (sys.stdin if stdin is None else stdin)
+                if args.input is None
+                else stack.enter_context(open(args.input, encoding="utf-8"))
+            )
+            destination = (
+                (sys.stdout if stdout is None else stdout)
+                if args.output is None
+                else stack.enter_context(open(args.output, "w", encoding="utf-8"))
+            )
+        except OSError as ex:
+            parser.error(str(ex))
+        valid = resolve_lines(
+            interactions, source, destination, sys.stderr if stderr is None else stderr
+        )
+    return 0 if valid else 1
+
+
+def import_interactions(spec: str) -> List[Interaction]:
+    """
+    Import a collection of interactions.
+
+    :param spec: The module & attribute that holds the interactions, as `module:attribute`. The attribute may be a
+        dotted path (`package.module:Class.attribute`).
+    :return: The interactions.
+    :raises ValueError: The spec was not valid, the module could not be imported, or the attribute was not a
+        collection of interactions.
+    """
+    module_name, separator, attribute_path = spec.partition(":")
+    if not separator or not module_name or not attribute_path:
+        raise ValueError(f"Interactions must be given as 'module:attribute': {spec}")
+    try:
+        value: object = importlib.import_module(module_name)
+        for attribute in attribute_path.split("."):
+            value = getattr(value, attribute)
+    except (ImportError, AttributeError) as ex:
+        raise ValueError(f"Unable to load interactions from '{spec}': {ex}") from ex
+
+    if isinstance(value, (str, bytes)) or not isinstance(value, Collection):
+        raise ValueError(f"'{spec}' is not a collection of interactions")
+    interactions: List[Interaction] = []
+    for item in value:
+        if not isinstance(item, (Displayable, Question)):
+            raise ValueError(f"Unsupported interaction type: {type(item)}")
+        interactions.append(item)
+    validate_duplicate_question_names(interactions)
+    return interactions
+
+
+def resolve_lines(
+    interactions: Collection[Interaction],
+    lines: Iterable[str],
+    output: TextIO,
+    errors: TextIO,
+) -> bool:
+    """
+    Resolve each set of answers in a stream of JSON Lines, one line at a time.
+
+    :param interactions: The interactions to replay for each set of answers.
+    :param lines: Each non-blank line is a JSON object of answers.
+    :param output: Where the resolved answers are written, one JSON object per line.
+    :param errors: Where a message is written for each line that is not valid.
+    :return: `True` if every line was valid.
+    :raises ValueError: One of the given `Interaction`s was not a valid type or was misconfigured in some way.
+    """
+    valid = True
+    for line_number, answers in read_jsonl(lines):
+        if isinstance(answers, AnswerError):
+            answer_errors = [answers]
+        else:
+            resolved, answer_errors = replay_answers(interactions, answers)
+        if answer_errors:
+            valid = False
+            for error in answer_errors:
+                errors.write(f"line {line_number}: {_describe(error)}\n")
+        else:
+            output.write(json.dumps(resolved, separators=(",", ":")))
+            output.write("\n")
+    return valid
+
+
+def _describe(error: AnswerError) -> str:
+    return error.error if error.name is None else f"{error.name}: {error.error}"
+
+
+def _create_parser() -> ArgumentParser:
+    parser = ArgumentParser(prog="python -m columbo", description=_DESCRIPTION)
+    parser.add_argument(
+        "interactions",
+        help="The interactions to use, as 'module:attribute' (ex: my_app.questions:INTERACTIONS) or the path to a "
+        "JSON or TOML definition file.",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        help="Directory to store TOML definition files as JSON in, so that a TOML file is only parsed once. JSON "
+        "definition files are always read directly.",
+    )
+    parser.add_argument(
+        "--input",
+        "-i",
+        help="JSON Lines file to read the answers from. Default: stdin",
+    )
+    parser.add_argument(
+        "--output",
+        "-o",
+        help="File to write the resolved answers to. Default: stdout",
+    )
+    return parser
@@ -0,0 +1,86 @@
+"""
+Present interactions to many users at once, using a single asyncio event loop.
+"""
+
+from typing import Callable, Dict, Optional, Sequence
+
+from prompt_toolkit.contrib.telnet.server import TelnetConnection, TelnetServer
+
+from columbo import _user_io as user_io
+from columbo._interaction import (
+    Interaction,
+    copy_answers,
+    interact_async,
+    validate_duplicate_question_names,
+)
+from columbo._types import Answer, Answers
+
+DEFAULT_TELNET_PORT = 2323
+
+
+async def get_answers_async(
+    interactions: Sequence[Interaction],
+    answers: Optional[Answers] = None,
+    no_user_input: bool = False,
+    io: Optional[user_io.IOContext] = None,
+) -> Dict[str, Answer]:
+    """
+    Iterates over a sequence of interactions, without blocking the event loop while waiting for the user.
+
+    Many calls can run concurrently on the same event loop, as long as each one uses its own input & output. Either
+    give each call its own `io`, or run each call within its own prompt-toolkit app session (see
+    `prompt_toolkit.application.create_app_session()`).
+
+    :param interactions: Sequence of interactions to present the user with.
+    :param answers: An initial dictionary of answers to start from.
+    :param no_user_input: If `True` the default value for the question will be used without waiting for the user
+        to provide an answer. The user can also press ALT+ENTER in any prompt to use the default values for that
+        interaction & all that follow. Default: `False`
+    :param io: The input & output used to interact with the user. If `None`, the input & output of the prompt-toolkit
+        app session that is active when this is called.
+    :return: Dictionary of answers.
+    :raises DuplicateQuestionNameException: One of the given questions attempted to reuse a name. When a value is
+        provided for `answers`, those are considered as well.
+    :raises ValueError: One of the given `Interaction`s was not a valid type or was misconfigured in some way. Or one
+        of them overrides `ask()` or `display()` without overriding `ask_async()` or `display_async()`.
+    """
+    validate_duplicate_question_names(interactions, answers)
+    result = copy_answers(interactions, answers)
+    with user_io.using(io):
+        for interaction in interactions:
+            answer = await interact_async(interaction, result, no_user_input)
+            if answer is not None:
+                name, value = answer
+                result[name] = value
+    return dict(result)
+
+
+async def serve_telnet(
+    interactions: Sequence[Interaction],
+    host: str = "127.0.0.1",
+    port: int = DEFAULT_TELNET_PORT,
+    on_answers: Optional[Callable[[Dict[str, Answer]], None]] = None,
+    ready: Optional[Callable[[], None]] = None,
+) -> None:
+    """
+    Present the interactions to each client that connects using telnet, until cancelled.
+
+    Each connection is handled by a lightweight task on the running event loop, instead of a thread or process.
+    Connections are accepted by prompt-toolkit, which only allows a few connections to wait to be accepted. When many
+    clients connect at the same moment, some of them have to retry.
+
+    :param interactions: Sequence of interactions to present to each client.
+    :param host: The address to listen on.
+    :param port: The port to listen on.
+    :param on_answers: Called with the answers each time a client answers all the questions. Clients that disconnect
+        before answering all the questions are ignored.
+    :param ready: Called once the server is listening for connections.
+    """
+
+    async def interact(_: TelnetConnection) -> None:
+        # A client that disconnects causes an EOFError, which is handled by the server
+        answers = await get_answers_async(interactions)
+        if on_answers is not None:
+            on_answers(answers)
+
+    await TelnetServer(host=host, port=port, interact=interact).run(ready_cb=ready)
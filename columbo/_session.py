@@ -0,0 +1,252 @@
+"""
+Process interactions one step at a time, so that a flow can be driven by something other than a terminal.
+"""
+
+import hashlib
+import json
+from functools import singledispatch
+from typing import Dict, Optional, Sequence, Union
+
+from columbo._interaction import (
+    Acknowledge,
+    BasicQuestion,
+    Choice,
+    Confirm,
+    Echo,
+    Interaction,
+    Question,
+    answer_without_input,
+    copy_answers,
+    is_question,
+    validate_duplicate_question_names,
+    validate_value_if_not_asked,
+)
+from columbo._types import (
+    Answer,
+    Answers,
+    ValidationFailure,
+    ValidationResponse,
+    ValidationSuccess,
+)
+
+# Incremented when the format of the state changes in a way that older versions can't read
+_STATE_VERSION = 1
+
+
+class Session:
+    """
+    A resumable run of a sequence of interactions.
+
+    Unlike `get_answers()`, a session doesn't prompt the user. Instead, the caller retrieves the next interaction to
+    present using `next_interaction()` and provides the user's response using `submit()`. The progress of the session
+    can be saved as a small string using `state` and later continued by a different process using `Session.resume()`.
+    """
+
+    __slots__ = ("_interactions", "_answers", "_position")
+
+    def __init__(
+        self, interactions: Sequence[Interaction], answers: Optional[Answers] = None
+    ) -> None:
+        """
+        Initialize an instance that starts at the first interaction.
+
+        :param interactions: The interactions to present to the user, in order.
+        :param answers: An initial dictionary of answers to start from.
+        :raises DuplicateQuestionNameException: One of the given questions attempted to reuse a name. When a value is
+            provided for `answers`, those are considered as well.
+        :raises ValueError: The layout used by `answers` does not have a slot for one of the questions. Or one of the
+            interactions before the first one to present was not a valid type or was misconfigured in some way.
+        """
+        validate_duplicate_question_names(interactions, answers)
+        self._interactions = interactions
+        self._answers = copy_answers(interactions, answers)
+        self._position = 0
+        self._advance()
+
+    @classmethod
+    def resume(cls, interactions: Sequence[Interaction], state: str) -> "Session":
+        """
+        Continue a session from a previously saved state.
+
+        :param interactions: The interactions that were used to create the session that produced the state.
+        :param state: The value of `state` for the session to continue.
+        :return: A session with the same progress & answers as the one that produced the state.
+        :raises DuplicateQuestionNameException: One of the given questions attempted to reuse a name.
+        :raises ValueError: The state is not valid or was produced using different interactions. Or one of the
+            interactions was not a valid type or was misconfigured in some way.
+        """
+        try:
+            data = json.loads(state)
+            version = data["version"]
+            fingerprint = data["fingerprint"]
+            position = data["position"]
+            answers = data["answers"]
+        except (ValueError, TypeError, KeyError) as ex:
+            raise ValueError("Invalid session state") from ex
+
+        if version != _STATE_VERSION:
+            raise ValueError(f"Unsupported session state version: {version}")
+        if fingerprint != _fingerprint(interactions):
+            raise ValueError("Session state was produced using different interactions")
+        if (
+            not isinstance(position, int)
+            or not 0 <= position <= len(interactions)
+            or not isinstance(answers, dict)
+            or not all(isinstance(value, (bool, str)) for value in answers.values())
+        ):
+            raise ValueError("Invalid session state")
+
+        validate_duplicate_question_names(interactions)
+        # the answers include those for the questions, so they are not given as initial answers. The session is only
+        # advanced once they are restored, because the interactions being skipped may depend on any of them.
+        session = cls.__new__(cls)
+        session._interactions = interactions
+        session._answers = dict(answers)
+        session._position = position
+        session._advance()
+        return session
+
+    @property
+    def state(self) -> str:
+        """
+        The progress & answers of the session, which can be given to `Session.resume()`.
+
+        The value can be stored anywhere a string can be stored. The interactions themselves are not included, so the
+        same interactions must be given when the session is resumed.
+        """
+        return json.dumps(
+            {
+                "version": _STATE_VERSION,
+                "fingerprint": _fingerprint(self._interactions),
+                "position": self._position,
+                "answers": dict(self._answers),
+            },
+            separators=(",", ":"),
+        )
+
+    @property
+    def answers(self) -> Dict[str, Answer]:
+        """A copy of the answers that have been provided this far."""
+        return dict(self._answers)
+
+    @property
+    def done(self) -> bool:
+        """`True` if there are no more interactions to present to the user."""
+        return self._position == len(self._interactions)
+
+    def next_interaction(self) -> Optional[Interaction]:
+        """
+        Get the interaction that should be presented to the user.
+
+        Calling this repeatedly without calling `submit()` produces the same interaction.
+
+        :return: The interaction to present. `None` if there are no more interactions.
+        """
+        return None if self.done else self._interactions[self._position]
+
+    def _advance(self) -> None:
+        """
+        Skip the interactions that should not be asked, recording `value_if_not_asked` for questions in the same way as
+        `get_answers()`.
+
+        :raises ValueError: One of the given `Interaction`s was not a valid type or was misconfigured in some way.
+        """
+        while self._position < len(self._interactions):
+            interaction = self._interactions[self._position]
+            if isinstance(interaction, (Echo, Acknowledge)):
+                if interaction.should_ask(self._answers):
+                    return
+            elif is_question(interaction):
+                if interaction.should_ask(self._answers):
+                    return
+                if interaction.value_if_not_asked is not None:
+                    self._answers[interaction.name] = validate_value_if_not_asked(
+                        interaction.value_if_not_asked, interaction, self._answers
+                    )
+            else:
+                raise ValueError(f"Unsupported interaction type: {type(interaction)}")
+            self._position += 1
+
+    def submit(self, answer: Optional[Answer] = None) -> ValidationResponse:
+        """
+        Provide the user's response to the current interaction and move to the next one that should be presented.
+
+        The interactions in between that should not be asked are skipped, recording `value_if_not_asked` for questions
+        in the same way as `get_answers()`.
+
+        :param answer: The answer to the current question. If `None`, the default value for the question is used.
+            Must be `None` when the current interaction is a message.
+        :return: `ValidationSuccess` if the answer was recorded. `ValidationFailure` if the answer was not valid, in
+            which case the session remains on the same question.
+        :raises ValueError: There are no more interactions. Or an answer was given for a message. Or no answer was given
+            and the default value is not valid, in the same way as `get_answers()`. Or one of the interactions was not a
+            valid type or was misconfigured in some way.
+        """
+        interaction = self.next_interaction()
+        if interaction is None:
+            raise ValueError("Session does not have any remaining interactions")
+        if isinstance(interaction, Question):
+            value = to_answer(interaction, answer, self._answers)
+            if isinstance(value, ValidationFailure):
+                return value
+            self._answers[interaction.name] = value
+        elif answer is not None:
+            raise ValueError("An answer can not be given for a message")
+        self._position += 1
+        self._advance()
+        return ValidationSuccess()
+
+
+@singledispatch
+def to_answer(
+    question: object, answer: object, answers: Answers
+) -> Union[Answer, ValidationFailure]:
+    """
+    Check an answer that was given without prompting the user.
+
+    :param question: The question that was answered.
+    :param answer: The answer to check. If `None`, the default value for the question is used.
+    :param answers: The answers that were given before the question.
+    :return: The value to record, or the reason the answer is not valid.
+    :raises ValueError: The question was not a valid type. Or no answer was given and the default value is not valid.
+    """
+    raise ValueError(f"Unsupported interaction type {type(question)}")
+
+
+@to_answer.register
+def _to_answer_confirm(
+    question: Confirm, answer: object, answers: Answers
+) -> Union[Answer, ValidationFailure]:
+    if answer is None:
+        return answer_without_input(question, answers)
+    if not isinstance(answer, bool):
+        return ValidationFailure(error=f"Answer must be a bool: {answer!r}")
+    return answer
+
+
+# singledispatch for >=3.7 can use type annotations, but support for Union requires =>3.11
+@to_answer.register(BasicQuestion)
+@to_answer.register(Choice)
+def _to_answer_validate(
+    question: Union[BasicQuestion, Choice],
+    answer: object,
+    answers: Answers,
+) -> Union[Answer, ValidationFailure]:
+    if answer is None:
+        return answer_without_input(question, answers)
+    if not isinstance(answer, str):
+        return ValidationFailure(error=f"Answer must be a string: {answer!r}")
+    result = question.validate(answer, answers)
+    return answer if result.valid else result
+
+
+def _fingerprint(interactions: Sequence[Interaction]) -> str:
+    # Identifies the structure of the interactions, so that state isn't resumed using different interactions
+    shape = [
+        [
+            type(interaction).__name__,
+            interaction.name if isinstance(interaction, Question) else None,
+        ]
+        for interaction in interactions
+    ]
+    return hashlib.sha256(json.dumps(shape).encode()).hexdigest()[:16]
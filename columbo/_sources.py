@@ -0,0 +1,155 @@
+"""
+Read answers from sources other than command line arguments, such as environment variables & files.
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Collection, Dict, Mapping, Optional, Union
+
+from columbo._exception import CliException
+from columbo._interaction import Confirm, Interaction, canonical_arg_name, is_question
+from columbo._types import Answer
+
+AnswerFile = Union[str, "os.PathLike[str]"]
+
+_TRUE_VALUES = frozenset(["1", "true", "yes", "y", "on"])
+_FALSE_VALUES = frozenset(["0", "false", "no", "n", "off"])
+
+
+def resolve_values(
+    interactions: Collection[Interaction],
+    cli_values: Mapping[str, Optional[Answer]],
+    env_prefix: Optional[str] = None,
+    answer_file: Optional[AnswerFile] = None,
+) -> Dict[str, Answer]:
+    """
+    Determine the value given for each question, using the first source that provides one.
+
+    The sources are checked in the following order: command line arguments, environment variables, the answer file.
+
+    :param interactions: The interactions to determine the values for.
+    :param cli_values: The values parsed from the command line arguments, by question name. `None` if not given.
+    :param env_prefix: If not `None`, the value for a question is read from the environment variable named by
+        `env_var_name()`.
+    :param answer_file: If not `None`, a JSON or TOML file that contains a single object, which is read once. The value
+        for a question is read from the key that has the same canonical form as the name of the question (`--my-name`
+        matches `my-name`, `my_name` & `my name`).
+    :return: The values that were given, by question name. Questions without a value are not included.
+    :raises CliException: The answer file could not be read. Or a value had the wrong type for its question.
+    """
+    file_values = {} if answer_file is None else _read_answer_file(answer_file)
+
+    values: Dict[str, Answer] = {}
+    for interaction in interactions:
+        if not is_question(interaction):
+            continue
+        cli_value = cli_values.get(interaction.name)
+        if cli_value is not None:
+            values[interaction.name] = cli_value
+            continue
+        if env_prefix is not None:
+            variable = env_var_name(env_prefix, interaction.name)
+            env_value = os.environ.get(variable)
+            if env_value is not None:
+                values[interaction.name] = _to_value(interaction, env_value, variable)
+                continue
+        key = canonical_arg_name(interaction.name)
+        if file_values.get(key) is not None:
+            values[interaction.name] = _to_value(interaction, file_values[key], key[2:])
+    return values
+
+
+def env_var_name(prefix: str, name: str) -> str:
+    """
+    Produce the name of the environment variable that holds the value for a question.
+
+    :param prefix: Text added to the start of each name, such as `MY_APP_`.
+    :param name: The name of the question.
+    :return: The canonical argument name of the question, in upper case with underscores (`my name` is `MY_NAME`).
+    """
+    return prefix + canonical_arg_name(name)[2:].replace("-", "_").upper()
+
+
+def _read_answer_file(path: AnswerFile) -> Dict[str, object]:
+    try:
+        content = Path(path).read_bytes()
+    except OSError as ex:
+        raise CliException(f"Unable to read answer file '{path}': {ex}") from ex
+
+    try:
+        if Path(path).suffix.lower() == ".toml":
+            data = load_toml(content)
+        else:
+            data = json.loads(content)
+    except ValueError as ex:
+        raise CliException(f"Unable to parse answer file '{path}': {ex}") from ex
+    if not isinstance(data, dict):
+        raise CliException(f"Answer file '{path}' must contain a single object")
+    return _canonical_keys(path, data)
+
+
+def _canonical_keys(path: AnswerFile, data: Dict[object, object]) -> Dict[str, object]:
+    """
+    Key the values of an answer file using the names of the arguments they are for.
+
+    :raises CliException: Two keys are for the same argument, such as `my_name` & `my-name`.
+    """
+    values: Dict[str, object] = {}
+    keys: Dict[str, str] = {}
+    for key, value in data.items():
+        name = canonical_arg_name(str(key))
+        if name in keys:
+            raise CliException(
+                f"Answer file '{path}' contains both '{keys[name]}' & '{key}', which are for the same argument"
+            )
+        keys[name] = str(key)
+        values[name] = value
+    return values
+
+
+def load_toml(content: bytes) -> object:
+    """
+    Parse the content of a TOML file.
+
+    :raises ImportError: The Python version doesn't include `tomllib` and `tomli` is not installed.
+    :raises ValueError: The content is not valid TOML.
+    """
+    if sys.version_info >= (3, 11):
+        import tomllib
+    else:  # pragma: no cover
+        try:
+            import tomli as tomllib
+        except ImportError as ex:
+            raise ImportError(
+                "Reading TOML answer files requires tomli on Python 3.10. Install it using: pip install 'columbo[toml]'"
+            ) from ex
+    # tomllib.TOMLDecodeError is a ValueError
+    return tomllib.loads(content.decode())
+
+
+def _to_value(question: object, value: object, source_name: str) -> Answer:
+    """
+    Convert a value that was read from an environment variable or file to the type of answer for the question.
+
+    :raises CliException: The value can not be converted.
+    """
+    if isinstance(question, Confirm):
+        if isinstance(value, bool):
+            return value
+        text = str(value).strip().lower()
+        if text in _TRUE_VALUES:
+            return True
+        if text in _FALSE_VALUES:
+            return False
+        raise CliException.invalid_value(
+            str(value), source_name, "Must be true or false"
+        )
+
+    if isinstance(value, str):
+        return value
+    # numbers are common in config files, but other values can't be sensibly converted to text
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return str(value)
+    raise CliException.invalid_value(str(value), source_name, "Must be a string")
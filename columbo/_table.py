@@ -0,0 +1,333 @@
+"""
+Compact storage for the answers produced by many runs of the same interactions.
+"""
+
+from abc import ABC, abstractmethod
+from array import array
+from typing import (
+    Collection,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from columbo._interaction import (
+    BasicQuestion,
+    Choice,
+    Confirm,
+    Interaction,
+    Question,
+    validate_duplicate_question_names,
+)
+from columbo._types import Answer, Answers
+
+# Typecodes used to store category codes, from smallest to largest
+_CODE_TYPES = ("B", "H", "L")
+
+
+class AnswerTable:
+    """
+    Answers for many runs of the same interactions, stored with one column per question.
+
+    The storage used by each column depends on the type of question:
+
+    * `Confirm` answers are packed as bits.
+    * `Choice` answers are stored as the index of the selected option. Values that are not one of the static options
+        (such as those from dynamic options) are assigned the next available index.
+    * `BasicQuestion` answers are stored in a single contiguous buffer of text.
+
+    Answers for names that are not questions (such as the initial answers given to `get_answers()`) are stored as is.
+
+    Rows can only be appended, so the row views produced by the table remain valid as the table grows.
+    """
+
+    __slots__ = ("_columns", "_length")
+
+    def __init__(
+        self, interactions: Collection[Interaction], rows: Iterable[Answers] = ()
+    ) -> None:
+        """
+        Initialize an instance.
+
+        :param interactions: The interactions that produce the answers to be stored. These determine how the answer to
+            each question is stored.
+        :param rows: Optional sets of answers to append to the table.
+        :raises DuplicateQuestionNameException: One of the given questions attempted to reuse a name.
+        :raises ValueError: One of the rows contained an answer that is not valid for the question.
+        """
+        validate_duplicate_question_names(interactions)
+        self._columns: Dict[str, _Column] = {
+            interaction.name: _column_for(interaction)
+            for interaction in interactions
+            if isinstance(interaction, Question)
+        }
+        self._length = 0
+        self.extend(rows)
+
+    @property
+    def names(self) -> Tuple[str, ...]:
+        return tuple(self._columns)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: int) -> "AnswerRow":
+        """
+        Get a view of the answers in a single row.
+
+        :param index: The index of the row. Negative values count from the end of the table.
+        :return: A view of the answers in the row.
+        :raises IndexError: The table does not contain a row at the index.
+        """
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("row index out of range")
+        return AnswerRow(self, index)
+
+    def __iter__(self) -> Iterator["AnswerRow"]:
+        return (AnswerRow(self, index) for index in range(self._length))
+
+    def append(self, answers: Answers) -> None:
+        """
+        Add a set of answers to the end of the table.
+
+        :param answers: The answers to add.
+        :raises ValueError: One of the answers is not valid for the question. The table is not modified.
+        """
+        new_names = [name for name in answers if name not in self._columns]
+        for name, column in self._columns.items():
+            value = answers.get(name)
+            if value is not None and not column.accepts(value):
+                raise ValueError(f"Invalid value for {name}: {value!r}")
+        for name in new_names:
+            self._columns[name] = _ObjectColumn(self._length)
+        for name, column in self._columns.items():
+            column.append(answers.get(name))
+        self._length += 1
+
+    def extend(self, rows: Iterable[Answers]) -> None:
+        """
+        Add multiple sets of answers to the end of the table.
+
+        :param rows: The answers to add.
+        :raises ValueError: One of the answers is not valid for the question. The rows before the invalid row are
+            added.
+        """
+        for answers in rows:
+            self.append(answers)
+
+    def column(self, name: str) -> List[Optional[Answer]]:
+        """
+        Get the answers to a question for every row.
+
+        :param name: The name of the question.
+        :return: The answer in each row. `None` is used for rows that do not have an answer.
+        :raises KeyError: The table does not contain answers for the name.
+        """
+        column = self._columns[name]
+        return [column.get(index) for index in range(self._length)]
+
+    def _get(self, name: str, index: int) -> Optional[Answer]:
+        column = self._columns.get(name)
+        return None if column is None else column.get(index)
+
+
+class AnswerRow(Answers):
+    """A read-only view of the answers stored in a single row of an `AnswerTable`."""
+
+    __slots__ = ("_table", "_index")
+
+    def __init__(self, table: AnswerTable, index: int) -> None:
+        """
+        Initialize an instance.
+
+        :param table: The table that stores the answers.
+        :param index: The index of the row in the table.
+        """
+        self._table = table
+        self._index = index
+
+    def __getitem__(self, key: str) -> Answer:
+        value = self._table._get(key, self._index)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return (
+            name
+            for name in self._table.names
+            if self._table._get(name, self._index) is not None
+        )
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self._table._get(key, self._index) is not None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+    def to_dict(self) -> Dict[str, Answer]:
+        """
+        Convert the answers to a dictionary.
+
+        :return: A dictionary that contains each answer in the row.
+        """
+        return {
+            name: value
+            for name in self._table.names
+            if (value := self._table._get(name, self._index)) is not None
+        }
+
+
+class _Column(ABC):
+    __slots__ = ()
+
+    @abstractmethod
+    def accepts(self, value: Answer) -> bool:  # pragma: no cover
+        pass
+
+    @abstractmethod
+    def append(self, value: Optional[Answer]) -> None:  # pragma: no cover
+        pass
+
+    @abstractmethod
+    def get(self, index: int) -> Optional[Answer]:  # pragma: no cover
+        pass
+
+
+class _Bits:
+    """A growable sequence of bits, packed eight to a byte."""
+
+    __slots__ = ("_data", "_length")
+
+    def __init__(self) -> None:
+        self._data = bytearray()
+        self._length = 0
+
+    def append(self, bit: bool) -> None:
+        offset = self._length & 7
+        if offset == 0:
+            self._data.append(0)
+        if bit:
+            self._data[-1] |= 1 << offset
+        self._length += 1
+
+    def __getitem__(self, index: int) -> bool:
+        return bool(self._data[index >> 3] >> (index & 7) & 1)
+
+
+class _BoolColumn(_Column):
+    __slots__ = ("_present", "_values")
+
+    def __init__(self) -> None:
+        self._present = _Bits()
+        self._values = _Bits()
+
+    def accepts(self, value: Answer) -> bool:
+        return isinstance(value, bool)
+
+    def append(self, value: Optional[Answer]) -> None:
+        self._present.append(value is not None)
+        self._values.append(value is True)
+
+    def get(self, index: int) -> Optional[Answer]:
+        return self._values[index] if self._present[index] else None
+
+
+class _CategoryColumn(_Column):
+    __slots__ = ("_categories", "_codes", "_values")
+
+    def __init__(self, categories: Sequence[str]) -> None:
+        self._categories: List[str] = []
+        self._codes: Dict[str, int] = {}
+        # 0 marks a missing answer, so the code for a category is its index + 1
+        self._values = array(_CODE_TYPES[0])
+        for category in categories:
+            self._code(category)
+
+    def accepts(self, value: Answer) -> bool:
+        return isinstance(value, str)
+
+    def append(self, value: Optional[Answer]) -> None:
+        # the code is assigned first because assigning it may replace the array
+        code = 0 if value is None else self._code(str(value))
+        self._values.append(code)
+
+    def get(self, index: int) -> Optional[Answer]:
+        code = self._values[index]
+        return None if code == 0 else self._categories[code - 1]
+
+    def _code(self, category: str) -> int:
+        code = self._codes.get(category)
+        if code is None:
+            self._categories.append(category)
+            code = self._codes[category] = len(self._categories)
+            if code >= 1 << (self._values.itemsize * 8):
+                self._widen()
+        return code
+
+    def _widen(self) -> None:
+        typecode = _CODE_TYPES[_CODE_TYPES.index(self._values.typecode) + 1]
+        self._values = array(typecode, self._values)
+
+
+class _TextColumn(_Column):
+    __slots__ = ("_buffer", "_offsets", "_present")
+
+    def __init__(self) -> None:
+        # UTF-8 encoded text for every row. Row i is stored between _offsets[i] & _offsets[i + 1].
+        self._buffer = bytearray()
+        self._offsets = array("Q", [0])
+        self._present = _Bits()
+
+    def accepts(self, value: Answer) -> bool:
+        return isinstance(value, str)
+
+    def append(self, value: Optional[Answer]) -> None:
+        self._present.append(value is not None)
+        if value is not None:
+            self._buffer += str(value).encode()
+        self._offsets.append(len(self._buffer))
+
+    def get(self, index: int) -> Optional[Answer]:
+        if not self._present[index]:
+            return None
+        start = self._offsets[index]
+        end = self._offsets[index + 1]
+        return self._buffer[start:end].decode()
+
+
+class _ObjectColumn(_Column):
+    __slots__ = ("_values",)
+
+    def __init__(self, length: int = 0) -> None:
+        self._values: List[Optional[Answer]] = [None] * length
+
+    def accepts(self, value: Answer) -> bool:
+        return True
+
+    def append(self, value: Optional[Answer]) -> None:
+        self._values.append(value)
+
+    def get(self, index: int) -> Optional[Answer]:
+        return self._values[index]
+
+
+def _column_for(question: Union[Question[bool], Question[str]]) -> _Column:
+    if isinstance(question, Confirm):
+        return _BoolColumn()
+    if isinstance(question, Choice):
+        options = question.options
+        return _CategoryColumn([] if callable(options) else list(options))
+    if isinstance(question, BasicQuestion):
+        return _TextColumn()
+    return _ObjectColumn()
@@ -1,7 +1,17 @@
 """Type aliases used by the public API"""
 
 from dataclasses import dataclass
-from typing import Callable, List, Literal, Mapping, MutableMapping, TypeVar, Union
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Literal,
+    Mapping,
+    MutableMapping,
+    TypeVar,
+    Union,
+)
 
 
 @dataclass
@@ -22,6 +32,11 @@ OptionList = List[str]
 Options = Union[List[str], Mapping[str, str]]
 V = TypeVar("V")
 StaticOrDynamicValue = Union[V, Callable[[Answers], V]]
+Completions = StaticOrDynamicValue[Iterable[str]]
 ShouldAsk = Callable[[Answers], bool]
 ValidationResponse = Union[ValidationSuccess, ValidationFailure]
 Validator = Callable[[str, Answers], ValidationResponse]
+AnswerAction = Callable[[Answer, Answers], object]
+ConditionData = Dict[
+    str, Union[Answer, List[Answer], List["ConditionData"], "ConditionData"]
+]
@@ -2,16 +2,198 @@
 Helpful wrappers for prompt-toolkit functionality.
 """
 
-from typing import Mapping, Optional
+import asyncio
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Dict, Iterator, Mapping, Optional, Tuple, TypeVar
 
 from prompt_toolkit import shortcuts
-from prompt_toolkit.formatted_text import merge_formatted_text
-from prompt_toolkit.key_binding.key_bindings import KeyBindings
+from prompt_toolkit.application import create_app_session, get_app
+from prompt_toolkit.buffer import Buffer
+from prompt_toolkit.completion import Completer, ThreadedCompleter
+from prompt_toolkit.document import Document
+from prompt_toolkit.eventloop import run_in_executor_with_context
+from prompt_toolkit.formatted_text import AnyFormattedText, merge_formatted_text
+from prompt_toolkit.input import Input
+from prompt_toolkit.key_binding.key_bindings import (
+    KeyBindings,
+    KeyBindingsBase,
+    merge_key_bindings,
+)
 from prompt_toolkit.key_binding.key_processor import KeyPressEvent
 from prompt_toolkit.keys import Keys
-from prompt_toolkit.validation import Validator
+from prompt_toolkit.output import Output
+from prompt_toolkit.validation import ValidationError, Validator
 
 _NO_INPUT = ""
+# Seconds the user must pause typing before the text is validated, so that validators don't run for every keystroke
+_LIVE_VALIDATION_DELAY = 0.15
+# Pressed (ALT+ENTER) in any prompt to use the default values for the current & remaining interactions
+ACCEPT_DEFAULTS_KEYS = ("escape", "enter")
+T = TypeVar("T")
+
+
+class IOContext:
+    """
+    The input & output used to interact with the user during a single call to `get_answers()`.
+
+    Each context is only used by the call it is given to, so calls that run concurrently (in different threads, for
+    example) don't share any state used to interact with the user. A context must not be given to multiple calls that
+    run at the same time.
+    """
+
+    __slots__ = (
+        "_input",
+        "_output",
+        "_timeout",
+        "_defaults_accepted",
+        "_text_session",
+        "_confirm_session",
+        "_confirm_bindings",
+    )
+
+    def __init__(
+        self,
+        input: Optional[Input] = None,
+        output: Optional[Output] = None,
+        timeout: Optional[float] = None,
+    ) -> None:
+        """
+        Initialize an instance.
+
+        :param input: Where the responses from the user are read from. If `None`, the input of the prompt-toolkit app
+            session that is active when the context is used.
+        :param output: Where the messages to the user are written to. If `None`, the output of the prompt-toolkit app
+            session that is active when the context is used.
+        :param timeout: The number of seconds to wait for the user to respond to each prompt before the default value
+            is used. Questions that have their own timeout use that instead. If `None`, the prompts wait indefinitely.
+        :raises ValueError: The value for `timeout` was not positive.
+        """
+        if timeout is not None and timeout <= 0:
+            raise ValueError(f"timeout must be positive: {timeout}")
+        self._input = input
+        self._output = output
+        self._timeout = timeout
+        self._defaults_accepted = False
+        # Creating a PromptSession is expensive, so the async prompts reuse the same ones for the whole call
+        self._text_session: Optional[shortcuts.PromptSession[str]] = None
+        self._confirm_session: Optional[shortcuts.PromptSession[bool]] = None
+        self._confirm_bindings: Dict[bool, KeyBindingsBase] = {}
+
+    @property
+    def input(self) -> Optional[Input]:
+        return self._input
+
+    @property
+    def output(self) -> Optional[Output]:
+        return self._output
+
+    @property
+    def timeout(self) -> Optional[float]:
+        return self._timeout
+
+    @property
+    def defaults_accepted(self) -> bool:
+        """`True` once the user has asked for the default values to be used for the remaining interactions."""
+        return self._defaults_accepted
+
+    def accept_defaults(self) -> None:
+        """Use the default values for the remaining interactions, without waiting for the user."""
+        self._defaults_accepted = True
+
+    def _text_prompt(self) -> shortcuts.PromptSession[str]:
+        if self._text_session is None:
+            self._text_session = shortcuts.PromptSession()
+        return self._text_session
+
+    def _confirm_prompt(self, default: bool) -> shortcuts.PromptSession[bool]:
+        if self._confirm_session is None:
+            self._confirm_session = shortcuts.PromptSession()
+        bindings = self._confirm_bindings.get(default)
+        if bindings is None:
+            bindings = self._confirm_bindings[default] = _confirm_key_bindings(default)
+        self._confirm_session.key_bindings = bindings
+        return self._confirm_session
+
+
+class LiveValidator(Validator):
+    """
+    Validates the text of a prompt while the user types.
+
+    The check runs in a background thread once the user pauses typing, so that a slow check doesn't delay keystrokes.
+    A check is skipped when the text changes during the pause, and prompt-toolkit discards the result of a check for
+    text that has since changed. In both cases, the latest text is checked once the user pauses again.
+    """
+
+    def __init__(
+        self,
+        check: Callable[[str], Optional[str]],
+        delay: float = _LIVE_VALIDATION_DELAY,
+        buffer: Optional[Buffer] = None,
+    ) -> None:
+        """
+        Initialize an instance.
+
+        :param check: Called with the text of the prompt. Returns a message describing why the text is not valid, or
+            `None` if the text is valid. May be called from a background thread.
+        :param delay: The number of seconds the user must pause typing before the text is checked.
+        :param buffer: The buffer that is validated, which is used to tell whether the text changed during the pause.
+            If `None`, the buffer that has the focus when a check starts, which is always the buffer of a prompt.
+        """
+        self._check = check
+        self._delay = delay
+        self._buffer = buffer
+
+    def validate(self, document: Document) -> None:
+        error = self._check(document.text)
+        if error is not None:
+            raise ValidationError(cursor_position=len(document.text), message=error)
+
+    async def validate_async(self, document: Document) -> None:
+        buffer = self._buffer or get_app().current_buffer
+        await asyncio.sleep(self._delay)
+        if buffer.document != document:
+            # the user typed during the pause, so the buffer will ask for the new text to be validated instead
+            return
+        await run_in_executor_with_context(self.validate, document)
+
+
+_current_context: ContextVar[Optional[IOContext]] = ContextVar(
+    "columbo_io_context", default=None
+)
+
+
+@contextmanager
+def using(context: Optional[IOContext]) -> Iterator[IOContext]:
+    """
+    Use the given context for all interactions with the user within the `with` block.
+
+    The context only applies to the current thread (or asyncio task).
+
+    :param context: The context to use. If `None`, a new context that uses the active prompt-toolkit app session is
+        created.
+    :return: The context that is being used.
+    """
+    if context is None:
+        context = IOContext()
+    token = _current_context.set(context)
+    try:
+        if context.input is None and context.output is None:
+            yield context
+        else:
+            with create_app_session(input=context.input, output=context.output):
+                yield context
+    finally:
+        _current_context.reset(token)
+
+
+def defaults_accepted() -> bool:
+    """
+    :return: `True` if the user has asked for the default values to be used for the remaining interactions of the
+        current context.
+    """
+    context = _current_context.get()
+    return context is not None and context.defaults_accepted
 
 
 def echo(
@@ -20,20 +202,60 @@ def echo(
     shortcuts.print_formatted_text(message)
 
 
-def acknowledge(message: str, no_user_input: bool = False) -> None:
+def acknowledge(
+    message: str, no_user_input: bool = False, timeout: Optional[float] = None
+) -> None:
     echo(message)
-    if no_user_input:
+    if no_user_input or defaults_accepted():
         return
 
-    shortcuts.prompt("")
+    shortcuts.prompt(
+        "",
+        key_bindings=_TEXT_KEY_BINDINGS,
+        pre_run=_expire_after(timeout, _NO_INPUT),
+    )
     echo("")
 
 
-def confirm(question: str, default: bool = False, no_user_input: bool = False) -> bool:
+async def acknowledge_async(
+    message: str, no_user_input: bool = False, timeout: Optional[float] = None
+) -> None:
+    echo(message)
+    if no_user_input or defaults_accepted():
+        return
+
+    await _prompt_text_async("", timeout=timeout)
+    echo("")
+
+
+def confirm(
+    question: str,
+    default: bool = False,
+    no_user_input: bool = False,
+    timeout: Optional[float] = None,
+) -> bool:
     if no_user_input:
         return default
 
-    answer = _confirm(question, default)
+    answer = _confirm(question, default, timeout)
+    echo("")
+
+    return answer
+
+
+async def confirm_async(
+    question: str,
+    default: bool = False,
+    no_user_input: bool = False,
+    timeout: Optional[float] = None,
+) -> bool:
+    if no_user_input:
+        return default
+
+    session = _context()._confirm_prompt(default)
+    answer = await session.prompt_async(
+        _confirm_message(question, default), pre_run=_expire_after(timeout, default)
+    )
     echo("")
 
     return answer
@@ -44,19 +266,39 @@ def ask(
     default: str,
     no_user_input: bool = False,
     validator: Optional[Validator] = None,
+    timeout: Optional[float] = None,
+    completer: Optional[Completer] = None,
 ) -> str:
     if no_user_input:
         return default
 
     # Don't pass real default to prompt as it requires the user to delete the characters to enter something custom
     answer = shortcuts.prompt(
-        f"{question} [{default}]: ", default=_NO_INPUT, validator=validator
+        _ask_message(question, default),
+        default=_NO_INPUT,
+        validator=validator,
+        completer=_threaded(completer),
+        key_bindings=_TEXT_KEY_BINDINGS,
+        pre_run=_expire_after(timeout, _NO_INPUT),
     )
-    if answer == _NO_INPUT:
-        answer = default
-    echo("")
+    return _ask_result(answer, default)
 
-    return answer
+
+async def ask_async(
+    question: str,
+    default: str,
+    no_user_input: bool = False,
+    validator: Optional[Validator] = None,
+    timeout: Optional[float] = None,
+    completer: Optional[Completer] = None,
+) -> str:
+    if no_user_input:
+        return default
+
+    answer = await _prompt_text_async(
+        _ask_message(question, default), validator, timeout, completer
+    )
+    return _ask_result(answer, default)
 
 
 def multiple_choice(
@@ -64,7 +306,63 @@ def multiple_choice(
     options: Mapping[str, str],
     default: str,
     no_user_input: bool = False,
+    timeout: Optional[float] = None,
+) -> str:
+    prompt, choice_map, default_choice = _multiple_choice_prompt(
+        question, options, default
+    )
+    user_choice = ask(
+        prompt,
+        validator=_choice_validator(choice_map),
+        default=default_choice,
+        no_user_input=no_user_input,
+        timeout=timeout,
+    )
+
+    return choice_map[user_choice]
+
+
+async def multiple_choice_async(
+    question: str,
+    options: Mapping[str, str],
+    default: str,
+    no_user_input: bool = False,
+    timeout: Optional[float] = None,
 ) -> str:
+    prompt, choice_map, default_choice = _multiple_choice_prompt(
+        question, options, default
+    )
+    user_choice = await ask_async(
+        prompt,
+        validator=_choice_validator(choice_map),
+        default=default_choice,
+        no_user_input=no_user_input,
+        timeout=timeout,
+    )
+
+    return choice_map[user_choice]
+
+
+def _ask_message(question: str, default: str) -> str:
+    return f"{question} [{default}]: "
+
+
+def _ask_result(answer: str, default: str) -> str:
+    if answer == _NO_INPUT:
+        answer = default
+    echo("")
+
+    return answer
+
+
+def _multiple_choice_prompt(
+    question: str, options: Mapping[str, str], default: str
+) -> Tuple[str, Dict[str, str], str]:
+    """
+    Produce the text used to prompt the user to select one of the options.
+
+    :return: The prompt text, a mapping from what the user enters to the option value, and the entry for the default.
+    """
     if len(options) == 0:
         raise ValueError("options must contain at least one value")
 
@@ -83,32 +381,107 @@ def multiple_choice(
         raise ValueError(f"""Default "{default}" was not an option {options}""")
 
     prompt_lines.append("Enter the number of your choice")
+    return "\n".join(prompt_lines), choice_map, default_choice
 
-    user_choice = ask(
-        "\n".join(prompt_lines),
-        validator=Validator.from_callable(
-            lambda text: text == _NO_INPUT or text in choice_map.keys()
-        ),
-        default=default_choice,
-        no_user_input=no_user_input,
+
+def _choice_validator(choice_map: Mapping[str, str]) -> Validator:
+    return Validator.from_callable(
+        lambda text: text == _NO_INPUT or text in choice_map.keys()
     )
 
-    return choice_map[user_choice]
 
+async def _prompt_text_async(
+    message: str,
+    validator: Optional[Validator] = None,
+    timeout: Optional[float] = None,
+    completer: Optional[Completer] = None,
+) -> str:
+    session = _context()._text_prompt()
+    # assigned directly because passing None to prompt_async() keeps the value used by the previous prompt
+    session.validator = validator
+    session.completer = _threaded(completer)
+    # Don't pass real default to prompt as it requires the user to delete the characters to enter something custom
+    return await session.prompt_async(
+        message,
+        default=_NO_INPUT,
+        key_bindings=_TEXT_KEY_BINDINGS,
+        pre_run=_expire_after(timeout, _NO_INPUT),
+    )
+
+
+def _threaded(completer: Optional[Completer]) -> Optional[Completer]:
+    # completions are found in a background thread, so that searching many values doesn't delay keystrokes
+    return None if completer is None else ThreadedCompleter(completer)
+
+
+def _context() -> IOContext:
+    context = _current_context.get()
+    if context is None:
+        raise RuntimeError("Async prompts must be used within an IOContext")
+    return context
+
+
+def _confirm(question: str, default: bool, timeout: Optional[float]) -> bool:
+    bindings = _confirm_key_bindings(default)
+    complete_message = _confirm_message(question, default)
+    session: shortcuts.PromptSession[bool] = shortcuts.PromptSession(
+        complete_message, key_bindings=bindings
+    )
+    return session.prompt(
+        complete_message,
+        key_bindings=bindings,
+        pre_run=_expire_after(timeout, default),
+    )
+
+
+def _expire_after(timeout: Optional[float], result: T) -> Optional[Callable[[], None]]:
+    """
+    Produce a `pre_run` callable for a prompt that ends the prompt once the timeout expires.
+
+    :param timeout: The number of seconds to wait. If `None`, the timeout of the current context is used.
+    :param result: The value produced by the prompt when the timeout expires.
+    :return: The callable to pass as `pre_run`. `None` if the prompt should wait indefinitely.
+    """
+    if timeout is None:
+        context = _current_context.get()
+        timeout = None if context is None else context.timeout
+    if timeout is None:
+        return None
+    seconds = timeout
 
-def _confirm(question: str, default: bool = False) -> bool:
+    def start_timer() -> None:
+        app = get_app()
+
+        def expire() -> None:
+            if app.future is not None and not app.future.done():
+                app.exit(result=result)
+
+        handle = asyncio.get_running_loop().call_later(seconds, expire)
+        if app.future is not None:
+            # don't keep the application alive until the timer would have expired
+            app.future.add_done_callback(lambda _: handle.cancel())
+
+    return start_timer
+
+
+def _confirm_message(question: str, default: bool) -> AnyFormattedText:
+    default_indicator = "Y/n" if default else "y/N"
+    return merge_formatted_text([question, f" ({default_indicator}): "])
+
+
+def _confirm_key_bindings(default: bool) -> KeyBindingsBase:
     bindings = KeyBindings()
 
     @bindings.add("y")
     @bindings.add("Y")
     def _yes(event: KeyPressEvent) -> None:
-        session.default_buffer.text = "y"
+        event.app.current_buffer.text = "y"
         event.app.exit(result=True)
 
     @bindings.add("n")
     @bindings.add("N")
     def _no(event: KeyPressEvent) -> None:
-        session.default_buffer.text = "n"
+        event.app.current_buffer.text = "n"
         event.app.exit(result=False)
 
     @bindings.add(Keys.Any)
@@ -116,15 +489,27 @@ def _confirm(question: str, default: bool = False) -> bool:
         # Disallow inserting other text.
         pass
 
-    if default:
-        default_indicator = "Y/n"
-        bindings.add(Keys.Enter)(_yes)
-    else:
-        default_indicator = "y/N"
-        bindings.add(Keys.Enter)(_no)
+    bindings.add(Keys.Enter)(_yes if default else _no)
+    return merge_key_bindings([bindings, _accept_defaults_key_bindings(default)])
 
-    complete_message = merge_formatted_text([question, f" ({default_indicator}): "])
-    session: shortcuts.PromptSession[bool] = shortcuts.PromptSession(
-        complete_message, key_bindings=bindings
-    )
-    return session.prompt(complete_message, key_bindings=bindings)
+
+def _accept_defaults_key_bindings(result: object) -> KeyBindings:
+    """
+    Produce the key bindings that let the user use the default values for the current & remaining interactions.
+
+    :param result: The value produced by the prompt when the keys are pressed, which causes the default to be used.
+    """
+    bindings = KeyBindings()
+
+    @bindings.add(*ACCEPT_DEFAULTS_KEYS)
+    def _accept_defaults(event: KeyPressEvent) -> None:
+        context = _current_context.get()
+        if context is not None:
+            context.accept_defaults()
+        event.app.exit(result=result)
+
+    return bindings
+
+
+# Shared by all the text prompts, as the bindings are never changed once created
+_TEXT_KEY_BINDINGS = _accept_defaults_key_bindings(_NO_INPUT)
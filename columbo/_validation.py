@@ -0,0 +1,188 @@
+"""
+Check answers that were produced elsewhere against a sequence of interactions, without interacting with the user.
+"""
+
+import json
+from dataclasses import dataclass
+from typing import (
+    Collection,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from columbo._interaction import (
+    Acknowledge,
+    Echo,
+    Interaction,
+    Question,
+    QuestionValue,
+    is_question,
+    validate_duplicate_question_names,
+    validate_value_if_not_asked,
+)
+from columbo._session import to_answer
+from columbo._types import Answer, ValidationFailure
+
+
+@dataclass(frozen=True)
+class AnswerError:
+    """
+    A reason that a set of answers could not have been produced by the interactions.
+
+    `name` is the name of the question with the invalid answer, or `None` if the error applies to the whole set of
+    answers.
+    """
+
+    error: str
+    name: Optional[str] = None
+
+
+def validate_answers(
+    interactions: Collection[Interaction], answers: Mapping[str, object]
+) -> List[AnswerError]:
+    """
+    Check a set of answers in the same way as `get_answers()` would check the responses of a user.
+
+    The interactions are replayed in order without interacting with the user. A question that should be asked is
+    checked using the answer with the same name, or its default value if there isn't one. Each answer is only available
+    to the interactions after its question. A question that should not be asked records `value_if_not_asked`, if it has
+    one, and an answer given for it is reported unless it is the same as `value_if_not_asked`, so the answers produced
+    by `get_answers()` are valid. Every invalid answer is reported, instead of stopping at the first one. An invalid
+    string or bool answer is still given to the interactions that follow it.
+
+    :param interactions: The interactions that the answers should have been produced by.
+    :param answers: The answers to check, such as those loaded from a JSON file.
+    :return: The errors that were found. Empty if the answers are valid.
+    :raises DuplicateQuestionNameException: One of the given questions attempted to reuse a name.
+    :raises ValueError: One of the given `Interaction`s was not a valid type. A dynamic value or `value_if_not_asked`
+        that is not valid for the answers is reported as an error instead.
+    """
+    validate_duplicate_question_names(interactions)
+    return replay_answers(interactions, answers)[1]
+
+
+def validate_answers_jsonl(
+    interactions: Collection[Interaction], lines: Iterable[str]
+) -> Iterator[Tuple[int, List[AnswerError]]]:
+    """
+    Check each set of answers in a stream of JSON Lines, one set at a time.
+
+    Only one set of answers is held in memory at a time, so a stream of any size can be checked. Blank lines are
+    skipped. A line that is not a JSON object is reported as an error that applies to the whole set of answers.
+
+    :param interactions: The interactions that the answers should have been produced by.
+    :param lines: The lines to check, such as an open file. Each non-blank line is a JSON object of answers.
+    :return: Iterator of the line number (starting at 1) & the errors found in that line, for each non-blank line.
+    :raises DuplicateQuestionNameException: One of the given questions attempted to reuse a name.
+    :raises ValueError: While iterating, one of the given `Interaction`s was not a valid type.
+    """
+    # validated before the first line is requested, so that misconfiguration is reported immediately
+    validate_duplicate_question_names(interactions)
+    return _validate_lines(interactions, lines)
+
+
+def _validate_lines(
+    interactions: Collection[Interaction], lines: Iterable[str]
+) -> Iterator[Tuple[int, List[AnswerError]]]:
+    for line_number, answers in read_jsonl(lines):
+        if isinstance(answers, AnswerError):
+            yield line_number, [answers]
+        else:
+            yield line_number, replay_answers(interactions, answers)[1]
+
+
+def read_jsonl(
+    lines: Iterable[str],
+) -> Iterator[Tuple[int, Union[Dict[str, object], AnswerError]]]:
+    """
+    Parse each set of answers in a stream of JSON Lines, one line at a time.
+
+    :return: Iterator of the line number (starting at 1) & either the answers or the reason the line is not valid, for
+        each non-blank line.
+    """
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            answers = json.loads(line)
+        except ValueError as ex:
+            yield line_number, AnswerError(f"Invalid JSON: {ex}")
+            continue
+        if not isinstance(answers, dict):
+            yield line_number, AnswerError("Answers must be a JSON object")
+            continue
+        yield line_number, answers
+
+
+def replay_answers(
+    interactions: Collection[Interaction], answers: Mapping[str, object]
+) -> Tuple[Dict[str, Answer], List[AnswerError]]:
+    """
+    Replay the interactions using a set of answers, in the same way as `validate_answers()`.
+
+    :return: The resulting answers & the errors that were found. Questions with an invalid answer keep the value that
+        was given, if it is a string or bool.
+    """
+    question_names = {
+        interaction.name for interaction in interactions if is_question(interaction)
+    }
+    # the answer to each question is only available once the question is reached, in the same way as get_answers().
+    # Other values are available from the start, if they have a valid type.
+    current: Dict[str, Answer] = {
+        name: value
+        for name, value in answers.items()
+        if name not in question_names and isinstance(value, (bool, str))
+    }
+    errors: List[AnswerError] = []
+    for interaction in interactions:
+        if isinstance(interaction, (Echo, Acknowledge)):
+            continue
+        if not is_question(interaction):
+            raise ValueError(f"Unsupported interaction type: {type(interaction)}")
+        try:
+            error = _replay_question(
+                interaction, answers.get(interaction.name), current
+            )
+        except ValueError as ex:
+            # a dynamic value or value_if_not_asked that is not valid for these answers
+            error = str(ex)
+        if error is not None:
+            errors.append(AnswerError(error, interaction.name))
+    return current, errors
+
+
+def _replay_question(
+    question: Question[QuestionValue], answer: object, current: Dict[str, Answer]
+) -> Optional[str]:
+    """
+    Record the answer to a question.
+
+    :return: The reason the answer is not valid. `None` if it is valid.
+    :raises ValueError: A dynamic value or `value_if_not_asked` was not valid.
+    """
+    if not question.should_ask(current):
+        not_asked: Optional[Answer] = None
+        if question.value_if_not_asked is not None:
+            not_asked = validate_value_if_not_asked(
+                question.value_if_not_asked, question, current
+            )
+            current[question.name] = not_asked
+        # the type is compared as well, because 1 == True
+        if answer is not None and (
+            type(answer) is not type(not_asked) or answer != not_asked
+        ):
+            return "An answer was given for a question that should not be asked"
+        return None
+    value = to_answer(question, answer, current)
+    if not isinstance(value, ValidationFailure):
+        current[question.name] = value
+        return None
+    if isinstance(answer, (bool, str)):
+        current[question.name] = answer
+    return value.error
@@ -0,0 +1,371 @@
+"""
+Evaluate interactions for many sets of answers at once.
+
+This module requires NumPy, which can be installed using the `batch` extra (`pip install 'columbo[batch]'`). Unlike the
+rest of the library, the contents of this module are not exposed by the `columbo` package, so that importing `columbo`
+does not require NumPy.
+"""
+
+from dataclasses import dataclass
+from functools import singledispatch
+from typing import Collection, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+try:
+    import numpy as np
+    import numpy.typing as npt
+except ImportError as ex:  # pragma: no cover
+    raise ImportError(
+        "columbo.batch requires NumPy. Install it using: pip install 'columbo[batch]'"
+    ) from ex
+
+from columbo._condition import And, Answered, Condition, Equals, Not, OneOf, Or
+from columbo._interaction import (
+    BasicQuestion,
+    Choice,
+    Confirm,
+    Displayable,
+    Interaction,
+    Question,
+    is_always_asked,
+    validate_duplicate_question_names,
+    validate_value_if_not_asked,
+)
+from columbo._types import Answer, Answers
+
+# Only one dimensional arrays are used
+Column = np.ndarray[Tuple[int], np.dtype[Union[np.bool_, np.str_, np.object_]]]
+Mask = np.ndarray[Tuple[int], np.dtype[np.bool_]]
+
+
+class AnswerColumns:
+    """
+    Answers for many records, stored as one array per question.
+
+    Instances are not modified once created. Methods that change the answers return a new instance that shares the
+    arrays that were not changed.
+    """
+
+    __slots__ = ("_columns", "_answered", "_length")
+
+    def __init__(
+        self,
+        columns: Mapping[str, npt.ArrayLike],
+        answered: Optional[Mapping[str, npt.ArrayLike]] = None,
+        length: Optional[int] = None,
+    ) -> None:
+        """
+        Initialize an instance.
+
+        :param columns: The answers to each question. Each value is converted to a one dimensional array. All the
+            arrays must have the same length.
+        :param answered: Optional masks that indicate which records have an answer for a question. A question without
+            a mask is treated as being answered in every record.
+        :param length: The number of records. Only needed when no columns are given.
+        :raises ValueError: The columns or masks did not have the same length. Or a mask was given for a name without
+            a column.
+        """
+        self._columns: Dict[str, Column] = {
+            name: np.asarray(values) for name, values in columns.items()
+        }
+        lengths = {len(column) for column in self._columns.values()}
+        if length is not None:
+            lengths.add(length)
+        if len(lengths) > 1:
+            raise ValueError("All columns must have the same length")
+        self._length = lengths.pop() if lengths else 0
+
+        masks = {} if answered is None else answered
+        unknown = set(masks).difference(self._columns)
+        if unknown:
+            raise ValueError(f"Answered masks given without a column: {unknown}")
+        self._answered: Dict[str, Mask] = {
+            name: (
+                np.asarray(masks[name], dtype=np.bool_)
+                if name in masks
+                else np.ones(self._length, dtype=np.bool_)
+            )
+            for name in self._columns
+        }
+        if any(len(mask) != self._length for mask in self._answered.values()):
+            raise ValueError("All answered masks must have the same length as columns")
+
+    @classmethod
+    def from_answers(
+        cls, records: Iterable[Answers], names: Optional[Iterable[str]] = None
+    ) -> "AnswerColumns":
+        """
+        Convert individual sets of answers into columns.
+
+        :param records: The sets of answers. Each set becomes one record.
+        :param names: The names of the columns to create. If omitted, a column is created for every name that is
+            present in at least one record.
+        :return: A new instance that contains the answers.
+        """
+        rows = list(records)
+        if names is None:
+            names = dict.fromkeys(name for row in rows for name in row)
+        columns: Dict[str, Column] = {}
+        answered: Dict[str, Mask] = {}
+        for name in names:
+            values = [row.get(name) for row in rows]
+            columns[name] = _to_column(values)
+            answered[name] = np.array([v is not None for v in values], dtype=np.bool_)
+        return cls(columns, answered, length=len(rows))
+
+    @property
+    def names(self) -> Tuple[str, ...]:
+        return tuple(self._columns)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def column(self, name: str) -> Column:
+        """
+        Get the answers to a question.
+
+        :param name: The name of the question.
+        :return: The value for each record. Records without an answer contain an arbitrary value.
+        :raises KeyError: There is no column for the question.
+        """
+        return self._columns[name]
+
+    def answered(self, name: str) -> Mask:
+        """
+        Get the records that have an answer to a question.
+
+        :param name: The name of the question.
+        :return: A mask that is `True` for records that have an answer.
+        """
+        mask = self._answered.get(name)
+        return np.zeros(self._length, dtype=np.bool_) if mask is None else mask
+
+    def with_column(self, name: str, column: Column, answered: Mask) -> "AnswerColumns":
+        """
+        Create a new instance where the answers to a question are replaced.
+
+        :param name: The name of the question.
+        :param column: The value for each record.
+        :param answered: A mask that is `True` for records that have an answer.
+        :return: A new instance.
+        :raises ValueError: The column or mask doesn't have the same length as the other columns.
+        """
+        return AnswerColumns(
+            {**self._columns, name: column},
+            {**self._answered, name: answered},
+            length=self._length,
+        )
+
+    def row(self, index: int) -> Dict[str, Answer]:
+        """
+        Get the answers for a single record.
+
+        :param index: The index of the record.
+        :return: The answers that are present in the record.
+        """
+        return {
+            name: _to_answer(column.item(index))
+            for name, column in self._columns.items()
+            if self._answered[name][index]
+        }
+
+    def rows(self) -> List[Dict[str, Answer]]:
+        """
+        Convert the columns into individual sets of answers.
+
+        :return: The answers for each record.
+        """
+        return [self.row(index) for index in range(self._length)]
+
+
+@dataclass(frozen=True)
+class BatchDecisions:
+    """The result of evaluating interactions for many records."""
+
+    asked: Dict[str, Mask]
+    """For each question, a mask that is `True` for the records where the question would be asked."""
+    answers: AnswerColumns
+    """The answers after removing answers to questions that wouldn't be asked & filling in `value_if_not_asked`."""
+
+
+def evaluate_condition(condition: Condition, answers: AnswerColumns) -> Mask:
+    """
+    Evaluate a condition for every record at once.
+
+    :param condition: The condition to evaluate.
+    :param answers: The answers for each record.
+    :return: A mask that is `True` for the records that satisfy the condition.
+    :raises ValueError: The condition was not a supported type.
+    """
+    return _evaluate(condition, answers)
+
+
+def evaluate_interactions(
+    interactions: Collection[Interaction], answers: AnswerColumns
+) -> BatchDecisions:
+    """
+    Determine which questions would be asked for every record at once.
+
+    Questions are processed in order, so `should_ask` sees the same answers it would see when using `get_answers()`.
+    Declarative conditions are evaluated for all records at once. Other values for `should_ask` are called once per
+    record. Answers to questions that would not be asked are removed. When a question has a `value_if_not_asked`, that
+    value is filled in for the records where the question would not be asked.
+
+    :param interactions: Interactions to evaluate.
+    :param answers: The answers for each record.
+    :return: The decisions for each question & the resultant answers.
+    :raises DuplicateQuestionNameException: One of the given questions attempted to reuse a name.
+    :raises ValueError: One of the given `Interaction`s was not a valid type or was misconfigured in some way.
+    """
+    validate_duplicate_question_names(interactions)
+    asked: Dict[str, Mask] = {}
+    for interaction in interactions:
+        if isinstance(interaction, Displayable):
+            continue
+        if not isinstance(interaction, Question):
+            raise ValueError(f"Unsupported interaction type: {type(interaction)}")
+        mask = _should_ask_mask(interaction, answers)
+        asked[interaction.name] = mask
+        answers = _apply_not_asked(interaction, mask, answers)
+    return BatchDecisions(asked, answers)
+
+
+def _should_ask_mask(interaction: Interaction, answers: AnswerColumns) -> Mask:
+    if is_always_asked(interaction):
+        return np.ones(len(answers), dtype=np.bool_)
+    condition = interaction.should_ask_condition
+    if condition is not None:
+        return evaluate_condition(condition, answers)
+    return np.fromiter(
+        (interaction.should_ask(answers.row(i)) for i in range(len(answers))),
+        dtype=np.bool_,
+        count=len(answers),
+    )
+
+
+def _apply_not_asked(
+    interaction: Interaction, asked: Mask, answers: AnswerColumns
+) -> AnswerColumns:
+    if not isinstance(interaction, Question):  # pragma: no cover
+        return answers
+    name = interaction.name
+    answered = answers.answered(name) & asked
+    value = interaction.value_if_not_asked
+    if value is None:
+        if name not in answers.names:
+            return answers
+        return answers.with_column(name, answers.column(name), answered)
+
+    not_asked = ~asked
+    _validate_fill(interaction, value, not_asked, answers)
+    column = _fill_column(interaction, value, not_asked, answers)
+    return answers.with_column(name, column, answered | not_asked)
+
+
+def _fill_column(
+    interaction: Union[Question[bool], Question[str]],
+    value: Answer,
+    not_asked: Mask,
+    answers: AnswerColumns,
+) -> Column:
+    name = interaction.name
+    if name not in answers.names or not answers.answered(name).any():
+        # records without an answer contain arbitrary values, so the type of the column comes from the value alone
+        return np.full(len(answers), value)
+    column = answers.column(name)
+    # the type of the column is taken from the question, because the answers present might not have the same type.
+    # Mixing them in a bool or str array would convert the values, so they are kept as objects instead.
+    kind = "b" if isinstance(interaction, Confirm) else "U"
+    if column.dtype.kind != kind:
+        column = column.astype(np.object_)
+    return np.where(not_asked, value, column)
+
+
+def _validate_fill(
+    interaction: Union[Question[bool], Question[str]],
+    value: Answer,
+    not_asked: Mask,
+    answers: AnswerColumns,
+) -> None:
+    if not isinstance(interaction, (BasicQuestion, Choice)) or not isinstance(
+        value, str
+    ):
+        return
+    if isinstance(interaction, Choice) and not callable(interaction.options):
+        # static options don't depend on the answers, so the value only needs to be checked once
+        records: Iterable[int] = range(min(1, int(not_asked.sum())))
+    elif isinstance(interaction, BasicQuestion) and interaction.validator is None:
+        records = ()
+    else:
+        records = np.flatnonzero(not_asked).tolist()
+    for index in records:
+        validate_value_if_not_asked(value, interaction, answers.row(index))
+
+
+@singledispatch
+def _evaluate(condition: object, answers: AnswerColumns) -> Mask:
+    raise ValueError(f"Unsupported condition type {type(condition)}")
+
+
+@_evaluate.register
+def _evaluate_answered(condition: Answered, answers: AnswerColumns) -> Mask:
+    return answers.answered(condition.name)
+
+
+@_evaluate.register
+def _evaluate_equals(condition: Equals, answers: AnswerColumns) -> Mask:
+    return _matches(condition.name, [condition.value], answers)
+
+
+@_evaluate.register
+def _evaluate_one_of(condition: OneOf, answers: AnswerColumns) -> Mask:
+    return _matches(condition.name, list(condition.values), answers)
+
+
+@_evaluate.register
+def _evaluate_and(condition: And, answers: AnswerColumns) -> Mask:
+    masks = [_evaluate(c, answers) for c in condition.conditions]
+    return np.asarray(np.logical_and.reduce(masks), dtype=np.bool_)
+
+
+@_evaluate.register
+def _evaluate_or(condition: Or, answers: AnswerColumns) -> Mask:
+    masks = [_evaluate(c, answers) for c in condition.conditions]
+    return np.asarray(np.logical_or.reduce(masks), dtype=np.bool_)
+
+
+@_evaluate.register
+def _evaluate_not(condition: Not, answers: AnswerColumns) -> Mask:
+    return ~_evaluate(condition.condition, answers)
+
+
+def _matches(name: str, values: List[Answer], answers: AnswerColumns) -> Mask:
+    answered = answers.answered(name)
+    if name not in answers.names:
+        return answered
+    column = answers.column(name)
+    # A bool never matches a string, so only the values of the same kind as the column are considered.
+    if column.dtype == np.bool_:
+        return answered & np.isin(column, [v for v in values if isinstance(v, bool)])
+    if column.dtype.kind in "US":
+        return answered & np.isin(column, [v for v in values if isinstance(v, str)])
+    typed_values = {(type(v), v) for v in values}
+    return answered & np.fromiter(
+        ((type(v), v) in typed_values for v in column.tolist()),
+        dtype=np.bool_,
+        count=len(column),
+    )
+
+
+def _to_column(values: List[Optional[Answer]]) -> Column:
+    present = [v for v in values if v is not None]
+    if present and all(isinstance(v, bool) for v in present):
+        return np.array([False if v is None else v for v in values], dtype=np.bool_)
+    if all(isinstance(v, str) for v in present):
+        return np.array(["" if v is None else v for v in values], dtype=np.str_)
+    return np.array(values, dtype=np.object_)
+
+
+def _to_answer(value: object) -> Answer:
+    if isinstance(value, (bool, str)):
+        return value
+    raise ValueError(f"Invalid answer value: {value}")
@@ -0,0 +1,29 @@
+import json
+
+import columbo
+
+has_dog = columbo.Equals("has_dog", True)
+has_big_dog = has_dog & columbo.OneOf("dog_size", ["large", "giant"])
+
+interactions = [
+    columbo.Confirm("has_dog", "Do you have a dog?", default=True),
+    columbo.Choice(
+        "dog_size",
+        "How big is the dog?",
+        options=["small", "medium", "large", "giant"],
+        default="large",
+        should_ask=has_dog,
+    ),
+    columbo.Confirm(
+        "has_big_yard",
+        "Do you have a big yard for the dog to play in?",
+        default=True,
+        should_ask=has_big_dog,
+    ),
+]
+
+print(sorted(has_big_dog.dependencies))
+print(json.dumps(has_big_dog.to_dict()))
+
+user_answers = columbo.get_answers(interactions)
+print(user_answers)
@@ -0,0 +1,148 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from columbo import (
+    Answer,
+    Answers,
+    BackgroundActions,
+    BasicQuestion,
+    Confirm,
+    FrozenAnswers,
+    Interaction,
+    get_answers,
+)
+from tests.sample_data import SOME_BOOL, SOME_DEFAULT, SOME_NAME, SOME_STRING
+
+SOME_INTERACTIONS: list[Interaction] = [
+    Confirm("confirm", SOME_STRING, SOME_BOOL),
+    BasicQuestion(SOME_NAME, SOME_STRING, SOME_DEFAULT),
+]
+
+
+def test_get_answers__actions__action_given_answer_and_answers():
+    calls: list[tuple[Answer, Answers]] = []
+
+    with BackgroundActions(
+        {SOME_NAME: lambda answer, answers: calls.append((answer, answers))}
+    ) as actions:
+        get_answers(SOME_INTERACTIONS, no_user_input=True, actions=actions)
+
+    assert calls == [(SOME_DEFAULT, {"confirm": SOME_BOOL, SOME_NAME: SOME_DEFAULT})]
+
+
+def test_get_answers__actions__started_before_remaining_questions_asked():
+    started = threading.Event()
+
+    def wait_for_action(_: Answers) -> str:
+        assert started.wait(timeout=5)
+        return SOME_DEFAULT
+
+    interactions: list[Interaction] = [
+        Confirm("confirm", SOME_STRING, SOME_BOOL),
+        BasicQuestion(SOME_NAME, SOME_STRING, wait_for_action),
+    ]
+
+    with BackgroundActions({"confirm": lambda *_: started.set()}) as actions:
+        result = get_answers(interactions, no_user_input=True, actions=actions)
+
+    assert result[SOME_NAME] == SOME_DEFAULT
+
+
+def test_get_answers__actions_frozen_answers__action_given_snapshot():
+    calls: list[Answers] = []
+
+    with BackgroundActions({SOME_NAME: lambda _, answers: calls.append(answers)}) as a:
+        result = get_answers(
+            SOME_INTERACTIONS, FrozenAnswers(), no_user_input=True, actions=a
+        )
+
+    assert calls == [result]
+    assert isinstance(calls[0], FrozenAnswers)
+
+
+def test_join__action_raises__exception_raised():
+    def fail(*_: object) -> None:
+        raise KeyError(SOME_STRING)
+
+    actions = BackgroundActions({SOME_NAME: fail})
+    get_answers(SOME_INTERACTIONS, no_user_input=True, actions=actions)
+
+    with pytest.raises(KeyError):
+        actions.join()
+
+
+def test_join__action_not_finished__timeout_error():
+    release = threading.Event()
+    actions = BackgroundActions({SOME_NAME: lambda *_: release.wait()})
+    get_answers(SOME_INTERACTIONS, no_user_input=True, actions=actions)
+
+    with pytest.raises(TimeoutError):
+        actions.join(timeout=0.01)
+
+    assert actions.pending == 1
+    release.set()
+    actions.join()
+    assert actions.pending == 0
+
+
+def test_cancel__actions_not_started__not_run():
+    release = threading.Event()
+    calls: list[str] = []
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        actions = BackgroundActions(
+            {
+                "confirm": lambda *_: release.wait(),
+                SOME_NAME: lambda *_: calls.append(SOME_NAME),
+            },
+            executor=executor,
+        )
+        get_answers(SOME_INTERACTIONS, no_user_input=True, actions=actions)
+
+        cancelled = actions.cancel()
+        release.set()
+
+    assert cancelled == 1
+    assert calls == []
+
+
+def test_context_manager__exception__actions_cancelled():
+    release = threading.Event()
+    calls: list[str] = []
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        with pytest.raises(ValueError):
+            with BackgroundActions(
+                {
+                    "confirm": lambda *_: release.wait(),
+                    SOME_NAME: lambda *_: calls.append(SOME_NAME),
+                },
+                executor=executor,
+            ) as actions:
+                get_answers(SOME_INTERACTIONS, no_user_input=True, actions=actions)
+                raise ValueError()
+        release.set()
+
+    assert calls == []
+
+
+def test_answer_recorded__after_join__runtime_error():
+    actions = BackgroundActions({SOME_NAME: lambda *_: None})
+    actions.join()
+
+    with pytest.raises(RuntimeError):
+        actions.answer_recorded(SOME_NAME, {SOME_NAME: SOME_DEFAULT})
+
+
+def test_answer_recorded__given_executor_after_join__action_started():
+    calls = []
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        actions = BackgroundActions(
+            {SOME_NAME: lambda *args: calls.append(args)}, executor
+        )
+        actions.join()
+
+        actions.answer_recorded(SOME_NAME, {SOME_NAME: SOME_DEFAULT})
+        actions.join()
+
+    assert calls == [(SOME_DEFAULT, {SOME_NAME: SOME_DEFAULT})]
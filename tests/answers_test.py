@@ -0,0 +1,275 @@
+import random
+
+import pytest
+
+from columbo import Answer
+from columbo._answers import AnswerLayout, FrozenAnswers, SlotAnswers
+from tests.sample_data import SOME_ANSWERS, SOME_NAME, SOME_OTHER_STRING, SOME_STRING
+
+SOME_LAYOUT = AnswerLayout(["a", "b", SOME_NAME])
+
+
+def test_answer_layout__duplicate_name__exception():
+    with pytest.raises(ValueError):
+        AnswerLayout(["a", "a"])
+
+
+def test_answer_layout_slot__names_in_order():
+    assert [SOME_LAYOUT.slot(name) for name in SOME_LAYOUT.names] == [0, 1, 2]
+
+
+def test_answer_layout_slot__unknown_name__exception():
+    with pytest.raises(KeyError):
+        SOME_LAYOUT.slot(SOME_STRING)
+
+
+def test_answer_layout_new_answers__initial_answers__same_answers():
+    answers = SOME_LAYOUT.new_answers(SOME_ANSWERS)
+
+    assert answers == SOME_ANSWERS
+
+
+def test_answer_layout_new_answers__unknown_initial_answer__exception():
+    with pytest.raises(KeyError):
+        SOME_LAYOUT.new_answers({SOME_STRING: SOME_OTHER_STRING})
+
+
+def test_slot_answers__empty__no_answers():
+    answers = SlotAnswers(SOME_LAYOUT)
+
+    assert len(answers) == 0
+    assert list(answers) == []
+    assert "a" not in answers
+
+
+def test_slot_answers_set_item__value_stored():
+    answers = SlotAnswers(SOME_LAYOUT)
+
+    answers[SOME_NAME] = SOME_STRING
+
+    assert answers[SOME_NAME] == SOME_STRING
+    assert SOME_NAME in answers
+    assert len(answers) == 1
+
+
+def test_slot_answers_set_item__replace_value__length_unchanged():
+    answers = SlotAnswers(SOME_LAYOUT)
+
+    answers[SOME_NAME] = SOME_STRING
+    answers[SOME_NAME] = False
+
+    assert answers[SOME_NAME] is False
+    assert len(answers) == 1
+
+
+def test_slot_answers_set_item__unknown_name__exception():
+    answers = SlotAnswers(SOME_LAYOUT)
+
+    with pytest.raises(KeyError):
+        answers[SOME_STRING] = SOME_STRING
+
+
+@pytest.mark.parametrize("name", ["a", SOME_STRING])
+def test_slot_answers_get_item__missing__exception(name):
+    answers = SlotAnswers(SOME_LAYOUT)
+
+    with pytest.raises(KeyError):
+        answers[name]
+
+
+def test_slot_answers_del_item__value_removed():
+    answers = SOME_LAYOUT.new_answers(SOME_ANSWERS)
+
+    del answers["a"]
+
+    assert answers == {"b": SOME_ANSWERS["b"]}
+
+
+def test_slot_answers_del_item__missing__exception():
+    answers = SlotAnswers(SOME_LAYOUT)
+
+    with pytest.raises(KeyError):
+        del answers["a"]
+
+
+def test_slot_answers_iter__layout_order():
+    answers = SlotAnswers(SOME_LAYOUT)
+    answers[SOME_NAME] = SOME_STRING
+    answers["a"] = SOME_OTHER_STRING
+
+    assert list(answers) == ["a", SOME_NAME]
+
+
+def test_slot_answers_copy__independent_values():
+    original = SOME_LAYOUT.new_answers(SOME_ANSWERS)
+
+    copy = original.copy()
+    copy[SOME_NAME] = SOME_STRING
+
+    assert copy.layout is original.layout
+    assert SOME_NAME not in original
+    assert len(copy) == len(original) + 1
+
+
+def test_slot_answers_to_dict__dict_of_answers():
+    result = SOME_LAYOUT.new_answers(SOME_ANSWERS).to_dict()
+
+    assert type(result) is dict
+    assert result == SOME_ANSWERS
+
+
+def test_slot_answers_repr__contains_answers():
+    assert repr(SOME_ANSWERS) in repr(SOME_LAYOUT.new_answers(SOME_ANSWERS))
+
+
+def test_slot_answers__no_instance_dict():
+    assert not hasattr(SlotAnswers(SOME_LAYOUT), "__dict__")
+
+
+class _CollidingKey(str):
+    """Key where every instance has the same hash."""
+
+    def __hash__(self) -> int:
+        return 1
+
+
+def test_frozen_answers__initial_answers__same_answers():
+    answers = FrozenAnswers(SOME_ANSWERS)
+
+    assert answers == SOME_ANSWERS
+    assert list(answers) == list(SOME_ANSWERS)
+    assert len(answers) == len(SOME_ANSWERS)
+
+
+def test_frozen_answers_set__original_unchanged():
+    original = FrozenAnswers(SOME_ANSWERS)
+
+    updated = original.set(SOME_NAME, SOME_STRING)
+
+    assert SOME_NAME not in original
+    assert updated[SOME_NAME] == SOME_STRING
+    assert updated == {**SOME_ANSWERS, SOME_NAME: SOME_STRING}
+
+
+def test_frozen_answers_set__same_value__same_instance():
+    original = FrozenAnswers(SOME_ANSWERS)
+
+    assert original.set("a", SOME_ANSWERS["a"]) is original
+
+
+def test_frozen_answers_set__replace_value__order_preserved():
+    original = FrozenAnswers(SOME_ANSWERS)
+
+    updated = original.set("a", SOME_STRING)
+
+    assert list(updated) == list(SOME_ANSWERS)
+    assert updated["a"] == SOME_STRING
+    assert len(updated) == len(SOME_ANSWERS)
+
+
+def test_frozen_answers_delete__original_unchanged():
+    original = FrozenAnswers(SOME_ANSWERS)
+
+    updated = original.delete("a")
+
+    assert "a" in original
+    assert updated == {"b": SOME_ANSWERS["b"]}
+
+
+def test_frozen_answers_delete__missing__exception():
+    with pytest.raises(KeyError):
+        FrozenAnswers(SOME_ANSWERS).delete(SOME_NAME)
+
+
+@pytest.mark.parametrize("name", [SOME_NAME, 5])
+def test_frozen_answers_get_item__missing__exception(name):
+    answers = FrozenAnswers(SOME_ANSWERS)
+
+    with pytest.raises(KeyError):
+        answers[name]
+    assert name not in answers
+
+
+def test_frozen_answers_hash__insertion_order__same_hash():
+    first = FrozenAnswers().set("a", SOME_STRING).set("b", True)
+    second = FrozenAnswers().set("b", True).set("a", SOME_STRING)
+
+    assert first == second
+    assert hash(first) == hash(second)
+    assert {first: SOME_STRING}[second] == SOME_STRING
+
+
+def test_frozen_answers_hash__after_delete__same_as_never_added():
+    expected = FrozenAnswers(SOME_ANSWERS)
+
+    result = expected.set(SOME_NAME, SOME_STRING).delete(SOME_NAME)
+
+    assert result == expected
+    assert hash(result) == hash(expected)
+
+
+@pytest.mark.parametrize(
+    "other", [FrozenAnswers({"a": SOME_STRING}), FrozenAnswers({"a": "one", "c": "3"})]
+)
+def test_frozen_answers_eq__different_answers__not_equal(other):
+    assert FrozenAnswers(SOME_ANSWERS) != other
+
+
+def test_frozen_answers_eq__dict__equal():
+    assert FrozenAnswers(SOME_ANSWERS) == SOME_ANSWERS
+
+
+def test_frozen_answers__colliding_hashes__all_answers_stored():
+    keys = [_CollidingKey(f"key-{i}") for i in range(3)]
+    answers = FrozenAnswers()
+    for key in keys:
+        answers = answers.set(key, key)
+    answers = answers.set(keys[1], SOME_STRING)
+
+    assert answers == {keys[0]: keys[0], keys[1]: SOME_STRING, keys[2]: keys[2]}
+    assert _CollidingKey(SOME_NAME) not in answers
+    assert answers.delete(keys[0]).delete(keys[2]) == {keys[1]: SOME_STRING}
+
+
+def test_frozen_answers__colliding_and_regular_keys__all_answers_stored():
+    colliding = [_CollidingKey("x"), _CollidingKey("y")]
+    regular = [f"key-{i}" for i in range(100)]
+    expected = {key: key for key in [*colliding, *regular]}
+
+    answers = FrozenAnswers(expected)
+
+    assert answers == expected
+    for key in colliding:
+        answers = answers.delete(key)
+    assert answers == {key: key for key in regular}
+
+
+def test_frozen_answers__random_updates__matches_dict():
+    generator = random.Random(0)
+    expected: dict[str, Answer] = {}
+    answers = FrozenAnswers()
+    for _ in range(2000):
+        key = f"key-{generator.randrange(300)}"
+        if key in expected and generator.random() < 0.4:
+            del expected[key]
+            answers = answers.delete(key)
+        else:
+            values: list[Answer] = [True, False, key]
+            value = generator.choice(values)
+            expected[key] = value
+            answers = answers.set(key, value)
+
+    assert answers == expected
+    assert list(answers) == list(expected)
+    assert hash(answers) == hash(FrozenAnswers(expected))
+
+
+def test_frozen_answers_to_dict__dict_of_answers():
+    result = FrozenAnswers(SOME_ANSWERS).to_dict()
+
+    assert type(result) is dict
+    assert result == SOME_ANSWERS
+
+
+def test_frozen_answers_repr__contains_answers():
+    assert repr(SOME_ANSWERS) in repr(FrozenAnswers(SOME_ANSWERS))
@@ -0,0 +1,331 @@
+import numpy as np
+import pytest
+
+from columbo import (
+    And,
+    Answered,
+    Answers,
+    BasicQuestion,
+    Choice,
+    Confirm,
+    DuplicateQuestionNameException,
+    Echo,
+    Equals,
+    Interaction,
+    MutableAnswers,
+    Not,
+    OneOf,
+    Or,
+    Question,
+)
+from columbo.batch import AnswerColumns, evaluate_condition, evaluate_interactions
+from tests.sample_data import (
+    DUPLICATE_QUESTION_NAME_PARAMS,
+    SOME_DEFAULT,
+    SOME_NON_DEFAULT_OPTION,
+    SOME_OPTIONS,
+    SOME_STRING,
+    SampleDisplayable,
+    always_fail_validator,
+    some_dynamic_options,
+)
+
+SOME_RECORDS: list[Answers] = [
+    {"pet": "dog", "size": "large", "has_yard": True, "name": "Kaylee"},
+    {"pet": "dog", "size": "small", "has_yard": False},
+    {"pet": "cat", "name": "Mal"},
+    {"has_yard": True},
+    {},
+]
+SOME_COLUMNS = AnswerColumns.from_answers(SOME_RECORDS)
+
+
+@pytest.mark.parametrize(
+    "condition",
+    [
+        Answered("name"),
+        Answered("unknown"),
+        Equals("pet", "dog"),
+        Equals("has_yard", True),
+        Equals("has_yard", "True"),
+        Equals("pet", True),
+        Equals("unknown", "dog"),
+        OneOf("size", ["large", "giant"]),
+        OneOf("has_yard", [False, "True"]),
+        OneOf("unknown", ["dog"]),
+        And(Equals("pet", "dog"), Equals("has_yard", True)),
+        Or(Equals("pet", "cat"), Not(Answered("pet"))),
+        Not(OneOf("pet", ["dog", "cat"])) | Equals("size", "small"),
+    ],
+)
+def test_evaluate_condition__same_as_individual_records(condition):
+    result = evaluate_condition(condition, SOME_COLUMNS)
+
+    assert result.dtype == np.bool_
+    assert result.tolist() == [condition(record) for record in SOME_RECORDS]
+
+
+@pytest.mark.parametrize("condition", [Equals("mixed", True), OneOf("mixed", ["x"])])
+def test_evaluate_condition__mixed_column__same_as_individual_records(condition):
+    records: list[Answers] = [{"mixed": True}, {"mixed": "x"}, {"mixed": "True"}, {}]
+
+    result = evaluate_condition(condition, AnswerColumns.from_answers(records))
+
+    assert result.tolist() == [condition(record) for record in records]
+
+
+def test_evaluate_condition__unsupported_type__exception():
+    with pytest.raises(ValueError):
+        evaluate_condition(object(), SOME_COLUMNS)  # type: ignore[arg-type]
+
+
+def test_answer_columns_from_answers__rows__same_records():
+    assert SOME_COLUMNS.rows() == SOME_RECORDS
+
+
+def test_answer_columns_from_answers__names__only_given_columns():
+    columns = AnswerColumns.from_answers(SOME_RECORDS, names=["pet", "unknown"])
+
+    assert columns.names == ("pet", "unknown")
+    assert columns.answered("unknown").tolist() == [False] * len(SOME_RECORDS)
+
+
+def test_answer_columns__arrays__answered_by_default():
+    columns = AnswerColumns(
+        {"pet": np.array(["dog", "cat"]), "has_yard": [True, False]}
+    )
+
+    assert columns.rows() == [
+        {"pet": "dog", "has_yard": True},
+        {"pet": "cat", "has_yard": False},
+    ]
+
+
+@pytest.mark.parametrize(
+    ["columns", "answered"],
+    [
+        ({"a": ["x"], "b": ["x", "y"]}, None),
+        ({"a": ["x", "y"]}, {"a": [True]}),
+        ({"a": ["x", "y"]}, {"b": [True, True]}),
+    ],
+)
+def test_answer_columns__invalid_shape__exception(columns, answered):
+    with pytest.raises(ValueError):
+        AnswerColumns(columns, answered)
+
+
+def test_answer_columns__no_columns__length():
+    assert len(AnswerColumns({}, length=3)) == 3
+
+
+def test_evaluate_interactions__same_as_get_answers():
+    has_dog = Equals("pet", "dog")
+    interactions: list[Interaction] = [
+        Echo(SOME_STRING, should_ask=has_dog),
+        Choice("pet", SOME_STRING, ["dog", "cat", "none"], "none"),
+        Choice(
+            "size",
+            SOME_STRING,
+            ["small", "large"],
+            "small",
+            should_ask=has_dog,
+            value_if_not_asked="small",
+        ),
+        Confirm(
+            "has_yard",
+            SOME_STRING,
+            should_ask=has_dog & Equals("size", "large"),
+            value_if_not_asked=False,
+        ),
+        BasicQuestion(
+            "name",
+            SOME_STRING,
+            SOME_DEFAULT,
+            should_ask=lambda answers: "pet" in answers,
+        ),
+        BasicQuestion(
+            "nickname",
+            SOME_STRING,
+            SOME_DEFAULT,
+            should_ask=Not(Answered("name")),
+            value_if_not_asked=SOME_STRING,
+        ),
+    ]
+
+    result = evaluate_interactions(interactions, SOME_COLUMNS)
+
+    expected = [_evaluate_record(interactions, record) for record in SOME_RECORDS]
+    assert result.answers.rows() == [answers for _, answers in expected]
+    for name, mask in result.asked.items():
+        assert mask.tolist() == [asked[name] for asked, _ in expected]
+
+
+def _evaluate_record(
+    interactions: list[Interaction], record: Answers
+) -> tuple[dict[str, bool], MutableAnswers]:
+    """Evaluate a single record in the same way as get_answers() decides which questions to ask."""
+    answers = dict(record)
+    asked: dict[str, bool] = {}
+    for interaction in interactions:
+        if not isinstance(interaction, Question):
+            continue
+        asked[interaction.name] = interaction.should_ask(answers)
+        if not asked[interaction.name]:
+            answers.pop(interaction.name, None)
+            if interaction.value_if_not_asked is not None:
+                answers[interaction.name] = interaction.value_if_not_asked
+    return asked, answers
+
+
+def test_evaluate_interactions__value_if_not_asked__filled_for_not_asked_records():
+    interactions: list[Interaction] = [
+        Confirm(
+            "has_yard",
+            SOME_STRING,
+            should_ask=Equals("pet", "dog"),
+            value_if_not_asked=False,
+        ),
+        BasicQuestion(
+            "name",
+            SOME_STRING,
+            SOME_DEFAULT,
+            should_ask=Answered("pet"),
+            value_if_not_asked="a much longer value",
+        ),
+        BasicQuestion(
+            "unknown",
+            SOME_STRING,
+            SOME_DEFAULT,
+            should_ask=Equals("pet", "dog"),
+            value_if_not_asked=SOME_STRING,
+        ),
+    ]
+
+    result = evaluate_interactions(interactions, SOME_COLUMNS)
+
+    assert [row.get("has_yard") for row in result.answers.rows()] == [
+        True,
+        False,
+        False,
+        False,
+        False,
+    ]
+    assert [row.get("name") for row in result.answers.rows()] == [
+        "Kaylee",
+        None,
+        "Mal",
+        "a much longer value",
+        "a much longer value",
+    ]
+    assert [row.get("unknown") for row in result.answers.rows()] == [
+        None,
+        None,
+        SOME_STRING,
+        SOME_STRING,
+        SOME_STRING,
+    ]
+
+
+def test_evaluate_interactions__confirm_column_without_answers__filled_with_bool():
+    columns = AnswerColumns.from_answers(
+        [{"a": False}, {"a": False, "s": "ab"}], names=["a", "b", "s"]
+    )
+    interactions: list[Interaction] = [
+        Confirm("a", SOME_STRING),
+        Confirm(
+            "b",
+            SOME_STRING,
+            should_ask=Equals("a", True),
+            value_if_not_asked=True,
+        ),
+    ]
+
+    result = evaluate_interactions(interactions, columns)
+
+    assert [row["b"] for row in result.answers.rows()] == [True, True]
+
+
+def test_evaluate_interactions__answers_of_other_type__types_kept_when_filled():
+    columns = AnswerColumns.from_answers([{"a": False}, {"a": True, "b": SOME_STRING}])
+    interactions: list[Interaction] = [
+        Confirm("a", SOME_STRING),
+        Confirm(
+            "b",
+            SOME_STRING,
+            should_ask=Equals("a", True),
+            value_if_not_asked=True,
+        ),
+    ]
+
+    result = evaluate_interactions(interactions, columns)
+
+    assert [row["b"] for row in result.answers.rows()] == [True, SOME_STRING]
+
+
+def test_evaluate_interactions__not_asked__answer_removed():
+    interactions: list[Interaction] = [
+        Confirm("has_yard", SOME_STRING, should_ask=Equals("pet", "dog")),
+        BasicQuestion("unknown", SOME_STRING, SOME_DEFAULT, should_ask=Answered("pet")),
+    ]
+
+    result = evaluate_interactions(interactions, SOME_COLUMNS)
+
+    assert [row.get("has_yard") for row in result.answers.rows()] == [
+        True,
+        False,
+        None,
+        None,
+        None,
+    ]
+    assert "unknown" not in result.answers.names
+
+
+@pytest.mark.parametrize(
+    "question",
+    [
+        Choice(
+            "pet",
+            SOME_STRING,
+            SOME_OPTIONS,
+            SOME_DEFAULT,
+            should_ask=Equals("has_yard", True),
+            value_if_not_asked=SOME_STRING,
+        ),
+        Choice(
+            "pet",
+            SOME_STRING,
+            some_dynamic_options,
+            SOME_DEFAULT,
+            should_ask=Equals("has_yard", True),
+            value_if_not_asked=SOME_NON_DEFAULT_OPTION,
+        ),
+        BasicQuestion(
+            "pet",
+            SOME_STRING,
+            SOME_DEFAULT,
+            should_ask=Equals("has_yard", True),
+            validator=always_fail_validator,
+            value_if_not_asked=SOME_STRING,
+        ),
+    ],
+)
+def test_evaluate_interactions__invalid_value_if_not_asked__exception(question):
+    with pytest.raises(ValueError, match="NotAsked value is not valid"):
+        evaluate_interactions([question], SOME_COLUMNS)
+
+
+def test_evaluate_interactions__unsupported_interaction__exception():
+    with pytest.raises(ValueError):
+        evaluate_interactions([5], SOME_COLUMNS)  # type: ignore[list-item]
+
+
+def test_evaluate_interactions__custom_displayable__ignored():
+    result = evaluate_interactions([SampleDisplayable(SOME_STRING)], SOME_COLUMNS)
+
+    assert result.asked == {}
+
+
+@pytest.mark.parametrize("questions", DUPLICATE_QUESTION_NAME_PARAMS)
+def test_evaluate_interactions__duplicate_question_name__exception(questions):
+    with pytest.raises(DuplicateQuestionNameException):
+        evaluate_interactions(questions, SOME_COLUMNS)
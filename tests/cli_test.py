@@ -1,15 +1,25 @@
-from argparse import Namespace
+import time
+from argparse import ArgumentError, ArgumentParser, Namespace
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List
 
 import pytest
 
 from columbo import (
+    Answers,
     BasicQuestion,
     Choice,
     CliException,
     Confirm,
     DuplicateQuestionNameException,
     Echo,
+    Interaction,
+    SlotAnswers,
     ValidationFailure,
+    ValidationResponse,
+    ValidationSuccess,
+    add_arguments,
+    answer_layout,
     parse_args,
 )
 from columbo._cli import create_parser, format_cli_help, to_answers
@@ -460,3 +470,270 @@ def test_format_cli_help__parser_name__name_in_result():
 def test_format_cli_help__duplicate_question_name__exception(questions):
     with pytest.raises(DuplicateQuestionNameException):
         format_cli_help(questions)
+
+
+def test_to_answer__slot_answers__slot_answers_result():
+    questions = [BasicQuestion(SOME_NAME, SOME_STRING, SOME_DEFAULT)]
+    initial_answers = answer_layout(questions).new_answers()
+
+    answers = to_answers(
+        questions, Namespace(**{SOME_NAME: SOME_STRING}), initial_answers
+    )
+
+    assert isinstance(answers, SlotAnswers)
+    assert answers == {SOME_NAME: SOME_STRING}
+
+
+def _slow_validator(expected: str) -> Callable[[str, Answers], ValidationResponse]:
+    def validate(value: str, answers: Answers) -> ValidationResponse:
+        # long enough that the validators only finish in time if they run at the same time
+        time.sleep(0.2)
+        if value == expected:
+            return ValidationSuccess()
+        return ValidationFailure(f"expected {expected}")
+
+    return validate
+
+
+def test_parse_args__validation_executor__validators_run_concurrently():
+    questions = [
+        BasicQuestion(
+            f"q{i}", SOME_STRING, SOME_DEFAULT, validator=_slow_validator("x")
+        )
+        for i in range(5)
+    ]
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        answers = parse_args(questions, [], validation_executor=executor)
+
+    assert time.perf_counter() - start < 0.8
+    assert answers == {f"q{i}": SOME_DEFAULT for i in range(5)}
+
+
+def test_parse_args__validation_executor__all_errors_reported():
+    questions = [
+        BasicQuestion(
+            "first", SOME_STRING, SOME_DEFAULT, validator=_slow_validator("a")
+        ),
+        Choice("second", SOME_STRING, lambda _: SOME_OPTIONS, SOME_DEFAULT),
+        BasicQuestion(
+            "third", SOME_STRING, SOME_DEFAULT, validator=_slow_validator("b")
+        ),
+    ]
+
+    with ThreadPoolExecutor() as executor:
+        with pytest.raises(CliException) as ex:
+            parse_args(
+                questions,
+                ["--second", SOME_INVALID_OPTION],
+                exit_on_error=False,
+                validation_executor=executor,
+            )
+
+    lines = str(ex.value).splitlines()
+    assert len(lines) == 3
+    assert lines[0].endswith("'--first': expected a")
+    assert f"'{SOME_INVALID_OPTION}' is not a valid value for '--second'" in lines[1]
+    assert lines[2].endswith("'--third': expected b")
+
+
+def test_to_answers__validation_executor__answers_given_before_question():
+    seen: List[Answers] = []
+
+    def validate(value: str, answers: Answers) -> ValidationResponse:
+        seen.append(answers)
+        return ValidationSuccess()
+
+    questions: List[Interaction] = [
+        Confirm("confirm", SOME_STRING, default=True),
+        BasicQuestion(SOME_NAME, SOME_STRING, SOME_DEFAULT, validator=validate),
+        BasicQuestion(SOME_OTHER_STRING, SOME_STRING, SOME_DEFAULT),
+    ]
+
+    with ThreadPoolExecutor() as executor:
+        to_answers(questions, Namespace(), validation_executor=executor)
+
+    assert seen == [{"confirm": True}]
+
+
+def test_to_answers__validation_executor_validator_raises__exception():
+    def validate(value: str, answers: Answers) -> ValidationResponse:
+        raise OSError(SOME_STRING)
+
+    questions = [
+        BasicQuestion(SOME_NAME, SOME_STRING, SOME_DEFAULT, validator=validate)
+    ]
+
+    with ThreadPoolExecutor() as executor:
+        with pytest.raises(OSError, match=SOME_STRING):
+            to_answers(questions, Namespace(), validation_executor=executor)
+
+
+def test_to_answers__validation_executor_misconfigured__checks_cancelled(mocker):
+    executor = mocker.Mock()
+    questions: List[Interaction] = [
+        Choice(SOME_NAME, SOME_STRING, SOME_OPTIONS, SOME_DEFAULT),
+        # the dynamic default doesn't produce a string
+        BasicQuestion(SOME_OTHER_STRING, SOME_STRING, lambda _: 1),  # type: ignore[arg-type,return-value]
+    ]
+
+    with pytest.raises(ValueError):
+        to_answers(questions, Namespace(), validation_executor=executor)
+
+    executor.submit.return_value.cancel.assert_called_once_with()
+
+
+def test_to_answers__validation_executor_dependent_default__only_invalid_value_reported():
+    ports = {"web": ["80", "443"]}
+    questions: List[Interaction] = [
+        BasicQuestion("kind", SOME_STRING, "web", validator=_slow_validator("web")),
+        BasicQuestion("port", SOME_STRING, lambda a: ports[str(a["kind"])][0]),
+    ]
+
+    with ThreadPoolExecutor() as executor:
+        with pytest.raises(CliException) as ex:
+            to_answers(
+                questions, Namespace(kind="zz", port=None), validation_executor=executor
+            )
+
+    assert str(ex.value) == "'zz' is not a valid value for '--kind': expected web"
+
+
+def test_to_answers__validation_executor_dependent_validator__not_called_for_invalid_value(
+    mocker,
+):
+    validator = mocker.Mock(return_value=ValidationSuccess())
+    questions: List[Interaction] = [
+        BasicQuestion("kind", SOME_STRING, "web", validator=_slow_validator("web")),
+        BasicQuestion(
+            "port",
+            SOME_STRING,
+            SOME_DEFAULT,
+            validator=lambda v, a: validator(v, a["kind"]),
+        ),
+        BasicQuestion(
+            "name", SOME_STRING, SOME_DEFAULT, validator=_slow_validator("x")
+        ),
+    ]
+
+    with ThreadPoolExecutor() as executor:
+        with pytest.raises(CliException) as ex:
+            to_answers(
+                questions,
+                Namespace(kind="zz", port=None, name="y"),
+                validation_executor=executor,
+            )
+
+    assert str(ex.value).splitlines() == [
+        "'zz' is not a valid value for '--kind': expected web",
+        "'y' is not a valid value for '--name': expected x",
+    ]
+    validator.assert_not_called()
+
+
+def test_to_answers__validation_executor_dependent_value__waits_for_check():
+    questions: List[Interaction] = [
+        BasicQuestion("kind", SOME_STRING, "web", validator=_slow_validator("web")),
+        Confirm("secure", SOME_STRING, default=lambda a: a["kind"] == "web"),
+    ]
+
+    with ThreadPoolExecutor() as executor:
+        answers = to_answers(questions, Namespace(), validation_executor=executor)
+
+    assert answers == {"kind": "web", "secure": True}
+
+
+def test_to_answers__validation_executor_validator_raises__other_checks_finish():
+    finished: List[str] = []
+
+    def validate(value: str, answers: Answers) -> ValidationResponse:
+        raise OSError(SOME_STRING)
+
+    def slow(value: str, answers: Answers) -> ValidationResponse:
+        time.sleep(0.2)
+        finished.append(value)
+        return ValidationFailure(SOME_STRING)
+
+    questions = [
+        BasicQuestion("first", SOME_STRING, SOME_DEFAULT, validator=slow),
+        BasicQuestion("second", SOME_STRING, SOME_DEFAULT, validator=validate),
+        BasicQuestion("third", SOME_STRING, SOME_DEFAULT, validator=slow),
+    ]
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        with pytest.raises(OSError, match=SOME_STRING):
+            to_answers(questions, Namespace(), validation_executor=executor)
+        # the checks that started have finished before the exception is raised
+        count = len(finished)
+
+    assert count == len(finished)
+
+
+def test_add_arguments__existing_parser__parsed_once_with_own_arguments():
+    parser = ArgumentParser()
+    parser.add_argument("--verbose", action="store_true")
+    questions: List[Interaction] = [
+        Confirm("confirm", SOME_STRING),
+        Choice(SOME_NAME, SOME_STRING, SOME_OPTIONS, SOME_DEFAULT),
+    ]
+
+    add_arguments(questions, parser)
+    result = parser.parse_args(["--verbose", SOME_ARG_NAME, SOME_NON_DEFAULT_OPTION])
+
+    assert result.verbose
+    assert to_answers(questions, result) == {
+        "confirm": False,
+        SOME_NAME: SOME_NON_DEFAULT_OPTION,
+    }
+
+
+def test_add_arguments__argument_group__arguments_in_group_help():
+    parser = ArgumentParser(prog=SOME_STRING)
+    group = parser.add_argument_group("questions")
+
+    add_arguments([Confirm(SOME_NAME, SOME_STRING)], group)
+
+    help_text = parser.format_help()
+    assert help_text.index("questions:") < help_text.rindex(f"--no-{SOME_NAME}")
+
+
+@pytest.mark.parametrize("questions", DUPLICATE_QUESTION_NAME_PARAMS)
+def test_add_arguments__duplicate_question_name__exception(questions):
+    with pytest.raises(DuplicateQuestionNameException):
+        add_arguments(questions, ArgumentParser())
+
+
+def test_add_arguments__conflicting_argument__argument_error():
+    parser = ArgumentParser()
+    parser.add_argument(SOME_ARG_NAME)
+
+    with pytest.raises(ArgumentError):
+        add_arguments([BasicQuestion(SOME_NAME, SOME_STRING, SOME_DEFAULT)], parser)
+
+
+@pytest.mark.parametrize(
+    ["question", "args", "expected"],
+    [
+        [BasicQuestion(SOME_NAME, SOME_STRING, SOME_DEFAULT), [], SOME_DEFAULT],
+        [Confirm(SOME_NAME, SOME_STRING), [f"--no-{SOME_NAME}"], False],
+    ],
+)
+def test_add_arguments__argument_stores_question_name__values_kept_apart(
+    question, args, expected
+):
+    parser = ArgumentParser()
+    parser.add_argument("--other", dest=SOME_NAME)
+    add_arguments([question], parser.add_argument_group("questions"))
+
+    result = parser.parse_args(["--other", SOME_OTHER_STRING, *args])
+
+    assert getattr(result, SOME_NAME) == SOME_OTHER_STRING
+    assert to_answers([question], result) == {SOME_NAME: expected}
+
+
+def test_to_answers__initial_answers_reuse_question_name__exception():
+    questions = [BasicQuestion(SOME_NAME, SOME_STRING, SOME_DEFAULT)]
+
+    with pytest.raises(DuplicateQuestionNameException):
+        to_answers(questions, Namespace(), {SOME_NAME: SOME_STRING})
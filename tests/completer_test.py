@@ -0,0 +1,76 @@
+import pytest
+from prompt_toolkit.completion import CompleteEvent
+from prompt_toolkit.document import Document
+
+from columbo._completer import CompletionIndex
+
+SOME_CANDIDATES = ["main", "Feature/Login", "feature/logout", "release-1.0", "fix-main"]
+
+
+def test_completion_index__prefix__matches_ignoring_case():
+    index = CompletionIndex(SOME_CANDIDATES)
+
+    assert index.matches("FEATURE/") == ["Feature/Login", "feature/logout"]
+
+
+def test_completion_index__no_text__first_candidates():
+    index = CompletionIndex(SOME_CANDIDATES, limit=2)
+
+    assert index.matches("") == ["Feature/Login", "feature/logout"]
+
+
+def test_completion_index__fuzzy__prefix_matches_then_closest_matches():
+    index = CompletionIndex(["ma---i", "main", "m-a-i", "fix-main", "other"])
+
+    assert index.matches("mai") == ["main", "fix-main", "m-a-i", "ma---i"]
+
+
+def test_completion_index__more_fuzzy_matches_than_scan_limit__first_matches_ranked(
+    mocker,
+):
+    mocker.patch("columbo._completer._FUZZY_SCAN_LIMIT", 2)
+    index = CompletionIndex(["xa---c", "ya--c", "za-c"])
+
+    # the closest match is after the first two matches, so it isn't ranked
+    assert index.matches("ac") == ["ya--c", "xa---c"]
+
+
+def test_completion_index__limit__at_most_limit_matches():
+    index = CompletionIndex((f"value-{i}" for i in range(1_000)), limit=3)
+
+    assert index.matches("v") == ["value-0", "value-1", "value-10"]
+    assert len(index.matches("9")) == 3
+
+
+def test_completion_index__duplicates__ignored():
+    index = CompletionIndex(["main", "main"])
+
+    assert len(index) == 1
+    assert index.matches("m") == ["main"]
+
+
+@pytest.mark.parametrize("text", ["a.c", "a\nb", "[x]"])
+def test_completion_index__special_characters__matched_literally(text):
+    index = CompletionIndex(["abc", "a.c", "a\nb", "[x]"])
+
+    assert index.matches(text) == [text]
+
+
+def test_completion_index__no_match__empty():
+    index = CompletionIndex(SOME_CANDIDATES)
+
+    assert index.matches("zzz") == []
+
+
+def test_completion_index__limit_not_positive__value_error():
+    with pytest.raises(ValueError, match="limit must be positive"):
+        CompletionIndex(SOME_CANDIDATES, limit=0)
+
+
+def test_completion_index__get_completions__replaces_text_before_cursor():
+    index = CompletionIndex(SOME_CANDIDATES)
+
+    completions = list(index.get_completions(Document("relea"), CompleteEvent()))
+
+    assert [c.text for c in completions] == ["release-1.0"]
+    assert completions[0].start_position == -5
@@ -0,0 +1,168 @@
+import shutil
+import subprocess  # nosec: B404
+
+import pytest
+
+from columbo import (
+    Acknowledge,
+    BasicQuestion,
+    Choice,
+    Confirm,
+    DuplicateQuestionNameException,
+    Echo,
+    Interaction,
+    format_completion_script,
+)
+from tests.sample_data import (
+    SOME_DEFAULT,
+    SOME_MAPPING_OPTIONS,
+    SOME_OPTIONS,
+    SOME_OTHER_STRING,
+    SOME_STRING,
+    some_dynamic_options,
+)
+
+SOME_PROGRAM = "my-app"
+SOME_INTERACTIONS: list[Interaction] = [
+    Echo(SOME_STRING),
+    Acknowledge(SOME_STRING),
+    Confirm("likes dogs", SOME_STRING, cli_help="Do you like dogs?"),
+    Choice("letter", SOME_STRING, SOME_OPTIONS, SOME_DEFAULT, cli_help="A letter"),
+    Choice("mapped", SOME_STRING, SOME_MAPPING_OPTIONS, SOME_DEFAULT),
+    Choice("dynamic", SOME_STRING, some_dynamic_options, SOME_DEFAULT),
+    BasicQuestion("path", SOME_STRING, SOME_OTHER_STRING),
+]
+BASH = shutil.which("bash")
+
+
+def _complete_bash(script: str, *words: str) -> list[str]:
+    assert BASH is not None  # nosec: B101
+    command = (
+        f'{script}\nCOMP_WORDS=("$@"); COMP_CWORD=$(($# - 1))\n'
+        '_columbo_my_app; printf "%s\\n" "${COMPREPLY[@]}"'
+    )
+    result = subprocess.run(  # nosec: B603
+        [BASH, "-c", command, "bash", SOME_PROGRAM, *words],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return [line for line in result.stdout.splitlines() if line]
+
+
+@pytest.mark.skipif(BASH is None, reason="bash is not installed")
+@pytest.mark.parametrize(
+    ["words", "expected"],
+    [
+        [
+            [""],
+            [
+                "--likes-dogs",
+                "--no-likes-dogs",
+                "--letter",
+                "--mapped",
+                "--dynamic",
+                "--path",
+            ],
+        ],
+        [["--l"], ["--likes-dogs", "--letter"]],
+        [["--no"], ["--no-likes-dogs"]],
+        [["--letter", ""], SOME_OPTIONS],
+        [["--mapped", "y"], ["y"]],
+        [["--dynamic", ""], []],
+        [["--path", ""], []],
+        [["--likes-dogs", "--p"], ["--path"]],
+    ],
+)
+def test_format_completion_script__bash__arguments_completed(words, expected):
+    script = format_completion_script(SOME_INTERACTIONS, SOME_PROGRAM, "bash")
+
+    assert _complete_bash(script, *words) == expected
+
+
+@pytest.mark.skipif(BASH is None, reason="bash is not installed")
+def test_format_completion_script__bash_value_with_spaces__quoted():
+    question = Choice("letter", SOME_STRING, ["a b", "it's"], "a b")
+    script = format_completion_script([question], SOME_PROGRAM, "bash")
+
+    assert _complete_bash(script, "--letter", "") == ["a b", "it's"]
+
+
+@pytest.mark.skipif(BASH is None, reason="bash is not installed")
+def test_format_completion_script__bash_completed__only_completion_function_defined():
+    assert BASH is not None  # nosec: B101
+    script = format_completion_script(SOME_INTERACTIONS, SOME_PROGRAM, "bash")
+    command = (
+        f'{script}\nCOMP_WORDS=("$@"); COMP_CWORD=$(($# - 1))\n'
+        "_columbo_my_app; declare -F"
+    )
+
+    result = subprocess.run(  # nosec: B603
+        [BASH, "-c", command, "bash", SOME_PROGRAM, "--letter", ""],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert result.stdout.splitlines() == ["declare -f _columbo_my_app"]
+
+
+def test_format_completion_script__zsh__arguments_specified():
+    script = format_completion_script(SOME_INTERACTIONS, SOME_PROGRAM, "zsh")
+
+    lines = script.splitlines()
+    assert lines[0] == f"#compdef {SOME_PROGRAM}"
+    assert "    '(--no-likes-dogs)--likes-dogs[Do you like dogs?]' \\" in lines
+    assert "    '(--likes-dogs)--no-likes-dogs[Do you like dogs?]' \\" in lines
+    assert "    '--letter[A letter]:letter:(x y z)' \\" in lines
+    assert "    '--mapped:mapped:(x y z)' \\" in lines
+    assert "    '--dynamic:dynamic:_default' \\" in lines
+    assert lines[-1] == "    '--path:path:_default'"
+
+
+def test_format_completion_script__zsh_special_characters__escaped():
+    question = Choice("letter", SOME_STRING, ["a:b", "it's (c)"], "a:b", cli_help="[x]")
+
+    script = format_completion_script([question], SOME_PROGRAM, "zsh")
+
+    assert "'--letter[\\[x\\]]:letter:(a\\:b it'\\''s\\ \\(c\\))'" in script
+
+
+def test_format_completion_script__fish__arguments_specified():
+    script = format_completion_script(SOME_INTERACTIONS, SOME_PROGRAM, "fish")
+
+    assert script.splitlines()[1:] == [
+        "complete -c 'my-app' -l likes-dogs -d 'Do you like dogs?'",
+        "complete -c 'my-app' -l no-likes-dogs -d 'Do you like dogs?'",
+        "complete -c 'my-app' -l letter -x -a 'x y z' -d 'A letter'",
+        "complete -c 'my-app' -l mapped -x -a 'x y z'",
+        "complete -c 'my-app' -l dynamic -r",
+        "complete -c 'my-app' -l path -r",
+    ]
+
+
+def test_format_completion_script__fish_special_characters__escaped():
+    question = Choice("letter", SOME_STRING, ["a b", "it's"], "a b", cli_help="it's")
+
+    script = format_completion_script([question], SOME_PROGRAM, "fish")
+
+    assert script.splitlines()[1] == (
+        "complete -c 'my-app' -l letter -x -a 'a\\\\ b it\\\\\\'s' -d 'it\\'s'"
+    )
+
+
+def test_format_completion_script__unsupported_shell__value_error():
+    with pytest.raises(ValueError, match="Unsupported shell: tcsh"):
+        format_completion_script(SOME_INTERACTIONS, SOME_PROGRAM, "tcsh")
+
+
+def test_format_completion_script__unsupported_interaction__value_error():
+    with pytest.raises(ValueError, match="Unsupported interaction type"):
+        format_completion_script([SOME_STRING], SOME_PROGRAM, "bash")  # type: ignore[list-item]
+
+
+def test_format_completion_script__duplicate_names__exception():
+    questions = [Confirm("a", SOME_STRING), Confirm("a", SOME_STRING)]
+
+    with pytest.raises(DuplicateQuestionNameException):
+        format_completion_script(questions, SOME_PROGRAM, "bash")
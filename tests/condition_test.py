@@ -0,0 +1,217 @@
+import json
+
+import pytest
+
+from columbo import (
+    And,
+    Answered,
+    BasicQuestion,
+    Condition,
+    Echo,
+    Equals,
+    Not,
+    OneOf,
+    Or,
+    get_answers,
+)
+from tests.sample_data import (
+    SOME_ANSWERS,
+    SOME_BOOL,
+    SOME_DEFAULT,
+    SOME_NAME,
+    SOME_OPTIONS,
+    SOME_STRING,
+)
+
+SOME_CONDITIONS = [
+    Answered("a"),
+    Equals("a", "one"),
+    Equals("a", SOME_BOOL),
+    OneOf("a", SOME_OPTIONS),
+    OneOf("a", [SOME_BOOL, SOME_STRING]),
+    And(Equals("a", "one")),
+    And(Equals("a", "one"), Answered("b")),
+    And(Answered("a"), Answered("b"), Not(Answered("c"))),
+    Or(Equals("a", "one")),
+    Or(Equals("a", "one"), Answered("b")),
+    Or(Answered("a"), Answered("b"), Answered("c")),
+    Not(Equals("b", "two")),
+]
+
+
+@pytest.mark.parametrize(
+    ["description", "condition", "expected_result"],
+    [
+        ("answered, present", Answered("a"), True),
+        ("answered, missing", Answered(SOME_NAME), False),
+        ("equals, same value", Equals("a", "one"), True),
+        ("equals, different value", Equals("a", "two"), False),
+        ("equals, missing", Equals(SOME_NAME, "one"), False),
+        ("one of, value in options", OneOf("b", ["one", "two"]), True),
+        ("one of, value not in options", OneOf("b", SOME_OPTIONS), False),
+        ("one of, missing", OneOf(SOME_NAME, ["one", "two"]), False),
+        ("and, one", And(Answered("a")), True),
+        ("and, both true", And(Answered("a"), Answered("b")), True),
+        ("and, one false", And(Answered("a"), Answered(SOME_NAME)), False),
+        (
+            "and, many",
+            And(Answered("a"), Answered("b"), Equals("a", "one")),
+            True,
+        ),
+        (
+            "and, many one false",
+            And(Answered("a"), Answered("b"), Answered(SOME_NAME)),
+            False,
+        ),
+        ("or, one", Or(Answered(SOME_NAME)), False),
+        ("or, one true", Or(Answered(SOME_NAME), Answered("b")), True),
+        ("or, both false", Or(Answered(SOME_NAME), Equals("a", "two")), False),
+        (
+            "or, many",
+            Or(Answered(SOME_NAME), Equals("a", "two"), Equals("b", "two")),
+            True,
+        ),
+        (
+            "or, many false",
+            Or(Answered(SOME_NAME), Equals("a", "two"), Equals("b", "one")),
+            False,
+        ),
+        ("not, true", Not(Answered("a")), False),
+        ("not, false", Not(Answered(SOME_NAME)), True),
+        ("and operator", Answered("a") & Answered(SOME_NAME), False),
+        ("or operator", Answered("a") | Answered(SOME_NAME), True),
+        ("not operator", ~Answered(SOME_NAME), True),
+    ],
+)
+def test_condition_call__expected_result(description, condition, expected_result):
+    assert condition(SOME_ANSWERS) is expected_result, description
+
+
+@pytest.mark.parametrize(
+    "condition", [Equals("a", True), OneOf("a", [True]), Equals("b", "True")]
+)
+def test_condition_call__string_and_bool__not_equal(condition):
+    assert not condition({"a": "True", "b": True})
+
+
+@pytest.mark.parametrize(
+    ["condition", "expected_dependencies"],
+    [
+        (Answered("a"), {"a"}),
+        (Equals("a", "one"), {"a"}),
+        (OneOf("a", SOME_OPTIONS), {"a"}),
+        (And(Answered("a"), Equals("b", "two")), {"a", "b"}),
+        (Or(Answered("a"), Not(Equals("c", "two")), Answered("a")), {"a", "c"}),
+        (Not(Answered("a")), {"a"}),
+    ],
+)
+def test_condition_dependencies__names_used(condition, expected_dependencies):
+    assert condition.dependencies == expected_dependencies
+
+
+@pytest.mark.parametrize("condition", SOME_CONDITIONS)
+def test_condition_from_dict__to_dict__same_condition(condition):
+    data = json.loads(json.dumps(condition.to_dict()))
+
+    assert Condition.from_dict(data) == condition
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {},
+        {"op": "unknown"},
+        {"op": "equals", "name": "a"},
+        {"op": "equals", "name": 5, "value": "one"},
+        {"op": "equals", "name": "a", "value": 5},
+        {"op": "one_of", "name": "a", "values": "one"},
+        {"op": "and", "conditions": []},
+        {"op": "not", "condition": "one"},
+    ],
+)
+def test_condition_from_dict__invalid_data__exception(data):
+    with pytest.raises(ValueError):
+        Condition.from_dict(data)
+
+
+@pytest.mark.parametrize("condition_type", [And, Or])
+def test_condition__no_conditions__exception(condition_type):
+    with pytest.raises(ValueError):
+        condition_type()
+
+
+def test_condition_eq__same_structure__equal_and_same_hash():
+    first = And(Equals("a", "one"), OneOf("b", ["x", "y"]))
+    second = And(Equals("a", "one"), OneOf("b", ["y", "x"]))
+
+    assert first == second
+    assert hash(first) == hash(second)
+
+
+@pytest.mark.parametrize(
+    "other",
+    [Equals("a", "two"), Equals("b", "one"), Answered("a"), Not(Equals("a", "one"))],
+)
+def test_condition_eq__different__not_equal(other):
+    assert Equals("a", "one") != other
+
+
+def test_condition_repr__contains_arguments():
+    assert repr(Equals("a", "one")) == "Equals('a', 'one')"
+
+
+def test_question_should_ask_condition__condition__condition():
+    condition = Equals("a", "one")
+
+    question = BasicQuestion(SOME_NAME, SOME_STRING, SOME_DEFAULT, should_ask=condition)
+
+    assert question.should_ask_condition is condition
+    assert question.should_ask(SOME_ANSWERS)
+
+
+@pytest.mark.parametrize("should_ask", [None, lambda _: True])
+def test_question_should_ask_condition__not_condition__none(should_ask):
+    question = BasicQuestion(
+        SOME_NAME, SOME_STRING, SOME_DEFAULT, should_ask=should_ask
+    )
+
+    assert question.should_ask_condition is None
+
+
+def test_displayable_should_ask_condition__condition__condition():
+    condition = Not(Answered("a"))
+
+    echo = Echo(SOME_STRING, should_ask=condition)
+
+    assert echo.should_ask_condition is condition
+    assert not echo.should_ask(SOME_ANSWERS)
+
+
+def test_get_answers__condition__questions_skipped():
+    interactions = [
+        BasicQuestion("first", SOME_STRING, SOME_DEFAULT),
+        BasicQuestion(
+            "second",
+            SOME_STRING,
+            SOME_DEFAULT,
+            should_ask=Equals("first", SOME_STRING),
+            value_if_not_asked=SOME_STRING,
+        ),
+    ]
+
+    result = get_answers(interactions, no_user_input=True)
+
+    assert result == {"first": SOME_DEFAULT, "second": SOME_STRING}
+
+
+def test_condition_properties__given_values():
+    equals = Equals("a", "one")
+    one_of = OneOf("b", SOME_OPTIONS)
+    combined = And(equals, Or(one_of, Answered("c")))
+    negated = Not(combined)
+
+    assert (equals.name, equals.value) == ("a", "one")
+    assert (one_of.name, one_of.values) == ("b", frozenset(SOME_OPTIONS))
+    assert combined.conditions[0] is equals
+    assert combined.conditions[1].conditions[1].name == "c"  # type: ignore[attr-defined]
+    assert negated.condition is combined
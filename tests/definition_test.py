@@ -0,0 +1,353 @@
+import json
+import tempfile
+
+import pytest
+
+from columbo import (
+    Acknowledge,
+    BasicQuestion,
+    Choice,
+    Confirm,
+    DuplicateQuestionNameException,
+    Echo,
+    Equals,
+    get_answers,
+    interactions_from_dict,
+    load_interactions,
+)
+from columbo._definition import _CACHE_SUFFIX
+from tests.sample_data import (
+    SOME_DEFAULT,
+    SOME_MAPPING_OPTIONS,
+    SOME_NAME,
+    SOME_NON_DEFAULT_OPTION,
+    SOME_OPTIONS,
+    SOME_OTHER_STRING,
+    SOME_STRING,
+)
+
+SOME_DEFINITION = {
+    "interactions": [
+        {"type": "echo", "message": SOME_STRING},
+        {
+            "type": "confirm",
+            "name": "confirm",
+            "message": SOME_STRING,
+            "default": True,
+            "cli_help": SOME_OTHER_STRING,
+        },
+        {
+            "type": "acknowledge",
+            "message": SOME_STRING,
+            "should_ask": Equals("confirm", False).to_dict(),
+        },
+        {
+            "type": "choice",
+            "name": "choice",
+            "message": SOME_STRING,
+            "options": SOME_OPTIONS,
+            "default": SOME_DEFAULT,
+            "timeout": 5,
+        },
+        {
+            "type": "basic",
+            "name": "basic",
+            "message": SOME_STRING,
+            "default": SOME_STRING,
+            "should_ask": Equals("choice", SOME_NON_DEFAULT_OPTION).to_dict(),
+            "value_if_not_asked": SOME_OTHER_STRING,
+            "completions": SOME_OPTIONS,
+        },
+    ]
+}
+SOME_TOML = """
+[[interactions]]
+type = "confirm"
+name = "confirm"
+message = "hello"
+default = true
+
+[[interactions]]
+type = "basic"
+name = "basic"
+message = "hello"
+default = "hello"
+should_ask = { op = "equals", name = "confirm", value = false }
+value_if_not_asked = "good-bye"
+"""
+
+
+def test_interactions_from_dict__definition__interactions():
+    interactions = interactions_from_dict(SOME_DEFINITION)
+
+    assert [type(i) for i in interactions] == [
+        Echo,
+        Confirm,
+        Acknowledge,
+        Choice,
+        BasicQuestion,
+    ]
+    confirm, acknowledge, choice, basic = interactions[1:]
+    assert isinstance(confirm, Confirm)
+    assert confirm.default is True
+    assert confirm.cli_help == SOME_OTHER_STRING
+    assert isinstance(acknowledge, Acknowledge)
+    assert acknowledge.should_ask({"confirm": False})
+    assert isinstance(choice, Choice)
+    assert choice.options == SOME_OPTIONS
+    assert choice.timeout == 5
+    assert isinstance(basic, BasicQuestion)
+    assert basic.value_if_not_asked == SOME_OTHER_STRING
+    assert basic.completions == tuple(SOME_OPTIONS)
+    assert get_answers(interactions[1:2] + interactions[3:], no_user_input=True) == {
+        "confirm": True,
+        "choice": SOME_DEFAULT,
+        "basic": SOME_OTHER_STRING,
+    }
+
+
+def test_interactions_from_dict__mapping_options__options_used():
+    data = {
+        "interactions": [
+            {
+                "type": "choice",
+                "name": SOME_NAME,
+                "message": SOME_STRING,
+                "options": SOME_MAPPING_OPTIONS,
+                "default": SOME_DEFAULT,
+            }
+        ]
+    }
+
+    (choice,) = interactions_from_dict(data)
+
+    assert isinstance(choice, Choice)
+    assert choice.options == SOME_MAPPING_OPTIONS
+
+
+@pytest.mark.parametrize(
+    ["data", "match"],
+    [
+        [{}, "must contain a list of interactions"],
+        [{"interactions": [SOME_STRING]}, "must contain a list of interactions"],
+        [{"interactions": [{"type": "other"}]}, "Unknown interaction type: other"],
+        [
+            {"interactions": [{"type": "echo", "message": "", "extra": 1}]},
+            "Unknown keys for echo: extra",
+        ],
+        [{"interactions": [{"type": "echo"}]}, "Invalid interaction data"],
+        [
+            {"interactions": [{"type": "basic", "name": 1, "message": ""}]},
+            "Invalid interaction data",
+        ],
+        [
+            {
+                "interactions": [
+                    {"type": "confirm", "name": "", "message": "", "default": ""}
+                ]
+            },
+            "Invalid interaction data",
+        ],
+        [
+            {
+                "interactions": [
+                    {
+                        "type": "choice",
+                        "name": "",
+                        "message": "",
+                        "options": [1],
+                        "default": "",
+                    }
+                ]
+            },
+            "Invalid interaction data",
+        ],
+        [
+            {
+                "interactions": [
+                    {
+                        "type": "basic",
+                        "name": "",
+                        "message": "",
+                        "default": "",
+                        "completions": SOME_STRING,
+                    }
+                ]
+            },
+            "Invalid interaction data",
+        ],
+        [
+            {
+                "interactions": [
+                    {"type": "echo", "message": "", "should_ask": SOME_STRING}
+                ]
+            },
+            "Invalid interaction data",
+        ],
+        [
+            {
+                "interactions": [
+                    {"type": "echo", "message": "", "should_ask": {"op": "other"}}
+                ]
+            },
+            "Unknown condition operation",
+        ],
+        [
+            {
+                "interactions": [
+                    {
+                        "type": "basic",
+                        "name": "",
+                        "message": "",
+                        "default": "",
+                        "timeout": True,
+                    }
+                ]
+            },
+            "Invalid interaction data",
+        ],
+        [
+            {
+                "interactions": [
+                    {
+                        "type": "confirm",
+                        "name": "",
+                        "message": "",
+                        "timeout": 0,
+                    }
+                ]
+            },
+            "timeout must be positive",
+        ],
+    ],
+)
+def test_interactions_from_dict__invalid_data__value_error(data, match):
+    with pytest.raises(ValueError, match=match):
+        interactions_from_dict(data)
+
+
+def test_interactions_from_dict__duplicate_names__exception():
+    question = {"type": "confirm", "name": SOME_NAME, "message": SOME_STRING}
+
+    with pytest.raises(DuplicateQuestionNameException):
+        interactions_from_dict({"interactions": [question, question]})
+
+
+def test_load_interactions__json_file__interactions(tmp_path):
+    path = tmp_path / "interactions.json"
+    path.write_text(json.dumps(SOME_DEFINITION))
+
+    assert len(load_interactions(path)) == 5
+
+
+def test_load_interactions__toml_file__interactions(tmp_path):
+    path = tmp_path / "interactions.toml"
+    path.write_text(SOME_TOML)
+
+    interactions = load_interactions(path)
+
+    assert get_answers(interactions, no_user_input=True) == {
+        "confirm": True,
+        "basic": SOME_OTHER_STRING,
+    }
+
+
+def test_load_interactions__not_an_object__value_error(tmp_path):
+    path = tmp_path / "interactions.json"
+    path.write_text("[]")
+
+    with pytest.raises(ValueError, match="must be an object"):
+        load_interactions(path)
+
+
+def test_load_interactions__cache_dir__cache_used_for_same_content(tmp_path):
+    path = tmp_path / "interactions.toml"
+    path.write_text(SOME_TOML)
+    cache_dir = tmp_path / "cache"
+
+    first = load_interactions(path, cache_dir=cache_dir)
+    (cache_file,) = cache_dir.iterdir()
+    assert cache_file.suffix == _CACHE_SUFFIX
+    # prove that the second load reads the cache, instead of the file
+    path.write_text(SOME_TOML)
+    cache_file.write_bytes(
+        cache_file.read_bytes().replace(b'"hello"', b'"from-cache"', 1)
+    )
+    second = load_interactions(path, cache_dir=cache_dir)
+
+    assert [i.message for i in first] == ["hello", "hello"]
+    assert [i.message for i in second] == ["from-cache", "hello"]
+
+
+def test_load_interactions__content_changed__new_cache_entry(tmp_path):
+    path = tmp_path / "interactions.toml"
+    path.write_text(SOME_TOML)
+    cache_dir = tmp_path / "cache"
+    load_interactions(path, cache_dir=cache_dir)
+
+    path.write_text(SOME_TOML.replace('message = "hello"', 'message = "changed"', 1))
+    interactions = load_interactions(path, cache_dir=cache_dir)
+
+    assert interactions[0].message == "changed"
+    assert len(list(cache_dir.iterdir())) == 2
+
+
+@pytest.mark.parametrize("content", [b"", b"columbo-definition\x00\xff\xff{}"])
+def test_load_interactions__invalid_cache__file_parsed(tmp_path, content):
+    path = tmp_path / "interactions.toml"
+    path.write_text(SOME_TOML)
+    cache_dir = tmp_path / "cache"
+    load_interactions(path, cache_dir=cache_dir)
+    (cache_file,) = cache_dir.iterdir()
+    cache_file.write_bytes(content)
+
+    interactions = load_interactions(path, cache_dir=cache_dir)
+
+    assert [i.message for i in interactions] == ["hello", "hello"]
+    assert cache_file.read_bytes() != content
+
+
+def test_load_interactions__cache_dir_not_writable__file_parsed(tmp_path):
+    path = tmp_path / "interactions.toml"
+    path.write_text(SOME_TOML)
+    cache_dir = tmp_path / "not-a-dir"
+    cache_dir.write_text("")
+
+    assert len(load_interactions(path, cache_dir=cache_dir)) == 2
+
+
+def test_load_interactions__json_file_with_cache_dir__not_cached(tmp_path):
+    path = tmp_path / "interactions.json"
+    path.write_text(json.dumps(SOME_DEFINITION))
+    cache_dir = tmp_path / "cache"
+
+    assert len(load_interactions(path, cache_dir=cache_dir)) == 5
+    assert not cache_dir.exists()
+
+
+def test_load_interactions__cache_write_fails__no_file_left(tmp_path, mocker):
+    path = tmp_path / "interactions.toml"
+    path.write_text(SOME_TOML)
+    cache_dir = tmp_path / "cache"
+    create_file = tempfile.NamedTemporaryFile
+
+    def failing_file(**kwargs):
+        file = create_file(**kwargs)
+        mocker.patch.object(file, "write", side_effect=OSError)
+        return file
+
+    mocker.patch("columbo._definition.tempfile.NamedTemporaryFile", failing_file)
+
+    assert len(load_interactions(path, cache_dir=cache_dir)) == 2
+    assert list(cache_dir.iterdir()) == []
+
+
+def test_load_interactions__invalid_definition__not_cached(tmp_path):
+    path = tmp_path / "interactions.json"
+    path.write_text(json.dumps({"interactions": [{"type": "other"}]}))
+    cache_dir = tmp_path / "cache"
+
+    with pytest.raises(ValueError):
+        load_interactions(path, cache_dir=cache_dir)
+
+    assert not cache_dir.exists()
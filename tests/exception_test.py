@@ -14,3 +14,15 @@ from columbo._exception import (
 def test_all_custom_exception__inherits_from_custom_base(exception):
     with pytest.raises(ColumboException):
         raise exception
+
+
+def test_cli_exception_combine__single_error__same_error():
+    error = CliException("test-value")
+
+    assert CliException.combine([error]) is error
+
+
+def test_cli_exception_combine__multiple_errors__message_per_line():
+    result = CliException.combine([CliException("first"), CliException("second")])
+
+    assert str(result) == "first\nsecond"
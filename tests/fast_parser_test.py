@@ -0,0 +1,154 @@
+import pytest
+
+from columbo import (
+    Acknowledge,
+    BasicQuestion,
+    Choice,
+    CliException,
+    Confirm,
+    Echo,
+    Interaction,
+    ValidationFailure,
+    parse_args,
+)
+from columbo._cli import create_parser
+from columbo._fast_parser import FastParser
+from tests.sample_data import (
+    SOME_DEFAULT,
+    SOME_INVALID_OPTION,
+    SOME_MAPPING_OPTIONS,
+    SOME_NON_DEFAULT_OPTION,
+    SOME_OPTIONS,
+    SOME_OTHER_STRING,
+    SOME_STRING,
+)
+
+SOME_INTERACTIONS: list[Interaction] = [
+    Echo(SOME_STRING),
+    Acknowledge(SOME_STRING),
+    Confirm("likes dogs", SOME_STRING),
+    Choice("letter", SOME_STRING, SOME_OPTIONS, SOME_DEFAULT),
+    Choice("mapped", SOME_STRING, SOME_MAPPING_OPTIONS, SOME_DEFAULT),
+    Choice("dynamic", SOME_STRING, lambda _: SOME_OPTIONS, SOME_DEFAULT),
+    BasicQuestion("path", SOME_STRING, SOME_OTHER_STRING),
+]
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        [],
+        ["--likes-dogs"],
+        ["--likes-dogs", "--no-likes-dogs"],
+        ["--no-likes-dogs", "--likes-dogs"],
+        ["--letter", SOME_NON_DEFAULT_OPTION],
+        ["--letter=" + SOME_NON_DEFAULT_OPTION],
+        ["--mapped", SOME_NON_DEFAULT_OPTION],
+        ["--dynamic", SOME_INVALID_OPTION],
+        ["--path", "a b=c"],
+        ["--path="],
+        ["--path", ""],
+        ["--path", "x", "--path", "y"],
+    ],
+)
+def test_fast_parser__supported_args__same_result_as_argparse(args):
+    result = FastParser(SOME_INTERACTIONS).parse_args(args)
+
+    assert result == create_parser(SOME_INTERACTIONS).parse_args(args)
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ["--unknown"],
+        ["positional"],
+        ["--lett", SOME_DEFAULT],
+        ["--letter", SOME_INVALID_OPTION],
+        ["--letter"],
+        ["--path", "-x"],
+        ["--path", "--likes-dogs"],
+        ["--path", "--path", "--likes-dogs"],
+        ["--likes-dogs=yes"],
+        ["--", "--path", SOME_STRING],
+        ["-h"],
+    ],
+)
+def test_fast_parser__other_args__argparse_needed(args):
+    assert FastParser(SOME_INTERACTIONS).parse_args(args) is None
+
+
+def test_fast_parser__conflicting_arguments__argparse_needed():
+    interactions: list[Interaction] = [
+        Confirm("x", SOME_STRING),
+        BasicQuestion("no-x", SOME_STRING, SOME_DEFAULT),
+    ]
+
+    assert FastParser(interactions).parse_args([]) is None
+
+
+def test_fast_parser__name_with_equals__exact_match_first():
+    interactions: list[Interaction] = [
+        BasicQuestion("a", SOME_STRING, SOME_DEFAULT),
+        BasicQuestion("a=b", SOME_STRING, SOME_DEFAULT),
+    ]
+    args = ["--a=b", SOME_STRING]
+
+    result = FastParser(interactions).parse_args(args)
+
+    assert result == create_parser(interactions).parse_args(args)
+
+
+def test_fast_parser__unsupported_interaction__value_error():
+    with pytest.raises(ValueError, match="Unsupported interaction type"):
+        FastParser([SOME_STRING])  # type: ignore[list-item]
+
+
+def test_parse_args__fast_parser__same_answers():
+    args = ["--no-likes-dogs", "--letter", SOME_NON_DEFAULT_OPTION]
+
+    result = parse_args(SOME_INTERACTIONS, args, fast_parser=True)
+
+    assert result == parse_args(SOME_INTERACTIONS, args)
+
+
+def test_parse_args__fast_parser_args_from_sys_argv__parsed(mocker):
+    mocker.patch("sys.argv", ["my-app", "--path", SOME_STRING])
+
+    result = parse_args(SOME_INTERACTIONS, fast_parser=True)
+
+    assert result["path"] == SOME_STRING
+
+
+@pytest.mark.parametrize(
+    "args", [["--letter", SOME_INVALID_OPTION], ["--dynamic", SOME_INVALID_OPTION]]
+)
+def test_parse_args__fast_parser_invalid_value__same_error(args):
+    with pytest.raises(CliException) as expected:
+        parse_args(SOME_INTERACTIONS, args, exit_on_error=False)
+
+    with pytest.raises(CliException) as ex:
+        parse_args(SOME_INTERACTIONS, args, exit_on_error=False, fast_parser=True)
+
+    assert str(ex.value) == str(expected.value)
+
+
+def test_parse_args__fast_parser_validation_error_exit__usage_printed(capsys):
+    questions = [
+        BasicQuestion(
+            "path",
+            SOME_STRING,
+            SOME_DEFAULT,
+            validator=lambda v, a: ValidationFailure(SOME_STRING),
+        )
+    ]
+    args = ["--path", SOME_OTHER_STRING]
+
+    with pytest.raises(SystemExit):
+        parse_args(questions, args, parser_name="my-app")
+    expected = capsys.readouterr().err
+
+    with pytest.raises(SystemExit) as ex:
+        parse_args(questions, args, parser_name="my-app", fast_parser=True)
+
+    assert ex.value.code == 2
+    assert capsys.readouterr().err == expected
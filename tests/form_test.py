@@ -0,0 +1,171 @@
+import threading
+import time
+from typing import Optional
+
+import pytest
+from prompt_toolkit.input import PipeInput, create_pipe_input
+from prompt_toolkit.output import DummyOutput
+
+from columbo import (
+    Answers,
+    BasicQuestion,
+    Choice,
+    Confirm,
+    Echo,
+    Interaction,
+    IOContext,
+    MutableAnswers,
+    SlotAnswers,
+    ValidationFailure,
+    ValidationResponse,
+    ValidationSuccess,
+    answer_layout,
+    get_answers_form,
+)
+from tests.sample_data import (
+    SOME_DEFAULT,
+    SOME_NAME,
+    SOME_OPTIONS,
+    SOME_STRING,
+    SampleQuestion,
+    always_fail_validator,
+)
+
+TAB = "\t"
+ENTER = "\r"
+DOWN = "\x1b[B"
+BACKSPACE = "\x7f"
+
+
+def _no_x(value: str, _: Answers) -> ValidationResponse:
+    return ValidationFailure("no x") if "x" in value else ValidationSuccess()
+
+
+SOME_INTERACTIONS: list[Interaction] = [
+    Echo(SOME_STRING),
+    Confirm("confirm", SOME_STRING),
+    BasicQuestion(
+        "basic",
+        SOME_STRING,
+        "default",
+        should_ask=lambda answers: bool(answers["confirm"]),
+        validator=_no_x,
+        value_if_not_asked="skipped",
+    ),
+    Choice("choice", SOME_STRING, SOME_OPTIONS, SOME_OPTIONS[0]),
+]
+
+
+def _send(pipe_input: PipeInput, keys: list[str]) -> None:
+    for key in keys:
+        # sent separately, like a user pressing one key at a time
+        time.sleep(0.05)
+        pipe_input.send_text(key)
+
+
+def _run_form(
+    keys: list[str],
+    interactions: list[Interaction],
+    answers: Optional[Answers] = None,
+) -> MutableAnswers:
+    with create_pipe_input() as pipe_input:
+        sender = threading.Thread(target=_send, args=(pipe_input, keys))
+        sender.start()
+        try:
+            return get_answers_form(
+                interactions,
+                answers,
+                io=IOContext(input=pipe_input, output=DummyOutput()),
+            )
+        finally:
+            sender.join()
+
+
+def test_get_answers_form__question_shown_by_answer__answers():
+    keys = [" ", TAB, "valid", TAB, DOWN, " ", TAB, ENTER]
+
+    result = _run_form(keys, SOME_INTERACTIONS)
+
+    assert result == {"confirm": True, "basic": "valid", "choice": SOME_OPTIONS[1]}
+
+
+def test_get_answers_form__question_not_shown__value_if_not_asked():
+    result = _run_form([TAB, TAB, ENTER], SOME_INTERACTIONS)
+
+    assert result == {"confirm": False, "basic": "skipped", "choice": SOME_OPTIONS[0]}
+
+
+def test_get_answers_form__invalid_answer__not_submitted_until_corrected():
+    keys = [" ", TAB, "box", TAB, TAB, ENTER, BACKSPACE * 2, TAB, TAB, ENTER]
+
+    result = _run_form(keys, SOME_INTERACTIONS)
+
+    assert result["basic"] == "b"
+
+
+def test_get_answers_form__no_text_entered__default():
+    interactions: list[Interaction] = [
+        BasicQuestion(SOME_NAME, SOME_STRING, SOME_DEFAULT)
+    ]
+
+    result = _run_form([ENTER, ENTER], interactions)
+
+    assert result == {SOME_NAME: SOME_DEFAULT}
+
+
+def test_get_answers_form__options_depend_on_answer__options_updated():
+    interactions: list[Interaction] = [
+        Confirm("confirm", SOME_STRING),
+        Choice(
+            "choice",
+            SOME_STRING,
+            lambda answers: ["b", "c"] if answers["confirm"] else ["a", "b"],
+            lambda answers: "b",
+        ),
+    ]
+
+    result = _run_form([" ", TAB, DOWN, " ", TAB, ENTER], interactions)
+
+    assert result == {"confirm": True, "choice": "c"}
+
+
+def test_get_answers_form__slot_answers__slot_answers_result():
+    interactions: list[Interaction] = [
+        BasicQuestion(SOME_NAME, SOME_STRING, SOME_DEFAULT)
+    ]
+    initial = answer_layout(interactions).new_answers()
+
+    result = _run_form([ENTER, ENTER], interactions, initial)
+
+    assert isinstance(result, SlotAnswers)
+    assert result.to_dict() == {SOME_NAME: SOME_DEFAULT}
+
+
+def test_get_answers_form__default_fails_validator__exception():
+    interactions: list[Interaction] = [
+        BasicQuestion(
+            SOME_NAME, SOME_STRING, SOME_DEFAULT, validator=always_fail_validator
+        )
+    ]
+
+    with pytest.raises(ValueError, match="must satisfy the validator"):
+        _run_form([ENTER, ENTER], interactions)
+
+
+def test_get_answers_form__ctrl_c__keyboard_interrupt():
+    with pytest.raises(KeyboardInterrupt):
+        _run_form(["\x03"], SOME_INTERACTIONS)
+
+
+@pytest.mark.parametrize(
+    "interaction",
+    [
+        SampleQuestion(SOME_NAME, SOME_STRING),
+        Choice(SOME_NAME, SOME_STRING, SOME_OPTIONS, "not an option"),
+    ],
+)
+def test_get_answers_form__misconfigured_interaction__exception_before_form(
+    interaction,
+):
+    with pytest.raises(ValueError):
+        get_answers_form([interaction])
@@ -1,4 +1,10 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from io import StringIO
+
 import pytest
+from prompt_toolkit.input import create_pipe_input
+from prompt_toolkit.output import DummyOutput, create_output
 
 from columbo import (
     Acknowledge,
@@ -8,13 +14,20 @@ from columbo import (
     Confirm,
     DuplicateQuestionNameException,
     Echo,
+    FrozenAnswers,
     Interaction,
+    IOContext,
+    SlotAnswers,
     ValidationFailure,
+    ValidationResponse,
     ValidationSuccess,
 )
 from columbo._interaction import (
+    answer_layout,
     canonical_arg_name,
     get_answers,
+    iter_answers,
+    prompt_completer,
     to_labeled_options,
     to_value,
 )
@@ -35,6 +48,7 @@ from tests.sample_data import (
     SOME_NON_DEFAULT_OPTION,
     SOME_OPTIONS,
     SOME_OTHER_BOOL,
+    SOME_OTHER_STRING,
     SOME_STRING,
     SampleDisplayable,
     SampleQuestion,
@@ -172,7 +186,11 @@ def test_choice__static_message__multiple_choice_called_with_mapping_of_options(
     )
 
     user_io.multiple_choice.assert_called_once_with(
-        SOME_STRING, options_to_mc, default=SOME_DEFAULT, no_user_input=True
+        SOME_STRING,
+        options_to_mc,
+        default=SOME_DEFAULT,
+        no_user_input=True,
+        timeout=None,
     )
 
 
@@ -197,6 +215,7 @@ def test_choice__dynamic_message__multiple_choice_dynamic_message(
         dy_options_to_mc,
         default=SOME_DYNAMIC_DEFAULT_RESULT,
         no_user_input=True,
+        timeout=None,
     )
 
 
@@ -283,7 +302,11 @@ def test_choice_copy__diff_message__multiple_choice_diff_message(
     ).ask(SOME_ANSWERS, no_user_input=True)
 
     user_io.multiple_choice.assert_called_once_with(
-        SOME_STRING, dy_options_to_mc, default=SOME_DEFAULT, no_user_input=True
+        SOME_STRING,
+        dy_options_to_mc,
+        default=SOME_DEFAULT,
+        no_user_input=True,
+        timeout=None,
     )
 
 
@@ -301,7 +324,7 @@ def test_confirm__static_message__confirm_called(mocker):
     Confirm(SOME_NAME, SOME_STRING, SOME_BOOL).ask(SOME_ANSWERS, no_user_input=True)
 
     user_io.confirm.assert_called_once_with(
-        SOME_STRING, default=SOME_BOOL, no_user_input=True
+        SOME_STRING, default=SOME_BOOL, no_user_input=True, timeout=None
     )
 
 
@@ -313,7 +336,10 @@ def test_confirm__dynamic_message__confirm_dynamic_message(mocker):
     )
 
     user_io.confirm.assert_called_once_with(
-        SOME_DYNAMIC_STRING_RESULT, default=SOME_OTHER_BOOL, no_user_input=True
+        SOME_DYNAMIC_STRING_RESULT,
+        default=SOME_OTHER_BOOL,
+        no_user_input=True,
+        timeout=None,
     )
 
 
@@ -346,7 +372,7 @@ def test_confirm_copy__diff_message__confirm_diff_message(mocker):
     ).ask(SOME_ANSWERS, no_user_input=True)
 
     user_io.confirm.assert_called_once_with(
-        SOME_STRING, default=SOME_BOOL, no_user_input=True
+        SOME_STRING, default=SOME_BOOL, no_user_input=True, timeout=None
     )
 
 
@@ -374,7 +400,12 @@ def test_basic_question__static_message__ask_called(mocker):
     )
 
     user_io.ask.assert_called_once_with(
-        SOME_STRING, default=SOME_DEFAULT, no_user_input=True
+        SOME_STRING,
+        default=SOME_DEFAULT,
+        no_user_input=True,
+        validator=None,
+        timeout=None,
+        completer=None,
     )
 
 
@@ -389,6 +420,9 @@ def test_basic_question__dynamic_message__ask_dynamic_message(mocker):
         SOME_DYNAMIC_STRING_RESULT,
         default=SOME_DYNAMIC_DEFAULT_RESULT,
         no_user_input=True,
+        validator=None,
+        timeout=None,
+        completer=None,
     )
 
 
@@ -421,7 +455,12 @@ def test_basic_question_copy__diff_message__confirm_diff_message(mocker):
     ).ask(SOME_ANSWERS, no_user_input=True)
 
     user_io.ask.assert_called_once_with(
-        SOME_STRING, default=SOME_DEFAULT, no_user_input=True
+        SOME_STRING,
+        default=SOME_DEFAULT,
+        no_user_input=True,
+        validator=None,
+        timeout=None,
+        completer=None,
     )
 
 
@@ -488,6 +527,93 @@ def test_basic_question__invalid_asked_multiple_times(mocker, validity_responses
     assert user_io_ask_mock.call_count == len(validity_responses)
 
 
+def test_basic_question__static_completions__indexed_once(mocker):
+    user_io_ask_mock = mocker.patch(
+        "columbo._interaction.user_io.ask", return_value=SOME_STRING
+    )
+    # a generator can only be read once
+    question = BasicQuestion(
+        SOME_NAME, SOME_STRING, SOME_DEFAULT, completions=iter(SOME_OPTIONS)
+    )
+
+    question.ask(SOME_ANSWERS)
+    question.ask(SOME_ANSWERS)
+
+    first, second = (c.kwargs["completer"] for c in user_io_ask_mock.call_args_list)
+    assert first is second
+    assert first.matches("") == SOME_OPTIONS
+
+
+def test_prompt_completer__dynamic_completions__indexed_with_answers():
+    question = BasicQuestion(
+        SOME_NAME, SOME_STRING, SOME_DEFAULT, completions=some_dynamic_options
+    )
+
+    completer = prompt_completer(question, SOME_ANSWERS)
+
+    assert completer is not None
+    assert completer.matches("") == SOME_DYNAMIC_OPTION_RESULT
+    assert prompt_completer(question, SOME_ANSWERS) is not completer
+
+
+def test_prompt_completer__no_completions__none():
+    question = BasicQuestion(SOME_NAME, SOME_STRING, SOME_DEFAULT)
+
+    assert prompt_completer(question, SOME_ANSWERS) is None
+
+
+@pytest.mark.parametrize("completions", [SOME_STRING, [1]])
+def test_basic_question__invalid_completions__value_error(completions):
+    with pytest.raises(ValueError, match="Invalid completion"):
+        BasicQuestion(SOME_NAME, SOME_STRING, SOME_DEFAULT, completions=completions)
+
+
+@pytest.mark.parametrize("result", [SOME_STRING, [1], None])
+def test_prompt_completer__invalid_dynamic_completions__value_error(result):
+    question = BasicQuestion(
+        SOME_NAME, SOME_STRING, SOME_DEFAULT, completions=lambda _: result
+    )
+
+    with pytest.raises(ValueError, match="Invalid completion"):
+        prompt_completer(question, SOME_ANSWERS)
+
+
+def test_basic_question_copy__iterator_completions_after_asked__same_completions():
+    question = BasicQuestion(
+        SOME_NAME, SOME_STRING, SOME_DEFAULT, completions=iter(SOME_OPTIONS)
+    )
+    completer = prompt_completer(question, SOME_ANSWERS)
+
+    copy = question.copy(message=SOME_OTHER_STRING)
+
+    assert prompt_completer(copy, SOME_ANSWERS) is completer
+    assert copy.completions == tuple(SOME_OPTIONS)
+
+
+def test_basic_question_copy__new_completions__new_index():
+    question = BasicQuestion(
+        SOME_NAME, SOME_STRING, SOME_DEFAULT, completions=SOME_OPTIONS
+    )
+    prompt_completer(question, SOME_ANSWERS)
+
+    copy = question.copy(completions=[SOME_OTHER_STRING])
+
+    completer = prompt_completer(copy, SOME_ANSWERS)
+    assert completer is not None
+    assert completer.matches("") == [SOME_OTHER_STRING]
+
+
+def test_basic_question__no_user_input__completions_not_read():
+    question = BasicQuestion(
+        SOME_NAME,
+        SOME_STRING,
+        SOME_DEFAULT,
+        completions=lambda _: pytest.fail("completions read"),
+    )
+
+    assert question.ask(SOME_ANSWERS, no_user_input=True) == SOME_DEFAULT
+
+
 @pytest.mark.parametrize("no_user_input", [True, False])
 def test_basic_question__default_invalid_no_user_input__error(no_user_input, mocker):
     """
@@ -810,3 +936,515 @@ def test_value_if_not_asked__choice_value_if_not_asked_is_not_valid__raises_exce
         match=f"NotAsked value is not valid: Chosen value: {SOME_INVALID_OPTION} not in options",
     ):
         get_answers([question], no_user_input=True)
+
+
+@pytest.mark.parametrize(
+    "interaction",
+    [
+        Echo(SOME_STRING),
+        Acknowledge(SOME_STRING),
+        Confirm(SOME_NAME, SOME_STRING),
+        Choice(SOME_NAME, SOME_STRING, SOME_OPTIONS, SOME_DEFAULT),
+        BasicQuestion(SOME_NAME, SOME_STRING, SOME_DEFAULT),
+    ],
+)
+def test_interaction__slots__no_instance_dict(interaction):
+    assert not hasattr(interaction, "__dict__")
+    assert not hasattr(interaction.copy(), "__dict__")
+
+
+def test_basic_question_copy__slots__all_values_copied():
+    question = BasicQuestion(
+        SOME_NAME,
+        SOME_STRING,
+        SOME_DEFAULT,
+        cli_help=SOME_OTHER_STRING,
+        should_ask=some_dynamic_bool,
+        validator=always_fail_validator,
+        value_if_not_asked=SOME_NON_DEFAULT_OPTION,
+        completions=SOME_OPTIONS,
+    )
+
+    copy = question.copy()
+
+    for slot in ("_name", "_message", "_default", "_cli_help", "_should_ask"):
+        assert getattr(copy, slot) == getattr(question, slot), slot
+    assert copy.validate(SOME_STRING, SOME_ANSWERS) == ValidationFailure(
+        SOME_FAILURE_MESSAGE
+    )
+    assert copy.value_if_not_asked == SOME_NON_DEFAULT_OPTION
+    assert copy.completions == tuple(SOME_OPTIONS)
+
+
+def test_answer_layout__initial_answers_and_questions__slot_for_each():
+    interactions: list[Interaction] = [
+        Echo(SOME_STRING),
+        BasicQuestion(SOME_NAME, SOME_STRING, SOME_DEFAULT),
+    ]
+
+    layout = answer_layout(interactions, SOME_ANSWERS)
+
+    assert layout.names == (*SOME_ANSWERS.keys(), SOME_NAME)
+
+
+def test_answer_layout__duplicate_question_name__exception():
+    with pytest.raises(DuplicateQuestionNameException):
+        answer_layout(
+            [BasicQuestion(SOME_NAME, SOME_STRING, SOME_DEFAULT)],
+            answers={SOME_NAME: "existing value"},
+        )
+
+
+def test_get_answers__slot_answers__slot_answers_result():
+    interactions = [BasicQuestion(SOME_NAME, SOME_STRING, SOME_DEFAULT)]
+    initial_answers = answer_layout(interactions, SOME_ANSWERS).new_answers(
+        SOME_ANSWERS
+    )
+
+    result = get_answers(interactions, initial_answers, no_user_input=True)
+
+    assert isinstance(result, SlotAnswers)
+    assert result.layout is initial_answers.layout
+    assert result.to_dict() == {**SOME_ANSWERS, SOME_NAME: SOME_DEFAULT}
+    assert SOME_NAME not in initial_answers
+
+
+def test_get_answers__slot_answers_missing_question__exception():
+    interactions = [BasicQuestion(SOME_NAME, SOME_STRING, SOME_DEFAULT)]
+
+    with pytest.raises(ValueError):
+        get_answers(interactions, answer_layout([]).new_answers(), no_user_input=True)
+
+
+def test_get_answers__frozen_answers__snapshot_passed_to_each_dynamic_value():
+    snapshots = []
+
+    def record_snapshot(answers: Answers) -> str:
+        snapshots.append(answers)
+        return SOME_DEFAULT
+
+    interactions: list[Interaction] = [
+        BasicQuestion("first", SOME_STRING, record_snapshot),
+        BasicQuestion("second", SOME_STRING, record_snapshot),
+    ]
+    initial_answers = FrozenAnswers(SOME_ANSWERS)
+
+    result = get_answers(interactions, initial_answers, no_user_input=True)
+
+    assert isinstance(result, FrozenAnswers)
+    assert result == {**SOME_ANSWERS, "first": SOME_DEFAULT, "second": SOME_DEFAULT}
+    assert snapshots == [SOME_ANSWERS, {**SOME_ANSWERS, "first": SOME_DEFAULT}]
+    assert all(isinstance(snapshot, FrozenAnswers) for snapshot in snapshots)
+    assert initial_answers == SOME_ANSWERS
+
+
+def test_get_answers__frozen_answers_value_if_not_asked__value_recorded():
+    interactions: list[Interaction] = [
+        Confirm(
+            SOME_NAME, SOME_STRING, should_ask=lambda _: False, value_if_not_asked=True
+        )
+    ]
+
+    result = get_answers(interactions, FrozenAnswers(), no_user_input=True)
+
+    assert result == {SOME_NAME: True}
+
+
+def test_get_answers__no_user_input__defaults_without_prompting(mocker):
+    user_io = mocker.patch("columbo._interaction.user_io")
+    interactions: list[Interaction] = [
+        Confirm("confirm", SOME_STRING, SOME_BOOL),
+        Choice("choice", SOME_STRING, SOME_OPTIONS, SOME_DEFAULT),
+        BasicQuestion("basic", SOME_STRING, some_dynamic_default),
+    ]
+
+    result = get_answers(interactions, SOME_ANSWERS, no_user_input=True)
+
+    assert result == {
+        **SOME_ANSWERS,
+        "confirm": SOME_BOOL,
+        "choice": SOME_DEFAULT,
+        "basic": SOME_DYNAMIC_DEFAULT_RESULT,
+    }
+    user_io.confirm.assert_not_called()
+    user_io.multiple_choice.assert_not_called()
+    user_io.ask.assert_not_called()
+
+
+def test_get_answers__no_user_input_default_not_option__exception():
+    question = Choice(SOME_NAME, SOME_STRING, SOME_OPTIONS, SOME_INVALID_OPTION)
+
+    with pytest.raises(ValueError, match="was not an option"):
+        get_answers([question], no_user_input=True)
+
+
+def test_get_answers__no_user_input_default_fails_validator__exception():
+    question = BasicQuestion(
+        SOME_NAME, SOME_STRING, SOME_DEFAULT, validator=always_fail_validator
+    )
+
+    with pytest.raises(ValueError, match="must satisfy the validator"):
+        get_answers([question], no_user_input=True)
+
+
+def test_get_answers__no_user_input_custom_question__question_asked(mocker):
+    mocker.patch.object(SampleQuestion, "ask", return_value=SOME_STRING)
+    question = SampleQuestion(SOME_NAME, SOME_STRING)
+
+    result = get_answers([question], no_user_input=True)
+
+    assert result == {SOME_NAME: SOME_STRING}
+    assert SampleQuestion.ask.call_args.kwargs == {"no_user_input": True}  # type: ignore[attr-defined]
+
+
+class _AskedConfirm(Confirm):
+    def ask(self, answers, no_user_input=False):
+        return not SOME_BOOL
+
+
+class _AskedChoice(Choice):
+    def ask(self, answers, no_user_input=False):
+        return SOME_NON_DEFAULT_OPTION
+
+
+class _AskedBasicQuestion(BasicQuestion):
+    def ask(self, answers, no_user_input=False):
+        return SOME_OTHER_STRING
+
+
+@pytest.mark.parametrize(
+    ["question", "expected"],
+    [
+        [_AskedConfirm(SOME_NAME, SOME_STRING, SOME_BOOL), not SOME_BOOL],
+        [
+            _AskedChoice(SOME_NAME, SOME_STRING, SOME_OPTIONS, SOME_DEFAULT),
+            SOME_NON_DEFAULT_OPTION,
+        ],
+        [_AskedBasicQuestion(SOME_NAME, SOME_STRING, SOME_DEFAULT), SOME_OTHER_STRING],
+    ],
+)
+def test_get_answers__no_user_input_subclass_overrides_ask__question_asked(
+    question, expected
+):
+    assert get_answers([question], no_user_input=True) == {SOME_NAME: expected}
+
+
+def test_iter_answers__questions__each_answer_in_order():
+    interactions: list[Interaction] = [
+        Echo(SOME_STRING),
+        Confirm("confirm", SOME_STRING, SOME_BOOL),
+        BasicQuestion(
+            "skipped",
+            SOME_STRING,
+            SOME_DEFAULT,
+            should_ask=lambda _: False,
+            value_if_not_asked=SOME_OTHER_STRING,
+        ),
+        BasicQuestion("basic", SOME_STRING, SOME_DEFAULT),
+    ]
+
+    result = list(iter_answers(interactions, SOME_ANSWERS, no_user_input=True))
+
+    assert result == [
+        ("confirm", SOME_BOOL),
+        ("skipped", SOME_OTHER_STRING),
+        ("basic", SOME_DEFAULT),
+    ]
+
+
+def test_iter_answers__answer_consumed__next_question_not_yet_asked():
+    asked = []
+
+    def record_default(answers: Answers) -> str:
+        asked.append(dict(answers))
+        return SOME_DEFAULT
+
+    interactions: list[Interaction] = [
+        BasicQuestion("first", SOME_STRING, record_default),
+        BasicQuestion("second", SOME_STRING, record_default),
+    ]
+
+    answers = iter_answers(interactions, no_user_input=True)
+
+    assert next(answers) == ("first", SOME_DEFAULT)
+    assert asked == [{}]
+    assert next(answers) == ("second", SOME_DEFAULT)
+    assert asked == [{}, {"first": SOME_DEFAULT}]
+
+
+def test_iter_answers__frozen_answers__snapshot_passed_to_each_dynamic_value():
+    snapshots = []
+
+    def record_snapshot(answers: Answers) -> str:
+        snapshots.append(answers)
+        return SOME_DEFAULT
+
+    interactions: list[Interaction] = [
+        BasicQuestion("first", SOME_STRING, record_snapshot),
+        BasicQuestion("second", SOME_STRING, record_snapshot),
+    ]
+
+    result = list(iter_answers(interactions, FrozenAnswers(), no_user_input=True))
+
+    assert result == [("first", SOME_DEFAULT), ("second", SOME_DEFAULT)]
+    assert snapshots == [{}, {"first": SOME_DEFAULT}]
+    assert all(isinstance(snapshot, FrozenAnswers) for snapshot in snapshots)
+
+
+def test_iter_answers__duplicate_names__exception_before_iterating():
+    interactions: list[Interaction] = [
+        BasicQuestion(SOME_NAME, SOME_STRING, SOME_DEFAULT),
+        Confirm(SOME_NAME, SOME_STRING),
+    ]
+
+    with pytest.raises(DuplicateQuestionNameException):
+        iter_answers(interactions, no_user_input=True)
+
+
+def test_iter_answers__io_context__output_written_to_context():
+    stdout = StringIO()
+    io = IOContext(output=create_output(stdout=stdout))
+
+    result = list(iter_answers([Echo(SOME_STRING)], no_user_input=True, io=io))
+
+    assert result == []
+    assert SOME_STRING in stdout.getvalue()
+
+
+def _get_answers_in_context(
+    interactions: list[Interaction], index: int, keys: str = ""
+) -> tuple[Answers, str]:
+    stdout = StringIO()
+    with create_pipe_input() as pipe_input:
+        pipe_input.send_text(keys)
+        result = get_answers(
+            interactions,
+            {"index": str(index)},
+            no_user_input=not keys,
+            io=IOContext(input=pipe_input, output=create_output(stdout=stdout)),
+        )
+    return result, stdout.getvalue()
+
+
+def test_get_answers__io_context__output_written_to_context():
+    interactions: list[Interaction] = [
+        Echo(SOME_STRING),
+        BasicQuestion(SOME_NAME, SOME_STRING, SOME_DEFAULT),
+    ]
+
+    result, output = _get_answers_in_context(interactions, 0, f"{SOME_OTHER_STRING}\r")
+
+    assert result[SOME_NAME] == SOME_OTHER_STRING
+    assert SOME_STRING in output
+
+
+def test_get_answers__threads_with_own_io_context__isolated_answers_and_output():
+    interactions: list[Interaction] = [
+        BasicQuestion("user", SOME_STRING, lambda answers: f"user-{answers['index']}"),
+        Echo(lambda answers: f"session {answers['index']} for {answers['user']}"),
+    ]
+    count = 2000
+
+    with ThreadPoolExecutor(max_workers=32) as executor:
+        results = list(
+            executor.map(
+                lambda index: _get_answers_in_context(interactions, index), range(count)
+            )
+        )
+
+    for index, (result, output) in enumerate(results):
+        assert result == {"index": str(index), "user": f"user-{index}"}
+        assert output.split() == ["session", str(index), "for", f"user-{index}"]
+
+
+def test_get_answers__threads_with_user_input__isolated_answers():
+    interactions: list[Interaction] = [
+        Confirm("confirm", SOME_STRING),
+        Choice("choice", SOME_STRING, SOME_OPTIONS, SOME_DEFAULT),
+        BasicQuestion("basic", SOME_STRING, SOME_DEFAULT),
+    ]
+
+    def answer(index: int) -> tuple[Answers, str]:
+        keys = f"{'yn'[index % 2]}{index % 3 + 1}\ruser-{index}\r"
+        return _get_answers_in_context(interactions, index, keys)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(answer, range(16)))
+
+    for index, (result, _) in enumerate(results):
+        assert result == {
+            "index": str(index),
+            "confirm": index % 2 == 0,
+            "choice": SOME_OPTIONS[index % 3],
+            "basic": f"user-{index}",
+        }
+
+
+def test_get_answers__context_timeout_without_input__defaults():
+    interactions: list[Interaction] = [
+        Acknowledge(SOME_STRING),
+        Confirm("confirm", SOME_STRING, SOME_BOOL),
+        Choice("choice", SOME_STRING, SOME_OPTIONS, SOME_DEFAULT),
+        BasicQuestion("basic", SOME_STRING, SOME_DEFAULT),
+    ]
+
+    with create_pipe_input() as pipe_input:
+        result = get_answers(
+            interactions,
+            io=IOContext(input=pipe_input, output=DummyOutput(), timeout=0.01),
+        )
+
+    assert result == {
+        "confirm": SOME_BOOL,
+        "choice": SOME_DEFAULT,
+        "basic": SOME_DEFAULT,
+    }
+
+
+def test_get_answers__question_timeout_without_input__default():
+    interactions: list[Interaction] = [
+        BasicQuestion(SOME_NAME, SOME_STRING, SOME_DEFAULT, timeout=0.01)
+    ]
+
+    with create_pipe_input() as pipe_input:
+        result = get_answers(
+            interactions, io=IOContext(input=pipe_input, output=DummyOutput())
+        )
+
+    assert result == {SOME_NAME: SOME_DEFAULT}
+
+
+def test_get_answers__timeout_with_input__answer_used():
+    interactions: list[Interaction] = [
+        BasicQuestion(SOME_NAME, SOME_STRING, SOME_DEFAULT, timeout=5)
+    ]
+
+    with create_pipe_input() as pipe_input:
+        pipe_input.send_text(f"{SOME_OTHER_STRING}\r")
+        result = get_answers(
+            interactions, io=IOContext(input=pipe_input, output=DummyOutput())
+        )
+
+    assert result == {SOME_NAME: SOME_OTHER_STRING}
+
+
+@pytest.mark.parametrize("timeout", [0, -1])
+def test_question__timeout_not_positive__exception(timeout):
+    with pytest.raises(ValueError, match="timeout must be positive"):
+        Confirm(SOME_NAME, SOME_STRING, timeout=timeout)
+
+
+def test_question_copy__timeout__copy_uses_timeout():
+    question = BasicQuestion(SOME_NAME, SOME_STRING, SOME_DEFAULT, timeout=1)
+
+    assert question.copy().timeout == 1
+    assert question.copy(timeout=None).timeout is None
+
+
+def test_get_answers__invalid_text_entered__rejected_until_corrected():
+    def no_spaces(value: str, _: Answers) -> ValidationResponse:
+        return ValidationFailure("no spaces") if " " in value else ValidationSuccess()
+
+    interactions: list[Interaction] = [
+        BasicQuestion(SOME_NAME, SOME_STRING, SOME_DEFAULT, validator=no_spaces)
+    ]
+    backspaces = "\x7f" * len("has space")
+
+    result, output = _get_answers_in_context(
+        interactions, 0, f"has space\r{backspaces}valid\r"
+    )
+
+    assert result[SOME_NAME] == "valid"
+    assert "not valid" not in output
+
+
+def test_get_answers__typing_paused__validated_once_in_background():
+    checked: list[tuple[str, bool]] = []
+
+    def record(value: str, _: Answers) -> ValidationResponse:
+        checked.append((value, threading.current_thread() is threading.main_thread()))
+        return ValidationSuccess()
+
+    interactions: list[Interaction] = [
+        BasicQuestion(SOME_NAME, SOME_STRING, SOME_DEFAULT, validator=record)
+    ]
+
+    with create_pipe_input() as pipe_input:
+        pipe_input.send_text("abc")
+        enter = threading.Timer(0.5, pipe_input.send_text, ["\r"])
+        enter.start()
+        result = get_answers(
+            interactions, io=IOContext(input=pipe_input, output=DummyOutput())
+        )
+        enter.join()
+
+    assert result[SOME_NAME] == "abc"
+    # checked once while typing, then once more by ask() after the prompt is done
+    assert checked == [("abc", False), ("abc", True)]
+
+
+ACCEPT_DEFAULTS = "\x1b\r"
+
+
+def test_get_answers__accept_defaults_pressed__remaining_interactions_use_defaults():
+    interactions: list[Interaction] = [
+        BasicQuestion("first", SOME_STRING, SOME_DEFAULT),
+        Confirm("confirm", SOME_STRING, SOME_BOOL),
+        Acknowledge(SOME_STRING),
+        Choice("choice", SOME_STRING, SOME_OPTIONS, SOME_DEFAULT),
+        BasicQuestion(
+            "skipped",
+            SOME_STRING,
+            SOME_DEFAULT,
+            should_ask=lambda _: False,
+            value_if_not_asked=SOME_OTHER_STRING,
+        ),
+        BasicQuestion("last", SOME_STRING, SOME_DEFAULT),
+    ]
+
+    with create_pipe_input() as pipe_input:
+        pipe_input.send_text(f"{SOME_OTHER_STRING}\r{ACCEPT_DEFAULTS}")
+        result = get_answers(
+            interactions, io=IOContext(input=pipe_input, output=DummyOutput())
+        )
+
+    assert result == {
+        "first": SOME_OTHER_STRING,
+        "confirm": SOME_BOOL,
+        "choice": SOME_DEFAULT,
+        "skipped": SOME_OTHER_STRING,
+        "last": SOME_DEFAULT,
+    }
+
+
+def test_get_answers__accept_defaults_pressed_invalid_default__exception():
+    interactions: list[Interaction] = [
+        Confirm("confirm", SOME_STRING, SOME_BOOL),
+        BasicQuestion(
+            SOME_NAME, SOME_STRING, SOME_DEFAULT, validator=always_fail_validator
+        ),
+    ]
+
+    with create_pipe_input() as pipe_input:
+        pipe_input.send_text(ACCEPT_DEFAULTS)
+        with pytest.raises(ValueError, match="must satisfy the validator"):
+            get_answers(
+                interactions, io=IOContext(input=pipe_input, output=DummyOutput())
+            )
+
+
+def test_iter_answers__accept_defaults_pressed__remaining_interactions_use_defaults():
+    interactions: list[Interaction] = [
+        BasicQuestion("first", SOME_STRING, SOME_DEFAULT),
+        BasicQuestion("second", SOME_STRING, SOME_DEFAULT),
+    ]
+
+    with create_pipe_input() as pipe_input:
+        pipe_input.send_text(ACCEPT_DEFAULTS)
+        result = list(
+            iter_answers(
+                interactions, io=IOContext(input=pipe_input, output=DummyOutput())
+            )
+        )
+
+    assert result == [("first", SOME_DEFAULT), ("second", SOME_DEFAULT)]
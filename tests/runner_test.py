@@ -0,0 +1,186 @@
+import json
+import runpy
+import sys
+from io import StringIO
+
+import pytest
+
+from columbo import BasicQuestion, Choice, Confirm, Echo, Interaction
+from columbo._runner import import_interactions, main
+from tests.sample_data import (
+    SOME_DEFAULT,
+    SOME_INVALID_OPTION,
+    SOME_NON_DEFAULT_OPTION,
+    SOME_OPTIONS,
+    SOME_STRING,
+)
+
+SOME_INTERACTIONS: list[Interaction] = [
+    Echo(SOME_STRING),
+    Confirm("confirm", SOME_STRING, default=True),
+    Choice("choice", SOME_STRING, SOME_OPTIONS, SOME_DEFAULT),
+    BasicQuestion(
+        "basic",
+        SOME_STRING,
+        SOME_STRING,
+        should_ask=lambda answers: bool(answers["confirm"]),
+        value_if_not_asked=SOME_DEFAULT,
+    ),
+]
+NOT_A_COLLECTION = SOME_STRING
+NOT_INTERACTIONS = [SOME_STRING]
+DUPLICATE_INTERACTIONS = [Confirm("a", SOME_STRING), Confirm("a", SOME_STRING)]
+
+
+class InteractionHolder:
+    INTERACTIONS = SOME_INTERACTIONS
+
+
+SPEC = f"{__name__}:SOME_INTERACTIONS"
+
+
+def _run(*args: str, stdin: str = "") -> tuple[int, str, str]:
+    stdout = StringIO()
+    stderr = StringIO()
+    status = main(list(args), StringIO(stdin), stdout, stderr)
+    return status, stdout.getvalue(), stderr.getvalue()
+
+
+def _lines(*answers: object) -> str:
+    return "".join(f"{json.dumps(a)}\n" for a in answers)
+
+
+def test_main__valid_answers__resolved_answers_written():
+    stdin = _lines({}, {"confirm": False, "choice": SOME_NON_DEFAULT_OPTION})
+
+    status, stdout, stderr = _run(SPEC, stdin=stdin)
+
+    assert status == 0
+    assert [json.loads(line) for line in stdout.splitlines()] == [
+        {"confirm": True, "choice": SOME_DEFAULT, "basic": SOME_STRING},
+        {"confirm": False, "choice": SOME_NON_DEFAULT_OPTION, "basic": SOME_DEFAULT},
+    ]
+    assert stderr == ""
+
+
+def test_main__invalid_answers__errors_reported_and_valid_lines_written():
+    stdin = _lines({"choice": SOME_INVALID_OPTION}, {}) + "\nnot json\n[]\n"
+
+    status, stdout, stderr = _run(SPEC, stdin=stdin)
+
+    assert status == 1
+    assert len(stdout.splitlines()) == 1
+    errors = stderr.splitlines()
+    assert errors[0].startswith("line 1: choice: ")
+    assert errors[1].startswith("line 4: Invalid JSON")
+    assert errors[2] == "line 5: Answers must be a JSON object"
+
+
+def test_main__answer_for_question_not_asked__error_reported():
+    stdin = _lines({"confirm": False, "basic": SOME_STRING})
+
+    status, stdout, stderr = _run(SPEC, stdin=stdin)
+
+    assert status == 1
+    assert stdout == ""
+    assert stderr == (
+        "line 1: basic: An answer was given for a question that should not be asked\n"
+    )
+
+
+def test_main__resolved_answers_given_again__same_answers_written():
+    _, resolved, _ = _run(SPEC, stdin=_lines({}, {"confirm": False}))
+
+    status, stdout, stderr = _run(SPEC, stdin=resolved)
+
+    assert status == 0
+    assert stdout == resolved
+    assert stderr == ""
+
+
+def test_main__files__read_and_written(tmp_path):
+    input_path = tmp_path / "answers.jsonl"
+    input_path.write_text(_lines({"confirm": False}))
+    output_path = tmp_path / "resolved.jsonl"
+
+    status, stdout, _ = _run(
+        SPEC, "--input", str(input_path), "--output", str(output_path)
+    )
+
+    assert status == 0
+    assert stdout == ""
+    assert json.loads(output_path.read_text()) == {
+        "confirm": False,
+        "choice": SOME_DEFAULT,
+        "basic": SOME_DEFAULT,
+    }
+
+
+def test_main__missing_input_file__usage_error(tmp_path, capsys):
+    with pytest.raises(SystemExit) as ex:
+        _run(SPEC, "--input", str(tmp_path / "missing.jsonl"))
+
+    assert ex.value.code == 2
+    assert "missing.jsonl" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize(
+    ["spec", "match"],
+    [
+        ["tests.runner_test", "must be given as 'module:attribute'"],
+        [":SOME_INTERACTIONS", "must be given as 'module:attribute'"],
+        ["tests.not_a_module:SOME_INTERACTIONS", "Unable to load interactions"],
+        ["tests.runner_test:MISSING", "Unable to load interactions"],
+        ["tests.runner_test:NOT_A_COLLECTION", "is not a collection of interactions"],
+        ["tests.runner_test:NOT_INTERACTIONS", "Unsupported interaction type"],
+    ],
+)
+def test_import_interactions__invalid_spec__value_error(spec, match):
+    with pytest.raises(ValueError, match=match):
+        import_interactions(spec)
+
+
+def test_import_interactions__dotted_attribute__interactions():
+    result = import_interactions("tests.runner_test:InteractionHolder.INTERACTIONS")
+
+    assert result == SOME_INTERACTIONS
+
+
+def test_main__duplicate_question_names__usage_error(capsys):
+    with pytest.raises(SystemExit) as ex:
+        _run("tests.runner_test:DUPLICATE_INTERACTIONS")
+
+    assert ex.value.code == 2
+    assert "a has already been used" in capsys.readouterr().err
+
+
+def test_module__run__exit_status(monkeypatch):
+    monkeypatch.setattr(sys, "argv", ["columbo", SPEC])
+    monkeypatch.setattr(sys, "stdin", StringIO(_lines({})))
+
+    with pytest.raises(SystemExit) as ex:
+        runpy.run_module("columbo", run_name="__main__")
+
+    assert ex.value.code == 0
+
+
+def test_main__definition_file__interactions_loaded(tmp_path):
+    path = tmp_path / "interactions.toml"
+    path.write_text(
+        '[[interactions]]\ntype = "basic"\nname = "basic"\nmessage = ""\ndefault = "x"\n'
+    )
+    cache_dir = tmp_path / "cache"
+
+    status, stdout, _ = _run(str(path), "--cache-dir", str(cache_dir), stdin=_lines({}))
+
+    assert status == 0
+    assert json.loads(stdout) == {"basic": "x"}
+    assert len(list(cache_dir.iterdir())) == 1
+
+
+def test_main__missing_definition_file__usage_error(tmp_path, capsys):
+    with pytest.raises(SystemExit) as ex:
+        _run(str(tmp_path / "missing.toml"))
+
+    assert ex.value.code == 2
+    assert "missing.toml" in capsys.readouterr().err
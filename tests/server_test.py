@@ -0,0 +1,306 @@
+import asyncio
+import re
+import socket
+from typing import Optional
+
+import pytest
+from prompt_toolkit.application import create_app_session
+from prompt_toolkit.input import create_pipe_input
+from prompt_toolkit.output import DummyOutput
+
+from columbo import (
+    Acknowledge,
+    Answer,
+    Answers,
+    BasicQuestion,
+    Choice,
+    Confirm,
+    Echo,
+    Interaction,
+    IOContext,
+    ValidationFailure,
+    ValidationSuccess,
+    get_answers_async,
+    serve_telnet,
+)
+from tests.sample_data import (
+    SOME_DEFAULT,
+    SOME_OPTIONS,
+    SOME_STRING,
+    SampleDisplayable,
+    SampleQuestion,
+    always_fail_validator,
+)
+
+SOME_INTERACTIONS: list[Interaction] = [
+    Echo(SOME_STRING),
+    Confirm("confirm", SOME_STRING),
+    Choice("choice", SOME_STRING, SOME_OPTIONS, SOME_DEFAULT),
+    BasicQuestion(
+        "basic",
+        SOME_STRING,
+        SOME_DEFAULT,
+        validator=lambda value, _: (
+            ValidationFailure("no spaces") if " " in value else ValidationSuccess()
+        ),
+    ),
+    Acknowledge(SOME_STRING),
+]
+# Telnet sub-negotiation reporting the terminal type, which the server waits for before prompting
+TTYPE_RESPONSE = b"\xff\xfa\x18\x00xterm\xff\xf0"
+CURSOR_POSITION_REQUEST = re.compile(rb"\x1b\[6n")
+
+
+async def _run_client(
+    keys: str,
+    interactions: list[Interaction],
+    answers: Optional[Answers] = None,
+    no_user_input: bool = False,
+) -> dict[str, Answer]:
+    with create_pipe_input() as pipe_input:
+        with create_app_session(input=pipe_input, output=DummyOutput()):
+            pipe_input.send_text(keys)
+            return await get_answers_async(interactions, answers, no_user_input)
+
+
+def _keys(index: int) -> str:
+    return f"{'yn'[index % 2]}{index % 3 + 1}\ruser-{index}\r\r"
+
+
+def _expected(index: int) -> dict[str, Answer]:
+    return {
+        "confirm": index % 2 == 0,
+        "choice": SOME_OPTIONS[index % 3],
+        "basic": f"user-{index}",
+    }
+
+
+def test_get_answers_async__keys__answers():
+    result = asyncio.run(_run_client(_keys(1), SOME_INTERACTIONS))
+
+    assert result == _expected(1)
+
+
+def test_get_answers_async__enter_only__defaults():
+    result = asyncio.run(_run_client("\r\r\r\r", SOME_INTERACTIONS))
+
+    assert result == {"confirm": False, "choice": SOME_DEFAULT, "basic": SOME_DEFAULT}
+
+
+def test_get_answers_async__invalid_answer__rejected_until_corrected():
+    backspaces = "\x7f" * len("has space")
+    keys = f"y1\rhas space\r{backspaces}valid\r\r"
+
+    result = asyncio.run(_run_client(keys, SOME_INTERACTIONS))
+
+    assert result["basic"] == "valid"
+
+
+def test_get_answers_async__no_user_input__defaults_and_initial_answers():
+    result = asyncio.run(
+        _run_client("", SOME_INTERACTIONS, {"other": SOME_STRING}, no_user_input=True)
+    )
+
+    assert result == {
+        "other": SOME_STRING,
+        "confirm": False,
+        "choice": SOME_DEFAULT,
+        "basic": SOME_DEFAULT,
+    }
+
+
+def test_get_answers_async__not_asked__skipped_and_value_if_not_asked_recorded():
+    interactions: list[Interaction] = [
+        Echo(SOME_STRING, should_ask=lambda _: False),
+        Confirm(SOME_STRING, SOME_STRING, should_ask=lambda _: False),
+        BasicQuestion(
+            "basic",
+            SOME_STRING,
+            SOME_DEFAULT,
+            should_ask=lambda _: False,
+            value_if_not_asked=SOME_STRING,
+        ),
+    ]
+
+    result = asyncio.run(_run_client("", interactions))
+
+    assert result == {"basic": SOME_STRING}
+
+
+def test_get_answers_async__default_fails_validator__exception():
+    interactions: list[Interaction] = [
+        BasicQuestion(
+            SOME_STRING, SOME_STRING, SOME_DEFAULT, validator=always_fail_validator
+        )
+    ]
+
+    with pytest.raises(ValueError):
+        asyncio.run(_run_client("\r", interactions))
+
+
+def test_get_answers_async__default_answer__validated_once(mocker):
+    validator = mocker.Mock(return_value=ValidationSuccess())
+    interactions: list[Interaction] = [
+        BasicQuestion(SOME_STRING, SOME_STRING, SOME_DEFAULT, validator=validator)
+    ]
+
+    asyncio.run(_run_client("\r", interactions))
+
+    assert validator.call_count == 1
+
+
+def test_get_answers_async__unsupported_interaction__exception():
+    with pytest.raises(ValueError):
+        asyncio.run(_run_client("\r", [SampleQuestion(SOME_STRING, SOME_STRING)]))
+
+
+def test_get_answers_async__many_concurrent_clients__isolated_answers():
+    client_count = 20
+
+    async def run_all() -> list[dict[str, Answer]]:
+        return await asyncio.gather(
+            *(_run_client(_keys(i), SOME_INTERACTIONS) for i in range(client_count))
+        )
+
+    results = asyncio.run(run_all())
+
+    assert results == [_expected(i) for i in range(client_count)]
+
+
+async def _telnet_client(port: int, keys: str) -> None:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(TTYPE_RESPONSE + keys.encode())
+    try:
+        while data := await reader.read(4096):
+            # respond to each cursor position request like a terminal would
+            for _ in CURSOR_POSITION_REQUEST.findall(data):
+                writer.write(b"\x1b[1;1R")
+    except ConnectionResetError:
+        # the server closed the connection before reading the last response
+        pass
+    writer.close()
+
+
+async def _abandoning_telnet_client(port: int) -> None:
+    _, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(TTYPE_RESPONSE + b"y")
+    await writer.drain()
+    writer.close()
+    await writer.wait_closed()
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return int(sock.getsockname()[1])
+
+
+def test_serve_telnet__clients__on_answers_called_for_each():
+    client_count = 5
+    port = _free_port()
+    results: list[dict[str, Answer]] = []
+
+    async def run_all() -> None:
+        ready = asyncio.Event()
+        server = asyncio.create_task(
+            serve_telnet(
+                SOME_INTERACTIONS, port=port, on_answers=results.append, ready=ready.set
+            )
+        )
+        await ready.wait()
+        await asyncio.gather(
+            *(_telnet_client(port, _keys(i)) for i in range(client_count)),
+            # disconnects before answering, so on_answers isn't called
+            _abandoning_telnet_client(port),
+        )
+        server.cancel()
+
+    asyncio.run(run_all())
+
+    assert sorted(results, key=lambda r: str(r["basic"])) == [
+        _expected(i) for i in range(client_count)
+    ]
+
+
+def test_get_answers_async__timeouts_without_input__defaults():
+    interactions: list[Interaction] = [
+        Acknowledge(SOME_STRING),
+        Confirm("confirm", SOME_STRING, True, timeout=0.01),
+        Choice("choice", SOME_STRING, SOME_OPTIONS, SOME_DEFAULT, timeout=0.01),
+        BasicQuestion("basic", SOME_STRING, SOME_DEFAULT),
+    ]
+
+    async def run() -> dict[str, Answer]:
+        with create_pipe_input() as pipe_input:
+            io = IOContext(input=pipe_input, output=DummyOutput(), timeout=0.01)
+            return await get_answers_async(interactions, io=io)
+
+    result = asyncio.run(run())
+
+    assert result == {"confirm": True, "choice": SOME_DEFAULT, "basic": SOME_DEFAULT}
+
+
+def test_get_answers_async__accept_defaults_pressed__remaining_interactions_use_defaults():
+    interactions: list[Interaction] = [
+        Confirm("confirm", SOME_STRING, True),
+        Acknowledge(SOME_STRING),
+        Choice("choice", SOME_STRING, SOME_OPTIONS, SOME_DEFAULT),
+        BasicQuestion("basic", SOME_STRING, SOME_DEFAULT),
+    ]
+
+    async def run() -> dict[str, Answer]:
+        with create_pipe_input() as pipe_input:
+            pipe_input.send_text("\x1b\r")
+            io = IOContext(input=pipe_input, output=DummyOutput())
+            return await get_answers_async(interactions, io=io)
+
+    result = asyncio.run(run())
+
+    assert result == {"confirm": True, "choice": SOME_DEFAULT, "basic": SOME_DEFAULT}
+
+
+class _OverriddenConfirm(Confirm):
+    def ask(self, answers, no_user_input=False):
+        return True
+
+
+class _OverriddenEcho(Echo):
+    def display(self, answers, no_user_input=False):
+        pass
+
+
+class _AsyncConfirm(_OverriddenConfirm):
+    async def ask_async(self, answers, no_user_input=False):
+        return True
+
+
+@pytest.mark.parametrize(
+    ["interaction", "match"],
+    [
+        [_OverriddenConfirm(SOME_STRING, SOME_STRING), "ask_async"],
+        [_OverriddenEcho(SOME_STRING), "display_async"],
+    ],
+)
+def test_get_answers_async__overrides_without_async_variant__exception(
+    interaction, match
+):
+    with pytest.raises(ValueError, match=match):
+        asyncio.run(_run_client("\r", [interaction]))
+
+
+def test_get_answers_async__overrides_async_variant__async_variant_used():
+    result = asyncio.run(_run_client("", [_AsyncConfirm(SOME_STRING, SOME_STRING)]))
+
+    assert result == {SOME_STRING: True}
+
+
+@pytest.mark.parametrize(
+    "call",
+    [
+        lambda: SampleQuestion(SOME_STRING, SOME_STRING).ask_async({}),
+        lambda: SampleDisplayable(SOME_STRING).display_async({}),
+    ],
+)
+def test_async_variant__not_overridden_by_subclass__exception(call):
+    with pytest.raises(ValueError, match="without blocking the event loop"):
+        asyncio.run(call())
@@ -0,0 +1,288 @@
+import json
+from typing import Optional
+
+import pytest
+
+from columbo import (
+    Acknowledge,
+    Answer,
+    BasicQuestion,
+    Choice,
+    Confirm,
+    DuplicateQuestionNameException,
+    Echo,
+    Equals,
+    Interaction,
+    Session,
+    ValidationFailure,
+    ValidationSuccess,
+    get_answers,
+)
+from tests.sample_data import (
+    DUPLICATE_QUESTION_NAME_PARAMS,
+    SOME_BOOL,
+    SOME_DEFAULT,
+    SOME_INVALID_OPTION,
+    SOME_NON_DEFAULT_OPTION,
+    SOME_OPTIONS,
+    SOME_OTHER_BOOL,
+    SOME_STRING,
+    SampleDisplayable,
+    SampleQuestion,
+    always_fail_validator,
+)
+
+SOME_INTERACTIONS: list[Interaction] = [
+    Echo(SOME_STRING),
+    Confirm("confirm", SOME_STRING, default=SOME_BOOL),
+    Choice("choice", SOME_STRING, SOME_OPTIONS, SOME_DEFAULT),
+    Acknowledge(SOME_STRING, should_ask=Equals("confirm", SOME_OTHER_BOOL)),
+    BasicQuestion(
+        "skipped",
+        SOME_STRING,
+        SOME_DEFAULT,
+        should_ask=Equals("confirm", SOME_OTHER_BOOL),
+        value_if_not_asked=SOME_STRING,
+    ),
+    BasicQuestion("basic", SOME_STRING, SOME_DEFAULT),
+]
+
+
+def _run(session: Session, answers: list[Optional[Answer]]) -> None:
+    for answer in answers:
+        assert session.submit(answer) == ValidationSuccess()
+
+
+def test_session__all_defaults__same_as_get_answers():
+    session = Session(SOME_INTERACTIONS)
+
+    while not session.done:
+        session.submit()
+
+    assert session.answers == get_answers(SOME_INTERACTIONS, no_user_input=True)
+
+
+def test_session_next_interaction__skips_not_asked():
+    session = Session(SOME_INTERACTIONS)
+    seen = []
+
+    while (interaction := session.next_interaction()) is not None:
+        seen.append(interaction)
+        session.submit()
+
+    assert seen == [
+        SOME_INTERACTIONS[0],
+        SOME_INTERACTIONS[1],
+        SOME_INTERACTIONS[2],
+        SOME_INTERACTIONS[5],
+    ]
+
+
+def test_session_next_interaction__called_repeatedly__same_interaction():
+    session = Session(SOME_INTERACTIONS)
+    session.submit()
+
+    assert session.next_interaction() is SOME_INTERACTIONS[1]
+    assert session.next_interaction() is SOME_INTERACTIONS[1]
+
+
+def test_session_submit__answers__recorded():
+    session = Session(SOME_INTERACTIONS, answers={"initial": SOME_STRING})
+
+    _run(
+        session,
+        [None, SOME_OTHER_BOOL, SOME_NON_DEFAULT_OPTION, None, "other", "typed"],
+    )
+
+    assert session.done
+    assert session.answers == {
+        "initial": SOME_STRING,
+        "confirm": SOME_OTHER_BOOL,
+        "choice": SOME_NON_DEFAULT_OPTION,
+        "skipped": "other",
+        "basic": "typed",
+    }
+
+
+@pytest.mark.parametrize(
+    ["answers", "invalid_answer"],
+    [
+        ([None], SOME_STRING),
+        ([None, SOME_BOOL], SOME_BOOL),
+        ([None, SOME_BOOL], SOME_INVALID_OPTION),
+    ],
+)
+def test_session_submit__invalid_answer__failure_and_not_advanced(
+    answers, invalid_answer
+):
+    session = Session(SOME_INTERACTIONS)
+    _run(session, answers)
+    current = session.next_interaction()
+
+    result = session.submit(invalid_answer)
+
+    assert isinstance(result, ValidationFailure)
+    assert session.next_interaction() is current
+
+
+def test_session_submit__validator_fails__failure():
+    session = Session(
+        [
+            BasicQuestion(
+                SOME_STRING, SOME_STRING, SOME_DEFAULT, validator=always_fail_validator
+            )
+        ]
+    )
+
+    result = session.submit(SOME_STRING)
+
+    assert isinstance(result, ValidationFailure)
+    assert session.answers == {}
+
+
+def test_session_submit__last_question_before_skipped__done_and_skipped_recorded():
+    session = Session(SOME_INTERACTIONS[:5])
+    _run(session, [None, SOME_BOOL, None])
+
+    state = session.state
+
+    assert session.done
+    assert session.next_interaction() is None
+    assert session.answers == {
+        "confirm": SOME_BOOL,
+        "choice": SOME_DEFAULT,
+        "skipped": SOME_STRING,
+    }
+    assert session.state == state
+
+
+@pytest.mark.parametrize(
+    "question",
+    [
+        BasicQuestion(
+            SOME_STRING, SOME_STRING, SOME_DEFAULT, validator=always_fail_validator
+        ),
+        Choice(SOME_STRING, SOME_STRING, SOME_OPTIONS, SOME_INVALID_OPTION),
+    ],
+)
+def test_session_submit__invalid_default__same_exception_as_get_answers(question):
+    with pytest.raises(ValueError) as get_answers_error:
+        get_answers([question], no_user_input=True)
+
+    with pytest.raises(ValueError) as submit_error:
+        Session([question]).submit()
+
+    assert str(submit_error.value) == str(get_answers_error.value)
+
+
+def test_session_submit__answer_for_message__exception():
+    session = Session(SOME_INTERACTIONS)
+
+    with pytest.raises(ValueError):
+        session.submit(SOME_STRING)
+
+
+def test_session_submit__done__exception():
+    session = Session([])
+
+    with pytest.raises(ValueError):
+        session.submit()
+
+
+@pytest.mark.parametrize(
+    "interaction", [SampleDisplayable(SOME_STRING), SampleQuestion(SOME_STRING, "")]
+)
+def test_session__unsupported_interaction__exception(interaction):
+    with pytest.raises(ValueError):
+        Session([interaction]).submit()
+
+
+def test_session__invalid_value_if_not_asked__exception():
+    with pytest.raises(ValueError):
+        Session(
+            [
+                Choice(
+                    SOME_STRING,
+                    SOME_STRING,
+                    SOME_OPTIONS,
+                    SOME_DEFAULT,
+                    should_ask=lambda _: False,
+                    value_if_not_asked=SOME_INVALID_OPTION,
+                )
+            ]
+        )
+
+
+@pytest.mark.parametrize("questions", DUPLICATE_QUESTION_NAME_PARAMS)
+def test_session__duplicate_question_name__exception(questions):
+    with pytest.raises(DuplicateQuestionNameException):
+        Session(questions)
+
+
+def test_session_resume__state__same_progress():
+    session = Session(SOME_INTERACTIONS)
+    _run(session, [None, SOME_OTHER_BOOL])
+
+    resumed = Session.resume(SOME_INTERACTIONS, session.state)
+
+    assert resumed.answers == session.answers
+    assert resumed.next_interaction() is SOME_INTERACTIONS[2]
+    _run(resumed, [None, None, None, None])
+    assert resumed.done
+
+
+def test_session_resume__initial_answers_used_by_should_ask__same_progress():
+    interactions: list[Interaction] = [
+        Confirm(
+            "confirm", SOME_STRING, should_ask=lambda answers: answers["env"] == "prod"
+        ),
+        BasicQuestion("basic", SOME_STRING, SOME_DEFAULT),
+    ]
+    session = Session(interactions, answers={"env": "prod"})
+
+    resumed = Session.resume(interactions, session.state)
+
+    assert resumed.next_interaction() is interactions[0]
+    assert resumed.answers == {"env": "prod"}
+
+
+def test_session_resume__state_is_json():
+    session = Session(SOME_INTERACTIONS)
+    _run(session, [None, SOME_BOOL])
+
+    state = json.loads(session.state)
+
+    assert state["position"] == 2
+    assert state["answers"] == {"confirm": SOME_BOOL}
+
+
+def test_session_resume__different_interactions__exception():
+    state = Session(SOME_INTERACTIONS).state
+
+    with pytest.raises(ValueError, match="different interactions"):
+        Session.resume(SOME_INTERACTIONS[:-1], state)
+
+
+def _state(**changes: object) -> str:
+    state = json.loads(Session(SOME_INTERACTIONS).state)
+    state.update(changes)
+    return json.dumps(state)
+
+
+@pytest.mark.parametrize(
+    "state",
+    [
+        "not json",
+        "[]",
+        "{}",
+        _state(version=0),
+        _state(position=-1),
+        _state(position=len(SOME_INTERACTIONS) + 1),
+        _state(position="1"),
+        _state(answers=[]),
+        _state(answers={"confirm": 1}),
+    ],
+)
+def test_session_resume__invalid_state__exception(state):
+    with pytest.raises(ValueError):
+        Session.resume(SOME_INTERACTIONS, state)
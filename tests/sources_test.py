@@ -0,0 +1,190 @@
+import json
+
+import pytest
+
+from columbo import (
+    BasicQuestion,
+    Choice,
+    CliException,
+    Confirm,
+    Echo,
+    Interaction,
+    parse_args,
+)
+from columbo._sources import env_var_name, resolve_values
+from tests.sample_data import (
+    SOME_DEFAULT,
+    SOME_INVALID_OPTION,
+    SOME_NON_DEFAULT_OPTION,
+    SOME_OPTIONS,
+    SOME_OTHER_STRING,
+    SOME_STRING,
+)
+
+SOME_PREFIX = "MY_APP_"
+SOME_INTERACTIONS: list[Interaction] = [
+    Echo(SOME_STRING),
+    Confirm("overwrite files", SOME_STRING, default=False),
+    Choice("choice", SOME_STRING, SOME_OPTIONS, SOME_DEFAULT),
+    BasicQuestion("project_name", SOME_STRING, SOME_STRING),
+]
+
+
+@pytest.fixture
+def answer_file(tmp_path):
+    path = tmp_path / "answers.json"
+    path.write_text(
+        json.dumps({"overwrite-files": True, "choice": "z", "project name": "file"})
+    )
+    return path
+
+
+@pytest.mark.parametrize(
+    ["name", "expected"],
+    [
+        ["name", "MY_APP_NAME"],
+        ["my name", "MY_APP_MY_NAME"],
+        ["__my_name__", "MY_APP_MY_NAME"],
+        ["my-name", "MY_APP_MY_NAME"],
+    ],
+)
+def test_env_var_name__names__canonical_upper_case(name, expected):
+    assert env_var_name(SOME_PREFIX, name) == expected
+
+
+def test_parse_args__no_sources__defaults():
+    result = parse_args(SOME_INTERACTIONS, [], env_prefix=SOME_PREFIX)
+
+    assert result == {
+        "overwrite files": False,
+        "choice": SOME_DEFAULT,
+        "project_name": SOME_STRING,
+    }
+
+
+def test_parse_args__answer_file__file_values(answer_file):
+    result = parse_args(SOME_INTERACTIONS, [], answer_file=answer_file)
+
+    assert result == {"overwrite files": True, "choice": "z", "project_name": "file"}
+
+
+def test_parse_args__env_and_file__env_preferred(monkeypatch, answer_file):
+    monkeypatch.setenv("MY_APP_CHOICE", SOME_NON_DEFAULT_OPTION)
+    monkeypatch.setenv("MY_APP_OVERWRITE_FILES", "no")
+
+    result = parse_args(
+        SOME_INTERACTIONS, [], env_prefix=SOME_PREFIX, answer_file=answer_file
+    )
+
+    assert result == {
+        "overwrite files": False,
+        "choice": SOME_NON_DEFAULT_OPTION,
+        "project_name": "file",
+    }
+
+
+def test_parse_args__cli_env_and_file__cli_preferred(monkeypatch, answer_file):
+    monkeypatch.setenv("MY_APP_PROJECT_NAME", SOME_STRING)
+
+    result = parse_args(
+        SOME_INTERACTIONS,
+        ["--project-name", SOME_OTHER_STRING, "--no-overwrite-files"],
+        env_prefix=SOME_PREFIX,
+        answer_file=answer_file,
+    )
+
+    assert result == {
+        "overwrite files": False,
+        "choice": "z",
+        "project_name": SOME_OTHER_STRING,
+    }
+
+
+def test_parse_args__env_without_prefix__env_ignored(monkeypatch):
+    monkeypatch.setenv("MY_APP_CHOICE", SOME_NON_DEFAULT_OPTION)
+
+    result = parse_args(SOME_INTERACTIONS, [])
+
+    assert result["choice"] == SOME_DEFAULT
+
+
+def test_parse_args__toml_file__file_values(tmp_path):
+    path = tmp_path / "answers.toml"
+    path.write_text('overwrite_files = true\nproject_name = 42\nchoice = "y"\n')
+
+    result = parse_args(SOME_INTERACTIONS, [], answer_file=path)
+
+    assert result == {"overwrite files": True, "choice": "y", "project_name": "42"}
+
+
+def test_parse_args__invalid_value_from_file__exception(tmp_path):
+    path = tmp_path / "answers.json"
+    path.write_text(json.dumps({"choice": SOME_INVALID_OPTION}))
+
+    with pytest.raises(CliException, match=SOME_INVALID_OPTION):
+        parse_args(SOME_INTERACTIONS, [], exit_on_error=False, answer_file=path)
+
+
+@pytest.mark.parametrize(
+    ["value", "expected"],
+    [
+        ["1", True],
+        ["TRUE", True],
+        ["yes", True],
+        ["on", True],
+        ["0", False],
+        ["False", False],
+        ["no", False],
+        ["off", False],
+    ],
+)
+def test_resolve_values__confirm_from_env__bool(monkeypatch, value, expected):
+    monkeypatch.setenv("MY_APP_OVERWRITE_FILES", value)
+
+    result = resolve_values(SOME_INTERACTIONS, {}, env_prefix=SOME_PREFIX)
+
+    assert result == {"overwrite files": expected}
+
+
+def test_resolve_values__confirm_not_bool__exception(monkeypatch):
+    monkeypatch.setenv("MY_APP_OVERWRITE_FILES", SOME_STRING)
+
+    with pytest.raises(CliException, match="MY_APP_OVERWRITE_FILES"):
+        resolve_values(SOME_INTERACTIONS, {}, env_prefix=SOME_PREFIX)
+
+
+@pytest.mark.parametrize("value", [True, [SOME_STRING], {}])
+def test_resolve_values__text_not_string__exception(tmp_path, value):
+    path = tmp_path / "answers.json"
+    path.write_text(json.dumps({"project-name": value}))
+
+    with pytest.raises(CliException, match="Must be a string"):
+        resolve_values(SOME_INTERACTIONS, {}, answer_file=path)
+
+
+@pytest.mark.parametrize(
+    ["content", "match"],
+    [
+        ["{", "Unable to parse answer file"],
+        ["[]", "must contain a single object"],
+    ],
+)
+def test_resolve_values__invalid_file__exception(tmp_path, content, match):
+    path = tmp_path / "answers.json"
+    path.write_text(content)
+
+    with pytest.raises(CliException, match=match):
+        resolve_values(SOME_INTERACTIONS, {}, answer_file=path)
+
+
+def test_resolve_values__keys_for_same_argument__exception_naming_both(tmp_path):
+    path = tmp_path / "answers.json"
+    path.write_text(json.dumps({"project_name": "first", "project-name": "second"}))
+
+    with pytest.raises(CliException, match="'project_name' & 'project-name'"):
+        resolve_values(SOME_INTERACTIONS, {}, answer_file=path)
+
+
+def test_resolve_values__missing_file__exception(tmp_path):
+    with pytest.raises(CliException, match="Unable to read answer file"):
+        resolve_values(SOME_INTERACTIONS, {}, answer_file=tmp_path / "missing.json")
@@ -0,0 +1,209 @@
+import pytest
+
+from columbo import (
+    Answers,
+    AnswerTable,
+    BasicQuestion,
+    Choice,
+    Confirm,
+    DuplicateQuestionNameException,
+    Echo,
+    Interaction,
+)
+from tests.sample_data import (
+    DUPLICATE_QUESTION_NAME_PARAMS,
+    SOME_DEFAULT,
+    SOME_MAPPING_OPTIONS,
+    SOME_OPTIONS,
+    SOME_STRING,
+    SampleQuestion,
+    some_dynamic_options,
+)
+
+SOME_INTERACTIONS: list[Interaction] = [
+    Echo(SOME_STRING),
+    Confirm("confirm", SOME_STRING),
+    Choice("choice", SOME_STRING, SOME_OPTIONS, SOME_DEFAULT),
+    BasicQuestion("basic", SOME_STRING, SOME_DEFAULT),
+]
+SOME_ROWS: list[Answers] = [
+    {"confirm": True, "choice": "y", "basic": "héllo"},
+    {"confirm": False, "choice": "x", "basic": ""},
+    {"basic": "only text"},
+    {},
+    {"confirm": True, "choice": "z"},
+]
+
+
+def test_answer_table__rows__same_answers():
+    table = AnswerTable(SOME_INTERACTIONS, SOME_ROWS)
+
+    assert len(table) == len(SOME_ROWS)
+    assert [row.to_dict() for row in table] == SOME_ROWS
+    assert list(table) == SOME_ROWS
+
+
+def test_answer_table__many_rows__same_answers():
+    rows: list[Answers] = [
+        {
+            "confirm": i % 3 == 0,
+            "choice": SOME_OPTIONS[i % 3],
+            "basic": str(i) * (i % 4),
+        }
+        for i in range(100)
+    ]
+
+    table = AnswerTable(SOME_INTERACTIONS, rows)
+
+    assert [row.to_dict() for row in table] == rows
+
+
+def test_answer_table__names__question_names():
+    table = AnswerTable(SOME_INTERACTIONS)
+
+    assert table.names == ("confirm", "choice", "basic")
+
+
+@pytest.mark.parametrize(
+    ["index", "expected"], [(0, SOME_ROWS[0]), (-1, SOME_ROWS[-1]), (2, SOME_ROWS[2])]
+)
+def test_answer_table_getitem__valid_index__row(index, expected):
+    table = AnswerTable(SOME_INTERACTIONS, SOME_ROWS)
+
+    assert table[index] == expected
+
+
+@pytest.mark.parametrize("index", [len(SOME_ROWS), -len(SOME_ROWS) - 1])
+def test_answer_table_getitem__invalid_index__exception(index):
+    table = AnswerTable(SOME_INTERACTIONS, SOME_ROWS)
+
+    with pytest.raises(IndexError):
+        table[index]
+
+
+def test_answer_table_column__values_with_none_for_missing():
+    table = AnswerTable(SOME_INTERACTIONS, SOME_ROWS)
+
+    assert table.column("choice") == ["y", "x", None, None, "z"]
+
+
+def test_answer_table_column__unknown_name__exception():
+    table = AnswerTable(SOME_INTERACTIONS, SOME_ROWS)
+
+    with pytest.raises(KeyError):
+        table.column("unknown")
+
+
+def test_answer_table_append__unknown_name__column_added():
+    table = AnswerTable(SOME_INTERACTIONS, SOME_ROWS)
+
+    table.append({"extra": SOME_STRING, "confirm": False})
+
+    assert table.names == ("confirm", "choice", "basic", "extra")
+    assert table.column("extra") == [None] * len(SOME_ROWS) + [SOME_STRING]
+    assert table[-1] == {"extra": SOME_STRING, "confirm": False}
+
+
+@pytest.mark.parametrize(
+    "answers",
+    [
+        {"confirm": SOME_STRING},
+        {"choice": True},
+        {"basic": False},
+        {"extra": SOME_STRING, "confirm": SOME_STRING},
+    ],
+)
+def test_answer_table_append__wrong_type__exception_and_unchanged(answers):
+    table = AnswerTable(SOME_INTERACTIONS, SOME_ROWS)
+
+    with pytest.raises(ValueError):
+        table.append(answers)
+
+    assert len(table) == len(SOME_ROWS)
+    assert table.names == ("confirm", "choice", "basic")
+    assert list(table) == SOME_ROWS
+
+
+def test_answer_table__choice__stored_as_option_index():
+    table = AnswerTable(SOME_INTERACTIONS, SOME_ROWS)
+
+    codes = table._columns["choice"]._values  # type: ignore[attr-defined]
+    assert list(codes) == [2, 1, 0, 0, 3]
+
+
+def test_answer_table__mapping_options__stored_as_option_index():
+    table = AnswerTable(
+        [Choice("choice", SOME_STRING, SOME_MAPPING_OPTIONS, SOME_DEFAULT)],
+        [{"choice": "z"}],
+    )
+
+    codes = table._columns["choice"]._values  # type: ignore[attr-defined]
+    assert list(codes) == [3]
+
+
+def test_answer_table__confirm__stored_as_bits():
+    table = AnswerTable(SOME_INTERACTIONS, SOME_ROWS)
+
+    column = table._columns["confirm"]
+    assert column._present._data == bytearray([0b10011])  # type: ignore[attr-defined]
+    assert column._values._data == bytearray([0b10001])  # type: ignore[attr-defined]
+
+
+def test_answer_table__basic__stored_in_one_buffer():
+    table = AnswerTable(SOME_INTERACTIONS, SOME_ROWS)
+
+    column = table._columns["basic"]
+    assert column._buffer == "héllo".encode() + b"only text"  # type: ignore[attr-defined]
+
+
+def test_answer_table__dynamic_options__codes_assigned_as_seen():
+    rows: list[Answers] = [{"choice": str(i)} for i in range(1000)]
+
+    table = AnswerTable(
+        [Choice("choice", SOME_STRING, some_dynamic_options, SOME_DEFAULT)],
+        rows + rows,
+    )
+
+    assert list(table) == rows + rows
+    codes = table._columns["choice"]._values  # type: ignore[attr-defined]
+    assert codes.typecode == "H"
+
+
+def test_answer_table__custom_question__stored_as_is():
+    table = AnswerTable([SampleQuestion("custom", SOME_STRING)], [{"custom": True}])
+
+    assert table[0] == {"custom": True}
+
+
+@pytest.mark.parametrize("questions", DUPLICATE_QUESTION_NAME_PARAMS)
+def test_answer_table__duplicate_question_name__exception(questions):
+    with pytest.raises(DuplicateQuestionNameException):
+        AnswerTable(questions)
+
+
+def test_answer_row__mapping_interface():
+    row = AnswerTable(SOME_INTERACTIONS, SOME_ROWS)[2]
+
+    assert row["basic"] == "only text"
+    assert "basic" in row
+    assert "confirm" not in row
+    assert "unknown" not in row
+    assert len(row) == 1
+    assert repr(row) == "AnswerRow({'basic': 'only text'})"
+
+
+@pytest.mark.parametrize("name", ["confirm", "unknown"])
+def test_answer_row_getitem__missing__exception(name):
+    row = AnswerTable(SOME_INTERACTIONS, SOME_ROWS)[2]
+
+    with pytest.raises(KeyError):
+        row[name]
+
+
+def test_answer_row__table_appended__row_unchanged():
+    table = AnswerTable(SOME_INTERACTIONS, SOME_ROWS)
+    row = table[0]
+
+    table.append({"extra": SOME_STRING})
+
+    assert row == SOME_ROWS[0]
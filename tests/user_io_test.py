@@ -1,6 +1,17 @@
+import asyncio
+from io import StringIO
+
 import pytest
+from prompt_toolkit.application import create_app_session, get_app_session
+from prompt_toolkit.buffer import Buffer
+from prompt_toolkit.completion import ThreadedCompleter
+from prompt_toolkit.document import Document
+from prompt_toolkit.input import create_pipe_input
+from prompt_toolkit.output import DummyOutput, create_output
+from prompt_toolkit.validation import ValidationError
 
 from columbo import _user_io as user_io
+from columbo._completer import CompletionIndex
 
 SOME_BOOL = True
 SOME_OTHER_BOOL = False
@@ -13,7 +24,9 @@ def test_acknowledge__yes_user_input__prompt_called(mocker):
 
     user_io.acknowledge("Some question?")
 
-    mock_prompt.assert_called_once_with("")
+    mock_prompt.assert_called_once_with(
+        "", key_bindings=user_io._TEXT_KEY_BINDINGS, pre_run=None
+    )
 
 
 def test_acknowledge__no_user_input__prompt_not_called(mocker):
@@ -55,6 +68,17 @@ def test_ask__yes_user_input__prompt_result(mocker):
     assert result == SOME_STRING
 
 
+def test_ask__completer__prompt_completes_in_background(mocker):
+    mock_prompt = mocker.patch("prompt_toolkit.shortcuts.prompt", return_value="")
+    completer = CompletionIndex([SOME_STRING])
+
+    user_io.ask("Some question?", default=SOME_OTHER_STRING, completer=completer)
+
+    threaded = mock_prompt.call_args.kwargs["completer"]
+    assert isinstance(threaded, ThreadedCompleter)
+    assert threaded.completer is completer
+
+
 def test_ask__yes_user_input_no_answer__default_result(mocker):
     mocker.patch("prompt_toolkit.shortcuts.prompt", return_value="")
 
@@ -117,3 +141,102 @@ def test_multiple_choice__default_not_option__value_error():
 def test_multiple_choice__no_options__value_error():
     with pytest.raises(ValueError):
         user_io.multiple_choice("Some question?", [], default="100")  # type: ignore[arg-type]
+
+
+def test_using__context__active_within_block():
+    output = create_output(stdout=StringIO())
+    context = user_io.IOContext(output=output)
+
+    with user_io.using(context) as active:
+        assert active is context
+        assert get_app_session().output is output
+
+    assert get_app_session().output is not output
+
+
+def test_using__no_context__new_context_without_own_io():
+    with user_io.using(None) as active:
+        assert active.input is None
+        assert active.output is None
+
+
+def test_ask_async__no_context__runtime_error():
+    with pytest.raises(RuntimeError):
+        asyncio.run(user_io.ask_async("Some question?", default=SOME_STRING))
+
+
+@pytest.mark.parametrize("timeout", [0, -1])
+def test_io_context__timeout_not_positive__value_error(timeout):
+    with pytest.raises(ValueError, match="timeout must be positive"):
+        user_io.IOContext(timeout=timeout)
+
+
+def test_live_validator__invalid_text__validation_error():
+    validator = user_io.LiveValidator(lambda text: None if text else SOME_STRING)
+
+    with pytest.raises(ValidationError, match=SOME_STRING):
+        validator.validate(Document(""))
+
+    validator.validate(Document(SOME_OTHER_STRING))
+
+
+def test_live_validator__text_changed_during_pause__check_not_called(mocker):
+    check = mocker.Mock(return_value=None)
+    buffer = Buffer(document=Document(SOME_STRING))
+    validator = user_io.LiveValidator(check, delay=0.01, buffer=buffer)
+
+    async def type_during_pause() -> None:
+        validation = asyncio.ensure_future(validator.validate_async(buffer.document))
+        buffer.insert_text(SOME_OTHER_STRING)
+        await validation
+
+    asyncio.run(type_during_pause())
+
+    check.assert_not_called()
+
+
+def test_live_validator__text_unchanged_after_pause__checked(mocker):
+    check = mocker.Mock(return_value=SOME_OTHER_STRING)
+    buffer = Buffer(document=Document(SOME_STRING))
+    validator = user_io.LiveValidator(check, delay=0.01, buffer=buffer)
+
+    with pytest.raises(ValidationError, match=SOME_OTHER_STRING):
+        asyncio.run(validator.validate_async(buffer.document))
+
+    check.assert_called_once_with(SOME_STRING)
+
+
+@pytest.mark.parametrize("default", [True, False])
+def test_confirm__accept_defaults_pressed__default_and_context_flagged(default):
+    with create_pipe_input() as pipe_input:
+        pipe_input.send_text("\x1b\r")
+        context = user_io.IOContext(input=pipe_input, output=DummyOutput())
+        with user_io.using(context):
+            result = user_io.confirm("Some question?", default=default)
+
+            assert user_io.defaults_accepted()
+
+    assert result is default
+    assert context.defaults_accepted
+
+
+def test_ask__accept_defaults_pressed_without_context__default():
+    with create_pipe_input() as pipe_input:
+        pipe_input.send_text("\x1b\r")
+        with create_app_session(input=pipe_input, output=DummyOutput()):
+            result = user_io.ask("Some question?", default=SOME_STRING)
+
+            assert not user_io.defaults_accepted()
+
+    assert result == SOME_STRING
+
+
+def test_acknowledge__defaults_accepted__prompt_not_called(mocker):
+    mock_prompt = mocker.patch("prompt_toolkit.shortcuts.prompt")
+    context = user_io.IOContext()
+    context.accept_defaults()
+
+    with user_io.using(context):
+        user_io.acknowledge("Some question?")
+
+    mock_prompt.assert_not_called()
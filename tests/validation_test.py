@@ -0,0 +1,262 @@
+import json
+from typing import Iterator
+
+import pytest
+
+from columbo import (
+    Acknowledge,
+    AnswerError,
+    Answers,
+    BasicQuestion,
+    Choice,
+    Confirm,
+    DuplicateQuestionNameException,
+    Echo,
+    Equals,
+    Interaction,
+    get_answers,
+    validate_answers,
+    validate_answers_jsonl,
+)
+from tests.sample_data import (
+    DUPLICATE_QUESTION_NAME_PARAMS,
+    SOME_BOOL,
+    SOME_DEFAULT,
+    SOME_FAILURE_MESSAGE,
+    SOME_INVALID_OPTION,
+    SOME_NAME,
+    SOME_NON_DEFAULT_OPTION,
+    SOME_OPTIONS,
+    SOME_OTHER_BOOL,
+    SOME_STRING,
+    SampleDisplayable,
+    always_fail_validator,
+)
+
+SOME_INTERACTIONS: list[Interaction] = [
+    Echo(SOME_STRING),
+    Confirm("confirm", SOME_STRING, default=SOME_BOOL),
+    Choice("choice", SOME_STRING, SOME_OPTIONS, SOME_DEFAULT),
+    Acknowledge(SOME_STRING),
+    BasicQuestion(
+        "basic",
+        SOME_STRING,
+        SOME_STRING,
+        should_ask=Equals("confirm", SOME_BOOL),
+        value_if_not_asked=SOME_DEFAULT,
+    ),
+]
+
+
+def test_validate_answers__valid_answers__no_errors():
+    answers = {"confirm": SOME_BOOL, "choice": SOME_NON_DEFAULT_OPTION, "basic": "a"}
+
+    assert validate_answers(SOME_INTERACTIONS, answers) == []
+
+
+def test_validate_answers__missing_answers__defaults_used():
+    assert validate_answers(SOME_INTERACTIONS, {}) == []
+
+
+def test_validate_answers__many_invalid_answers__every_error_reported():
+    answers = {"confirm": SOME_BOOL, "choice": SOME_INVALID_OPTION, "basic": 1}
+
+    errors = validate_answers(SOME_INTERACTIONS, answers)
+
+    assert [error.name for error in errors] == ["choice", "basic"]
+    assert SOME_INVALID_OPTION in errors[0].error
+    assert errors[1].error == "Answer must be a string: 1"
+
+
+def test_validate_answers__confirm_not_bool__error():
+    errors = validate_answers(SOME_INTERACTIONS, {"confirm": SOME_STRING})
+
+    assert errors == [AnswerError(f"Answer must be a bool: '{SOME_STRING}'", "confirm")]
+
+
+def test_validate_answers__validator_fails__validator_error():
+    interactions: list[Interaction] = [
+        BasicQuestion(
+            SOME_NAME, SOME_STRING, SOME_STRING, validator=always_fail_validator
+        )
+    ]
+
+    errors = validate_answers(interactions, {SOME_NAME: SOME_STRING})
+
+    assert errors == [AnswerError(SOME_FAILURE_MESSAGE, SOME_NAME)]
+
+
+def test_validate_answers__question_not_asked__value_if_not_asked_used():
+    answers = {"confirm": SOME_OTHER_BOOL}
+
+    assert validate_answers(SOME_INTERACTIONS, answers) == []
+
+
+def test_validate_answers__answer_for_question_not_asked__error():
+    answers = {"confirm": SOME_OTHER_BOOL, "basic": 1}
+
+    assert validate_answers(SOME_INTERACTIONS, answers) == [
+        AnswerError(
+            "An answer was given for a question that should not be asked", "basic"
+        )
+    ]
+
+
+def test_validate_answers__value_if_not_asked_given_for_question_not_asked__no_errors():
+    answers = {"confirm": SOME_OTHER_BOOL, "basic": SOME_DEFAULT}
+
+    assert validate_answers(SOME_INTERACTIONS, answers) == []
+
+
+@pytest.mark.parametrize("confirm", [SOME_BOOL, SOME_OTHER_BOOL])
+def test_validate_answers__get_answers_result__no_errors(confirm):
+    interactions: list[Interaction] = [
+        Confirm("confirm", SOME_STRING, default=confirm),
+        SOME_INTERACTIONS[2],
+        SOME_INTERACTIONS[4],
+    ]
+
+    answers = get_answers(interactions, no_user_input=True)
+
+    assert validate_answers(interactions, answers) == []
+
+
+def test_validate_answers__confirm_not_asked_given_int__error():
+    interactions: list[Interaction] = [
+        Confirm(
+            SOME_NAME,
+            SOME_STRING,
+            should_ask=lambda _: False,
+            value_if_not_asked=True,
+        )
+    ]
+
+    assert [error.name for error in validate_answers(interactions, {SOME_NAME: 1})] == [
+        SOME_NAME
+    ]
+
+
+def test_validate_answers__later_answer__not_available_to_earlier_question():
+    seen: list[Answers] = []
+
+    def should_ask(answers: Answers) -> bool:
+        seen.append(dict(answers))
+        return True
+
+    interactions: list[Interaction] = [
+        BasicQuestion("first", SOME_STRING, SOME_STRING, should_ask=should_ask),
+        BasicQuestion("second", SOME_STRING, SOME_STRING, should_ask=should_ask),
+    ]
+
+    validate_answers(interactions, {"second": "b", "first": "a", "other": "c"})
+
+    assert seen == [{"other": "c"}, {"other": "c", "first": "a"}]
+
+
+def test_validate_answers__dynamic_options__earlier_answers_used():
+    interactions: list[Interaction] = [
+        BasicQuestion("first", SOME_STRING, SOME_STRING),
+        Choice(
+            SOME_NAME, SOME_STRING, lambda answers: [str(answers["first"])], SOME_STRING
+        ),
+    ]
+
+    assert validate_answers(interactions, {"first": "a", SOME_NAME: "a"}) == []
+    assert [
+        e.name for e in validate_answers(interactions, {"first": "a", SOME_NAME: "b"})
+    ] == [SOME_NAME]
+
+
+def test_validate_answers__value_if_not_asked_used_by_later_question():
+    interactions: list[Interaction] = [
+        BasicQuestion(
+            "first",
+            SOME_STRING,
+            SOME_STRING,
+            should_ask=lambda _: False,
+            value_if_not_asked=SOME_NON_DEFAULT_OPTION,
+        ),
+        Choice(
+            SOME_NAME,
+            SOME_STRING,
+            lambda answers: [str(answers["first"])],
+            SOME_NON_DEFAULT_OPTION,
+        ),
+    ]
+
+    assert validate_answers(interactions, {}) == []
+
+
+def test_validate_answers__invalid_value_if_not_asked__error():
+    interactions: list[Interaction] = [
+        Choice(
+            SOME_NAME,
+            SOME_STRING,
+            SOME_OPTIONS,
+            SOME_DEFAULT,
+            should_ask=lambda _: False,
+            value_if_not_asked=SOME_INVALID_OPTION,
+        )
+    ]
+
+    errors = validate_answers(interactions, {})
+
+    assert [error.name for error in errors] == [SOME_NAME]
+    assert errors[0].error.startswith("NotAsked value is not valid")
+
+
+def test_validate_answers__dynamic_default_not_valid__error():
+    interactions: list[Interaction] = [
+        BasicQuestion(SOME_NAME, SOME_STRING, lambda _: 1),  # type: ignore[arg-type,return-value]
+        Confirm("confirm", SOME_STRING),
+    ]
+
+    errors = validate_answers(interactions, {"confirm": SOME_STRING})
+
+    assert [error.name for error in errors] == [SOME_NAME, "confirm"]
+    assert errors[0].error == "Invalid dynamic value: 1"
+
+
+def test_validate_answers__unsupported_interaction__exception():
+    with pytest.raises(ValueError, match="Unsupported interaction type"):
+        validate_answers([SampleDisplayable(SOME_STRING)], {})
+
+
+@pytest.mark.parametrize("interactions", DUPLICATE_QUESTION_NAME_PARAMS)
+def test_validate_answers__duplicate_names__exception(interactions):
+    with pytest.raises(DuplicateQuestionNameException):
+        validate_answers(interactions, {})
+
+
+def test_validate_answers_jsonl__lines__errors_for_each_line():
+    lines = [
+        json.dumps({"choice": SOME_NON_DEFAULT_OPTION}),
+        "",
+        json.dumps({"choice": SOME_INVALID_OPTION}),
+        "not json",
+        json.dumps([SOME_STRING]),
+    ]
+
+    result = list(validate_answers_jsonl(SOME_INTERACTIONS, lines))
+
+    assert [(number, [e.name for e in errors]) for number, errors in result] == [
+        (1, []),
+        (3, ["choice"]),
+        (4, [None]),
+        (5, [None]),
+    ]
+    assert result[2][1][0].error.startswith("Invalid JSON")
+    assert result[3][1][0].error == "Answers must be a JSON object"
+
+
+def test_validate_answers_jsonl__line_consumed__next_line_not_yet_read():
+    def lines() -> Iterator[str]:
+        yield json.dumps({})
+        raise AssertionError("The next line should not be read")
+
+    assert next(validate_answers_jsonl(SOME_INTERACTIONS, lines())) == (1, [])
+
+
+def test_validate_answers_jsonl__duplicate_names__exception_before_iterating():
+    with pytest.raises(DuplicateQuestionNameException):
+        validate_answers_jsonl([Confirm(SOME_NAME, SOME_STRING)] * 2, [])